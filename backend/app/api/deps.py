@@ -1,24 +1,72 @@
-from fastapi import Header, HTTPException, status
-from app.core.supabase import supabase
+from typing import Optional
+
+import jwt
+from fastapi import Depends, Header, HTTPException, Query, Request, Response, status
+from app.core.cache import TTLCache
+from app.core.config import (
+    AUTH_JWT_VERIFICATION,
+    USER_CACHE_TTL_SECONDS,
+    USER_CACHE_MAX_ENTRIES,
+)
+from app.core.http_cache import prepare_conditional
+from app.core.security import verify_supabase_jwt
+from app.core.supabase import get_async_client
 from supabase_auth.errors import AuthApiError
-from supabase import Client
+from supabase import AsyncClient
 
 import logging
 
 logger = logging.getLogger(__name__)
 
+# nu_users rows keyed by email (the identity both auth modes give us)
+user_cache = TTLCache(maxsize=USER_CACHE_MAX_ENTRIES, ttl=USER_CACHE_TTL_SECONDS)
 
-def get_current_user(authorization: str = Header(...)):
-    if not authorization.startswith("Bearer "):
+
+def get_db() -> AsyncClient:
+    """Pooled async Supabase client created in the app lifespan."""
+    return get_async_client()
+
+
+def invalidate_user(email: Optional[str] = None, user_id: Optional[int] = None):
+    """
+    Drop a cached nu_users profile, e.g. after its role or name changed.
+    Call with no arguments to flush the whole cache.
+    """
+    if email is None and user_id is None:
+        user_cache.clear()
+        return
+
+    if email is not None:
+        user_cache.pop(email)
+
+    if user_id is not None:
+        user_cache.pop_where(lambda _, u: u.get("id") == user_id)
+
+
+def _email_from_local_jwt(token: str) -> str:
+    try:
+        claims = verify_supabase_jwt(token)
+    except jwt.PyJWTError as e:
+        logger.warning(f"JWT verification failed: {e}")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid authorization header",
+            detail="Invalid or expired token",
         )
 
-    token = authorization.replace("Bearer ", "")
+    email = claims.get("email")
 
+    if not email:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token payload",
+        )
+
+    return email
+
+
+async def _email_from_supabase_auth(db: AsyncClient, token: str) -> str:
     try:
-        auth_user = supabase.auth.get_user(token)
+        auth_user = await db.auth.get_user(token)
     except AuthApiError as e:
         logger.warning(f"JWT verification failed: {e}")
         raise HTTPException(
@@ -32,11 +80,23 @@ def get_current_user(authorization: str = Header(...)):
             detail="Invalid token payload",
         )
 
-    email = auth_user.user.email
+    return auth_user.user.email
+
+
+async def user_from_token(token: str, db: AsyncClient) -> dict:
+    """Verify an access token and return the caller's nu_users row."""
+    if AUTH_JWT_VERIFICATION == "local":
+        email = _email_from_local_jwt(token)
+    else:
+        email = await _email_from_supabase_auth(db, token)
+
+    cached = user_cache.get(email)
+    if cached is not None:
+        return cached
 
     try:
-        response = (
-            supabase
+        response = await (
+            db
             .table("nu_users")
             .select("*")
             .eq("email", email)
@@ -56,4 +116,67 @@ def get_current_user(authorization: str = Header(...)):
             detail="User not registered as admin",
         )
 
+    user_cache.set(email, response.data)
+
     return response.data
+
+
+def _bearer_token(authorization: str) -> str:
+    if not authorization.startswith("Bearer "):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid authorization header",
+        )
+
+    return authorization.replace("Bearer ", "")
+
+
+async def get_current_user(
+    authorization: str = Header(...),
+    db: AsyncClient = Depends(get_db),
+):
+    return await user_from_token(_bearer_token(authorization), db)
+
+
+async def get_stream_user(
+    authorization: Optional[str] = Header(None),
+    access_token: Optional[str] = Query(None),
+    db: AsyncClient = Depends(get_db),
+):
+    """
+    get_current_user for long-lived streams. Browsers' EventSource can't
+    set headers, so the same token may come as ?access_token= instead.
+    """
+    if authorization:
+        token = _bearer_token(authorization)
+    elif access_token:
+        token = access_token
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Missing access token",
+        )
+
+    return await user_from_token(token, db)
+
+
+def conditional_get(
+    resource: Optional[str],
+    cache_control: str = "private, no-cache",
+    authenticated: bool = True,
+):
+    """
+    Route dependency for cacheable GETs: sets Cache-Control and answers
+    304 when If-None-Match still matches the current `resource` version.
+    Pass resource=None for data that no API write bumps (see
+    http_cache.prepare_conditional).
+    Authenticated routes check the token before any 304 is sent.
+    """
+    if authenticated:
+        async def check(request: Request, response: Response, user=Depends(get_current_user)):
+            prepare_conditional(request, response, resource, cache_control)
+    else:
+        async def check(request: Request, response: Response):
+            prepare_conditional(request, response, resource, cache_control)
+
+    return Depends(check)
@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from app.api.routes import health, me, events, places, locations, users
+from app.api.routes import health, me, events, places, locations, users, checkins, analytics, certificates, exports, dashboard
 
 api_router = APIRouter()
 
@@ -9,3 +9,8 @@ api_router.include_router(events.router, tags=["Events"])
 api_router.include_router(places.router, tags=["Places"])
 api_router.include_router(locations.router, tags=["Locations"])
 api_router.include_router(users.router, tags=["Users"])
+api_router.include_router(checkins.router, tags=["Check-ins"])
+api_router.include_router(analytics.router, tags=["Analytics"])
+api_router.include_router(certificates.router, tags=["Certificates"])
+api_router.include_router(exports.router, tags=["Exports"])
+api_router.include_router(dashboard.router, tags=["Dashboard"])
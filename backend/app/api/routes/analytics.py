@@ -0,0 +1,73 @@
+from datetime import date
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Query
+from app.api.deps import conditional_get, get_current_user, get_db
+from app.services import analytics
+from supabase import AsyncClient
+
+router = APIRouter(
+    prefix="/analytics",
+    tags=["Analytics"],
+    # Rollups move with every check-in batch, written by whichever worker
+    # took the scans, so there is no version to trust: always recompute and
+    # let the content-hash ETag decide 304s. A short private cache is enough.
+    dependencies=[conditional_get(None, "private, max-age=30")],
+)
+
+
+# ======================================================
+# ATTENDANCE BY DAY
+# ======================================================
+@router.get("/attendance-by-day")
+async def attendance_by_day(
+    event_id: Optional[int] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    user=Depends(get_current_user),
+    db: AsyncClient = Depends(get_db),
+):
+    return await analytics.attendance_by_day(db, event_id, date_from, date_to)
+
+
+# ======================================================
+# SESSION POPULARITY
+# ======================================================
+@router.get("/session-popularity")
+async def session_popularity(
+    event_id: Optional[int] = None,
+    limit: int = Query(10, ge=1, le=100),
+    user=Depends(get_current_user),
+    db: AsyncClient = Depends(get_db),
+):
+    return await analytics.session_popularity(db, event_id, limit)
+
+
+# ======================================================
+# ATTENDANCE VS CAPACITY
+# ======================================================
+@router.get("/event-capacity")
+async def event_capacity(
+    event_id: Optional[List[int]] = Query(None),
+    limit: int = Query(10, ge=1, le=100),
+    user=Depends(get_current_user),
+    db: AsyncClient = Depends(get_db),
+):
+    """
+    Pass one or more `event_id`; without any, the `limit` latest
+    non-archived events are reported.
+    """
+    event_ids = event_id or await analytics.recent_event_ids(db, limit)
+    return await analytics.event_capacity(db, event_ids)
+
+
+# ======================================================
+# SPEAKER REACH
+# ======================================================
+@router.get("/speaker-reach")
+async def speaker_reach(
+    limit: int = Query(10, ge=1, le=100),
+    user=Depends(get_current_user),
+    db: AsyncClient = Depends(get_db),
+):
+    return await analytics.speaker_reach(db, limit)
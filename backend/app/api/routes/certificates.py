@@ -0,0 +1,40 @@
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+from app.api.deps import get_current_user, get_db
+from app.services import certificates
+from supabase import AsyncClient
+
+router = APIRouter(prefix="/certificates", tags=["Certificates"])
+
+
+# ======================================================
+# SESSION CERTIFICATES (ZIP)
+# ======================================================
+@router.get("/sessions/{session_id}")
+async def session_certificates(
+    session_id: int,
+    dry_run: bool = False,
+    user=Depends(get_current_user),
+    db: AsyncClient = Depends(get_db),
+):
+    """
+    One PDF per attendee of the session, rendered in the certificate
+    process pool and streamed as a ZIP while rendering continues.
+    dry_run=true renders everything, discards it and returns throughput.
+    """
+    context = await certificates.session_context(db, session_id)
+
+    if context is None:
+        raise HTTPException(status_code=404, detail="Session not found")
+
+    if dry_run:
+        return await certificates.dry_run(db, context)
+
+    return StreamingResponse(
+        certificates.session_archive(db, context),
+        media_type="application/zip",
+        headers={
+            "Content-Disposition": f'attachment; filename="certificates-session-{session_id}.zip"',
+            "Cache-Control": "no-store",
+        },
+    )
@@ -0,0 +1,56 @@
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from app.api.deps import get_current_user, get_db
+from app.api.schemas.checkins import CheckinCreate
+from app.services.checkins import CheckinQueueFull, checkin_writer, session_event_id
+from supabase import AsyncClient
+
+router = APIRouter(prefix="/checkins", tags=["Check-ins"])
+
+
+# ======================================================
+# CHECK IN (QR / MANUAL)
+# ======================================================
+@router.post("", status_code=status.HTTP_202_ACCEPTED)
+async def check_in(
+    payload: CheckinCreate,
+    response: Response,
+    user=Depends(get_current_user),
+    db: AsyncClient = Depends(get_db),
+):
+    """
+    Acknowledged from memory and written to nu_event_attendees in the
+    next micro-batch. Repeat scans of the same (session, user) return
+    "duplicate" without touching the database.
+    """
+    event_id = await session_event_id(db, payload.session_id)
+
+    if event_id is None:
+        raise HTTPException(status_code=404, detail="Session not found")
+
+    try:
+        accepted = checkin_writer.accept(
+            payload.session_id, event_id, payload.user_id, payload.method
+        )
+    except CheckinQueueFull:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Check-in queue is full, retry shortly",
+            headers={"Retry-After": "1"},
+        )
+
+    if not accepted:
+        response.status_code = status.HTTP_200_OK
+
+    return {
+        "session_id": payload.session_id,
+        "user_id": payload.user_id,
+        "status": "accepted" if accepted else "duplicate",
+    }
+
+
+# ======================================================
+# WRITER STATS
+# ======================================================
+@router.get("/stats")
+async def checkin_stats(user=Depends(get_current_user)):
+    return checkin_writer.stats()
@@ -0,0 +1,24 @@
+from fastapi import APIRouter, Depends, Response
+from app.api.deps import get_current_user, get_db
+from app.core.config import DASHBOARD_TTL_SECONDS
+from app.services import dashboard
+from supabase import AsyncClient
+
+router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
+
+
+# ======================================================
+# SUMMARY (ALL WIDGETS)
+# ======================================================
+@router.get("/summary")
+async def dashboard_summary(
+    response: Response,
+    user=Depends(get_current_user),
+    db: AsyncClient = Depends(get_db),
+):
+    """
+    KPIs, attendance for the last 7 days, events by status, upcoming
+    sessions and recent activity, computed concurrently in one pass.
+    """
+    response.headers["Cache-Control"] = f"private, max-age={DASHBOARD_TTL_SECONDS}"
+    return await dashboard.dashboard_summary(db)
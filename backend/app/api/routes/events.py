@@ -1,81 +1,146 @@
 #backend/app/api/routes/events.py
-from fastapi import APIRouter, Depends, HTTPException
-from app.api.deps import get_current_user
-from app.api.schemas.events import EventCreate
-from app.core.supabase import supabase
+from datetime import date, timedelta
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from app.api.deps import conditional_get, get_current_user, get_db
+from app.api.schemas.events import (
+    EventBulkStatus,
+    EventCreate,
+    EventOut,
+    EventPage,
+    EventStatus,
+)
+from app.core import http_cache
+from app.core.batching import chunked
+from app.core.pagination import decode_cursor, encode_cursor, keyset_after
+from app.services.event_details import (
+    event_detail_cache,
+    invalidate_event_details,
+    load_event_details,
+)
+from app.services.event_import import (
+    NEW_EVENT_EXCLUDE,
+    csv_events,
+    import_events,
+    json_events,
+)
+from app.services.schedule import schedule_index
+from app.services.sessions import plan_sessions, reconcile_sessions, session_row
+from app.services.event_summaries import (
+    SUMMARY_COLUMNS,
+    save_event_summary,
+    set_summary_status,
+)
+from supabase import AsyncClient
 
 router = APIRouter(prefix="/events", tags=["Events"])
 
 
+def _reject_conflicts(conflicts: List[dict]) -> None:
+    raise HTTPException(
+        status_code=409,
+        detail={
+            "message": "Room or speaker is already booked at that time",
+            "conflicts": conflicts,
+        },
+    )
+
+
 # ======================================================
 # CREATE EVENT + SESSIONS
 # ======================================================
 @router.post("")
-def create_event(
+async def create_event(
     payload: EventCreate,
+    allow_conflicts: bool = False,
     user=Depends(get_current_user),
+    db: AsyncClient = Depends(get_db),
 ):
-    # 1️⃣ Create event
-    event_res = (
-        supabase
-        .table("nu_events")
-        .insert({
-            "event_name": payload.event_name,
-            "event_description": payload.event_description,
-            "start_datetime": payload.start_datetime.isoformat(),
-            "end_datetime": payload.end_datetime.isoformat(),
-            "status": payload.status or "draft",
-            "event_host_user_id": int(user["id"]),
-        })
-        .execute()
-    )
+    """
+    Sessions that double-book a room or speaker are rejected with 409;
+    allow_conflicts=true saves anyway and returns the overlaps as warnings.
+    """
+    async with schedule_index.booking():
+        # 1️⃣ Check room/speaker overlaps (saved sessions and within the payload)
+        await schedule_index.ensure(db)
+        conflicts = schedule_index.conflicts(
+            [session_row(s, None) for s in payload.sessions or []]
+        )
 
-    if not event_res.data:
-        raise HTTPException(status_code=400, detail="Failed to create event")
-
-    event_id = event_res.data[0]["id"]
-
-    # 2️⃣ Create sessions
-    if payload.sessions:
-        session_rows = []
-
-        for s in payload.sessions:
-            session_rows.append({
-                "session_event_id": event_id,
-                "session_topic": s.session_topic,
-                "session_speaker_id": s.session_speaker_id,
-                "session_date": s.session_date.isoformat(),
-                "session_start_time": s.session_start_time.isoformat(),
-                "session_end_time": s.session_end_time.isoformat(),
-                "session_building_id": s.session_building_id,
-                "session_floor_id": s.session_floor_id,
-                "session_room_id": s.session_room_id,
-            })
+        if conflicts and not allow_conflicts:
+            _reject_conflicts(conflicts)
 
-        session_res = (
-            supabase
-            .table("nu_event_sessions")
-            .insert(session_rows)
-            .execute()
-        )
+        # 2️⃣ Event, sessions and summary row are written in one transaction
+        res = await db.rpc("create_event_with_sessions", {
+            "p_event": payload.model_dump(mode="json", exclude=NEW_EVENT_EXCLUDE),
+            "p_host_user_id": int(user["id"]),
+        }).execute()
+
+        if not res.data:
+            raise HTTPException(status_code=400, detail="Failed to create event")
+
+        schedule_index.replace_event(res.data["id"], res.data.get("sessions") or [])
+
+    http_cache.bump("events")
+
+    response = {"id": res.data["id"]}
+    if conflicts:
+        response["conflicts"] = conflicts
+
+    return response
+
+
+# ======================================================
+# BULK IMPORT (JSON ARRAY OR CSV)
+# ======================================================
+@router.post("/bulk")
+async def bulk_import_events(
+    request: Request,
+    allow_conflicts: bool = False,
+    user=Depends(get_current_user),
+    db: AsyncClient = Depends(get_db),
+):
+    """
+    Create many events at once. Send a JSON array of EventCreate objects,
+    or text/csv with one row per session (see app/services/event_import.py).
+    Every event commits atomically with its sessions; results are per row.
+    Rows that double-book a room or speaker fail unless allow_conflicts=true.
+    """
+    content_type = request.headers.get("content-type", "")
+
+    if content_type.startswith("text/csv"):
+        items = csv_events(request.stream())
+    else:
+        try:
+            body = await request.json()
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Body must be a JSON array or CSV")
+
+        if not isinstance(body, list):
+            raise HTTPException(status_code=400, detail="Body must be a JSON array or CSV")
+
+        items = json_events(body)
 
-        if not session_res.data:
-            raise HTTPException(
-                status_code=400,
-                detail="Failed to create event sessions"
-            )
+    result = await import_events(db, items, int(user["id"]), allow_conflicts=allow_conflicts)
+
+    if result["created"]:
+        http_cache.bump("events")
+
+    return result
 
-    return {"id": event_id}
 
 @router.put("/{event_id}")
-def update_event(
+async def update_event(
     event_id: int,
     payload: EventCreate,
+    allow_conflicts: bool = False,
     user=Depends(get_current_user),
+    db: AsyncClient = Depends(get_db),
 ):
     # 1️⃣ Ensure event exists and is not archived
-    event_res = (
-        supabase
+    event_res = await (
+        db
         .table("nu_events")
         .select("id, status")
         .eq("id", event_id)
@@ -92,159 +157,282 @@ def update_event(
             detail="Archived events cannot be edited"
         )
 
-    # 2️⃣ Update event fields
-    update_res = (
-        supabase
-        .table("nu_events")
-        .update({
-            "event_name": payload.event_name,
-            "event_description": payload.event_description,
-            "start_datetime": payload.start_datetime.isoformat(),
-            "end_datetime": payload.end_datetime.isoformat(),
-        })
-        .eq("id", event_id)
-        .execute()
-    )
+    async with schedule_index.booking():
+        # 2️⃣ Check room/speaker overlaps; the event's current sessions don't count
+        await schedule_index.ensure(db)
+        conflicts = schedule_index.conflicts(
+            [session_row(s, event_id) for s in payload.sessions or []],
+            event_id=event_id,
+        )
 
-    if not update_res.data:
-        raise HTTPException(status_code=400, detail="Failed to update event")
-
-    # 3️⃣ Delete old sessions (simple + safe)
-    supabase.table("nu_event_sessions").delete().eq(
-        "session_event_id", event_id
-    ).execute()
-
-    # 4️⃣ Re-create sessions (same logic as create)
-    if payload.sessions:
-        session_rows = []
-
-        for s in payload.sessions:
-            session_rows.append({
-                "session_event_id": event_id,
-                "session_topic": s.session_topic,
-                "session_speaker_id": s.session_speaker_id,
-                "session_date": s.session_date.isoformat(),
-                "session_start_time": s.session_start_time.isoformat(),
-                "session_end_time": s.session_end_time.isoformat(),
-                "session_building_id": s.session_building_id,
-                "session_floor_id": s.session_floor_id,
-                "session_room_id": s.session_room_id,
+        if conflicts and not allow_conflicts:
+            _reject_conflicts(conflicts)
+
+        # 3️⃣ Validate session ids before writing anything
+        plan = await plan_sessions(db, event_id, payload.sessions or [])
+
+        # 4️⃣ Update event fields
+        update_res = await (
+            db
+            .table("nu_events")
+            .update({
+                "event_name": payload.event_name,
+                "event_description": payload.event_description,
+                "start_datetime": payload.start_datetime.isoformat(),
+                "end_datetime": payload.end_datetime.isoformat(),
             })
+            .eq("id", event_id)
+            .execute()
+        )
+
+        if not update_res.data:
+            raise HTTPException(status_code=400, detail="Failed to update event")
 
-        supabase.table("nu_event_sessions").insert(session_rows).execute()
+        # 5️⃣ Reconcile sessions by id (insert new, update changed, delete removed)
+        sessions, session_counts = await reconcile_sessions(db, plan)
+        schedule_index.replace_event(event_id, sessions)
 
-    return {"id": event_id}
+    # 6️⃣ Keep the list projection in sync
+    await save_event_summary(db, update_res.data[0], sessions)
+    invalidate_event_details([event_id])
+    http_cache.bump("events")
+
+    response = {
+        "id": event_id,
+        "sessions": session_counts,
+    }
+    if conflicts:
+        response["conflicts"] = conflicts
+
+    return response
+
+
+# ======================================================
+# CHECK CONFLICTS (NO SAVE)
+# ======================================================
+@router.post("/conflicts")
+async def check_conflicts(
+    payload: EventCreate,
+    event_id: Optional[int] = None,
+    user=Depends(get_current_user),
+    db: AsyncClient = Depends(get_db),
+):
+    """
+    Room/speaker overlaps the payload would create, for warning before
+    saving. Pass event_id when editing so the event's own sessions are skipped.
+    """
+    await schedule_index.ensure(db)
+
+    return {
+        "conflicts": schedule_index.conflicts(
+            [session_row(s, event_id) for s in payload.sessions or []],
+            event_id=event_id,
+        )
+    }
 
 
 # ======================================================
 # LIST EVENTS
 # ======================================================
-@router.get("")
-def list_events(
+@router.get("", response_model=EventPage, dependencies=[conditional_get("events")])
+async def list_events(
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    status: Optional[EventStatus] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    building_id: Optional[int] = None,
     user=Depends(get_current_user),
+    db: AsyncClient = Depends(get_db),
 ):
-    res = (
-        supabase
-        .table("nu_events")
-        .select("""
-            id,
-            event_name,
-            event_description,
-            start_datetime,
-            end_datetime,
-            nu_event_sessions (
-                id,
-                nu_rooms (
-                    nu_floors (
-                        nu_buildings (
-                            building_name
-                        )
-                    )
-                )
-            ),
-            status,
-            created_at
-        """)
-        .neq("status", "archived")
+    """
+    Keyset-paginated on (created_at, id), newest first.
+    Pass the returned next_cursor back as `cursor` for the next page.
+    """
+    # Reads only the per-event projection; no session/room/floor/building joins
+    query = db.table("nu_event_summaries").select(SUMMARY_COLUMNS)
+
+    if status:
+        query = query.eq("status", status)
+    else:
+        query = query.neq("status", "archived")
+
+    if date_from:
+        query = query.gte("start_datetime", date_from.isoformat())
+
+    if date_to:
+        query = query.lt("start_datetime", (date_to + timedelta(days=1)).isoformat())
+
+    if building_id is not None:
+        query = query.contains("building_ids", [building_id])
+
+    after = decode_cursor(cursor)
+    if after:
+        try:
+            after_id = int(after["id"])
+            after_created_at = str(after["created_at"]).replace('"', "")
+        except (KeyError, TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+        query = query.or_(
+            keyset_after("created_at", after_created_at, "event_id", after_id)
+        )
+
+    res = await (
+        query
         .order("created_at", desc=True)
+        .order("event_id", desc=True)
+        .limit(limit + 1)
         .execute()
     )
 
-    events = []
-
-    for e in res.data or []:
-        sessions = e.get("nu_event_sessions") or []
-
-        # session count
-        sessions_count = len(sessions)
-
-        # extract first available building name
-        venue = None
-        for s in sessions:
-            try:
-                venue = (
-                    s["nu_rooms"]
-                    ["nu_floors"]
-                    ["nu_buildings"]
-                    ["building_name"]
-                )
-                if venue:
-                    break
-            except (TypeError, KeyError):
-                continue
-
-        events.append({
-            "id": e["id"],
+    rows = res.data or []
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    events = [
+        {
+            "id": e["event_id"],
             "event_name": e["event_name"],
             "event_description": e["event_description"],
             "start_datetime": e["start_datetime"],
             "end_datetime": e["end_datetime"],
             "status": e["status"],
-            "sessions_count": sessions_count,
-            "venue": venue,
-        })
+            "sessions_count": e["sessions_count"],
+            "venue": e["venue"],
+            "first_session_date": e["first_session_date"],
+            "last_session_date": e["last_session_date"],
+            "speaker_count": e["speaker_count"],
+            "created_at": e["created_at"],
+        }
+        for e in rows
+    ]
+
+    next_cursor = None
+    if has_more and rows:
+        last = rows[-1]
+        next_cursor = encode_cursor(created_at=last["created_at"], id=last["event_id"])
 
-    return events
+    return {
+        "items": events,
+        "next_cursor": next_cursor,
+    }
 
 # ======================================================
-# PUBLISH EVENT
+# STATUS TRANSITIONS
 # ======================================================
-@router.patch("/{event_id}/publish")
-def publish_event(
-    event_id: int,
-    user=Depends(get_current_user),
-):
-    # 1️⃣ Get event
-    event = (
-        supabase
+# Event ids per conditional UPDATE, keeping the in.() filter URL short
+STATUS_UPDATE_CHUNK_SIZE = 500
+
+
+async def _set_status(db: AsyncClient, event_ids: List[int], status: str) -> List[int]:
+    """
+    Move non-archived events to `status` with one conditional UPDATE per
+    chunk, so a concurrent archive can't be overwritten. Returns the ids
+    that were actually updated.
+    """
+    updated: List[int] = []
+
+    for chunk in chunked(dict.fromkeys(event_ids), STATUS_UPDATE_CHUNK_SIZE):
+        res = await (
+            db
+            .table("nu_events")
+            .update({"status": status})
+            .in_("id", chunk)
+            .neq("status", "archived")
+            .execute()
+        )
+        updated.extend(e["id"] for e in res.data or [])
+
+    if updated:
+        await set_summary_status(db, updated, status)
+        invalidate_event_details(updated)
+        if status == "archived":
+            # Archived events no longer hold their rooms or speakers
+            schedule_index.remove_events(updated)
+        http_cache.bump("events")
+
+    return updated
+
+
+async def _event_exists(db: AsyncClient, event_id: int) -> bool:
+    res = await (
+        db
         .table("nu_events")
-        .select("id, status")
+        .select("id")
         .eq("id", event_id)
-        .single()
+        .limit(1)
         .execute()
     )
+    return bool(res.data)
 
-    if not event.data:
-        raise HTTPException(status_code=404, detail="Event not found")
 
-    if event.data["status"] == "archived":
+# ======================================================
+# PUBLISH EVENTS (BULK)
+# ======================================================
+@router.patch("/publish")
+async def publish_events(
+    payload: EventBulkStatus,
+    user=Depends(get_current_user),
+    db: AsyncClient = Depends(get_db),
+):
+    if not payload.event_ids:
+        raise HTTPException(status_code=400, detail="No event_ids given")
+
+    updated = await _set_status(db, payload.event_ids, "published")
+    skipped = set(payload.event_ids) - set(updated)
+
+    return {
+        "status": "published",
+        "updated": updated,
+        # Archived or nonexistent
+        "skipped": sorted(skipped),
+    }
+
+
+# ======================================================
+# ARCHIVE EVENTS (BULK)
+# ======================================================
+@router.patch("/archive")
+async def archive_events(
+    payload: EventBulkStatus,
+    user=Depends(get_current_user),
+    db: AsyncClient = Depends(get_db),
+):
+    if not payload.event_ids:
+        raise HTTPException(status_code=400, detail="No event_ids given")
+
+    updated = await _set_status(db, payload.event_ids, "archived")
+    skipped = set(payload.event_ids) - set(updated)
+
+    return {
+        "status": "archived",
+        "updated": updated,
+        # Already archived or nonexistent
+        "skipped": sorted(skipped),
+    }
+
+
+# ======================================================
+# PUBLISH EVENT
+# ======================================================
+@router.patch("/{event_id}/publish")
+async def publish_event(
+    event_id: int,
+    user=Depends(get_current_user),
+    db: AsyncClient = Depends(get_db),
+):
+    # 1️⃣ Publish unless archived (single conditional update)
+    if not await _set_status(db, [event_id], "published"):
+        # 2️⃣ Nothing matched: tell "missing" from "archived"
+        if not await _event_exists(db, event_id):
+            raise HTTPException(status_code=404, detail="Event not found")
+
         raise HTTPException(
             status_code=400,
             detail="Archived events cannot be published"
         )
 
-    # 2️⃣ Update status → published
-    res = (
-        supabase
-        .table("nu_events")
-        .update({"status": "published"})
-        .eq("id", event_id)
-        .execute()
-    )
-
-    if not res.data:
-        raise HTTPException(status_code=400, detail="Failed to publish event")
-
     return {
         "id": event_id,
         "status": "published",
@@ -255,45 +443,22 @@ def publish_event(
 # ARCHIVE EVENT (SOFT DELETE)
 # ==========================================================
 @router.patch("/{event_id}/archive")
-def archive_event(
+async def archive_event(
     event_id: int,
     user=Depends(get_current_user),
+    db: AsyncClient = Depends(get_db),
 ):
-    # 1️⃣ Check if event exists
-    event_res = (
-        supabase
-        .table("nu_events")
-        .select("id, status")
-        .eq("id", event_id)
-        .single()
-        .execute()
-    )
-
-    if not event_res.data:
-        raise HTTPException(status_code=404, detail="Event not found")
+    # 1️⃣ Archive unless already archived (single conditional update)
+    if not await _set_status(db, [event_id], "archived"):
+        # 2️⃣ Nothing matched: tell "missing" from "already archived"
+        if not await _event_exists(db, event_id):
+            raise HTTPException(status_code=404, detail="Event not found")
 
-    # 2️⃣ Prevent double-archiving
-    if event_res.data["status"] == "archived":
         raise HTTPException(
             status_code=400,
             detail="Event is already archived"
         )
 
-    # 3️⃣ Archive event
-    update_res = (
-        supabase
-        .table("nu_events")
-        .update({"status": "archived"})
-        .eq("id", event_id)
-        .execute()
-    )
-
-    if not update_res.data:
-        raise HTTPException(
-            status_code=500,
-            detail="Failed to archive event"
-        )
-
     return {
         "id": event_id,
         "status": "archived"
@@ -303,125 +468,25 @@ def archive_event(
 # ======================================================
 # VIEW EVENT DETAILS
 # ======================================================
-# ======================================================
-# VIEW EVENT DETAILS
-# ======================================================
-@router.get("/{event_id}")
-def view_event_details(
+@router.get(
+    "/{event_id}",
+    response_model=EventOut,
+    dependencies=[conditional_get("events")],
+)
+async def view_event_details(
     event_id: int,
     user=Depends(get_current_user),
+    db: AsyncClient = Depends(get_db),
 ):
-    # 1️⃣ Get event (exclude archived)
-    event_res = (
-        supabase
-        .table("nu_events")
-        .select("""
-            id,
-            event_name,
-            event_description,
-            start_datetime,
-            end_datetime,
-            status
-        """)
-        .eq("id", event_id)
-        .neq("status", "archived")
-        .single()
-        .execute()
-    )
-
-    if not event_res.data:
-        raise HTTPException(status_code=404, detail="Event not found")
-
-    event = event_res.data
-
-    # 2️⃣ Get sessions (NO user join here)
-    sessions_res = (
-        supabase
-        .table("nu_event_sessions")
-        .select("""
-            id,
-            session_topic,
-            session_date,
-            session_start_time,
-            session_end_time,
-            session_speaker_id,
-            nu_rooms (
-                room_no,
-                nu_floors (
-                    floor_name,
-                    nu_buildings (
-                        building_name
-                    )
-                )
-            )
-        """)
-        .eq("session_event_id", event_id)
-        .order("session_date")
-        .execute()
-    )
-
-    # 3️⃣ Collect speaker IDs
-    speaker_ids = {
-        s["session_speaker_id"]
-        for s in sessions_res.data or []
-        if s.get("session_speaker_id")
-    }
+    cached = event_detail_cache.get(event_id)
+    if cached is not None:
+        return cached
 
-    speakers_map = {}
+    details = await load_event_details(db, event_id)
 
-    if speaker_ids:
-        speakers_res = (
-            supabase
-            .table("nu_users")
-            .select("id, firstname, lastname, email")
-            .in_("id", list(speaker_ids))
-            .execute()
-        )
-
-        speakers_map = {
-            u["id"]: {
-                "id": u["id"],
-                "name": f'{u.get("firstname", "")} {u.get("lastname", "")}'.strip(),
-                "email": u.get("email"),
-            }
-            for u in speakers_res.data or []
-        }
-
-    # 4️⃣ Format sessions
-    formatted_sessions = []
+    if details is None:
+        raise HTTPException(status_code=404, detail="Event not found")
 
-    for s in sessions_res.data or []:
-        venue = None
-        try:
-            venue = {
-                "building": s["nu_rooms"]["nu_floors"]["nu_buildings"]["building_name"],
-                "floor": s["nu_rooms"]["nu_floors"]["floor_name"],
-                "room": s["nu_rooms"]["room_no"],
-            }
-        except (TypeError, KeyError):
-            pass
-
-        speaker = None
-        speaker_id = s.get("session_speaker_id")
-        if speaker_id:
-            speaker = speakers_map.get(speaker_id)
-
-        formatted_sessions.append({
-            "id": s["id"],
-            "topic": s["session_topic"],
-            "date": s["session_date"],
-            "start_time": s["session_start_time"],
-            "end_time": s["session_end_time"],
-            "speaker": speaker,
-            "venue": venue,
-        })
+    event_detail_cache.set(event_id, details)
 
-    return {
-        "id": event["id"],
-        "event_name": event["event_name"],
-        "event_description": event["event_description"],
-        "start_datetime": event["start_datetime"],
-        "end_datetime": event["end_datetime"],
-        "status": event["status"],
-        "sessions": formatted_sessions,
-    }
+    return details
@@ -0,0 +1,91 @@
+from typing import AsyncIterator, Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+from app.api.deps import get_current_user, get_db
+from app.api.schemas.events import EventStatus
+from app.services import exports
+from supabase import AsyncClient
+
+router = APIRouter(prefix="/exports", tags=["Exports"])
+
+ExportFormat = Literal["csv", "xlsx"]
+
+
+def _download(body: AsyncIterator[bytes], fmt: str, name: str) -> StreamingResponse:
+    # Rows are read page by page while the body is being sent
+    return StreamingResponse(
+        body,
+        media_type=exports.MEDIA_TYPES[fmt],
+        headers={
+            "Content-Disposition": f'attachment; filename="{name}.{fmt}"',
+            "Cache-Control": "no-store",
+        },
+    )
+
+
+# ======================================================
+# ATTENDANCE (EVENT OR SESSION)
+# ======================================================
+@router.get("/attendance")
+async def export_attendance(
+    event_id: Optional[int] = None,
+    session_id: Optional[int] = None,
+    format: ExportFormat = "csv",
+    user=Depends(get_current_user),
+    db: AsyncClient = Depends(get_db),
+):
+    if (event_id is None) == (session_id is None):
+        raise HTTPException(status_code=400, detail="Pass exactly one of event_id or session_id")
+
+    sessions = await exports.attendance_sessions(db, event_id, session_id)
+
+    if session_id is not None and not sessions:
+        raise HTTPException(status_code=404, detail="Session not found")
+
+    rows = exports.attendance_rows(db, sessions, event_id, session_id)
+    name = f"attendance-session-{session_id}" if session_id is not None else f"attendance-event-{event_id}"
+
+    return _download(
+        exports.encode(format, exports.ATTENDANCE_COLUMNS, rows, "Attendance"),
+        format,
+        name,
+    )
+
+
+# ======================================================
+# EVENTS WITH SESSIONS
+# ======================================================
+@router.get("/events")
+async def export_events(
+    status: Optional[EventStatus] = None,
+    format: ExportFormat = "csv",
+    user=Depends(get_current_user),
+    db: AsyncClient = Depends(get_db),
+):
+    rows = exports.event_rows(db, status)
+
+    return _download(
+        exports.encode(format, exports.EVENT_COLUMNS, rows, "Events"),
+        format,
+        f"events-{status}" if status else "events",
+    )
+
+
+# ======================================================
+# NOTIFICATION DELIVERY
+# ======================================================
+@router.get("/notifications/{notif_id}/delivery")
+async def export_notification_delivery(
+    notif_id: int,
+    format: ExportFormat = "csv",
+    user=Depends(get_current_user),
+    db: AsyncClient = Depends(get_db),
+):
+    rows = exports.delivery_rows(db, notif_id)
+
+    return _download(
+        exports.encode(format, exports.DELIVERY_COLUMNS, rows, "Delivery"),
+        format,
+        f"notification-{notif_id}-delivery",
+    )
@@ -1,4 +1,6 @@
 from fastapi import APIRouter
+from app.core.pubsub import hub
+from app.services import dashboard
 
 router = APIRouter()
 
@@ -6,5 +8,9 @@ router = APIRouter()
 def health_check():
     return {
         "status": "ok",
-        "service": "NU Phil Backend"
+        "service": "NU Phil Backend",
+        # Live notification streams on this worker
+        "push": hub.stats(),
+        # Dashboard summary cache: hits, computations, coalesced waiters
+        "dashboard": dashboard.stats(),
     }
@@ -1,51 +1,161 @@
-from fastapi import APIRouter
-from app.core.supabase import supabase
+from datetime import date, time
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from app.api.deps import get_current_user, get_db
+from app.core import http_cache
+from app.services.locations import location_cache
+from app.services.schedule import (
+    OCCUPANCY_SLOT_MINUTES,
+    SLOTS_PER_DAY,
+    schedule_index,
+)
+from supabase import AsyncClient
 
 router = APIRouter(prefix="/locations", tags=["Locations"])
 
+# Cascade endpoints and the tree are all answered from location_cache
+
+
+@router.get("/tree")
+async def get_location_tree(
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncClient = Depends(get_db),
+):
+    """
+    Whole building -> floor -> room -> place hierarchy in one document.
+    Send the returned ETag as If-None-Match to get a 304 when unchanged.
+    """
+    snapshot = await location_cache.get(db)
+
+    headers = {"ETag": snapshot.etag, "Cache-Control": "no-cache"}
+
+    # Weak comparison: CompressionMiddleware sends the tag back as W/"..."
+    if http_cache.etag_matches(if_none_match, snapshot.etag):
+        return Response(status_code=304, headers=headers)
+
+    response.headers.update(headers)
+
+    return {
+        "version": snapshot.version,
+        "buildings": snapshot.tree,
+    }
+
+
+@router.post("/tree/refresh")
+async def refresh_location_tree(
+    user=Depends(get_current_user),
+    db: AsyncClient = Depends(get_db),
+):
+    snapshot = await location_cache.get(db, force=True)
+    return {"version": snapshot.version}
+
+
 @router.get("/buildings")
-def list_buildings():
-    return (
-        supabase
-        .table("nu_buildings")
-        .select("id, building_name")
-        .order("building_name")
-        .execute()
-        .data
-    )
+async def list_buildings(db: AsyncClient = Depends(get_db)):
+    snapshot = await location_cache.get(db)
+    return snapshot.buildings
 
 @router.get("/buildings/{building_id}/floors")
-def list_floors(building_id: int):
-    return (
-        supabase
-        .table("nu_floors")
-        .select("id, floor_name")
-        .eq("building_id", building_id)
-        .order("floor_name")
-        .execute()
-        .data
-    )
+async def list_floors(building_id: int, db: AsyncClient = Depends(get_db)):
+    snapshot = await location_cache.get(db)
+    return snapshot.floors_by_building.get(building_id, [])
 
 @router.get("/floors/{floor_id}/rooms")
-def list_rooms(floor_id: int):
-    return (
-        supabase
-        .table("nu_rooms")
-        .select("id, room_no")
-        .eq("floor_id", floor_id)
-        .order("room_no")
-        .execute()
-        .data
-    )
+async def list_rooms(floor_id: int, db: AsyncClient = Depends(get_db)):
+    snapshot = await location_cache.get(db)
+    return snapshot.rooms_by_floor.get(floor_id, [])
 
 @router.get("/rooms/{room_id}/places")
-def list_places(room_id: int):
-    return (
-        supabase
-        .table("nu_places")
-        .select("id, place_name")
-        .eq("room_id", room_id)
-        .order("place_name")
-        .execute()
-        .data
-    )
+async def list_places(room_id: int, db: AsyncClient = Depends(get_db)):
+    snapshot = await location_cache.get(db)
+    return snapshot.places_by_room.get(room_id, [])
+
+
+# ======================================================
+# ROOM AVAILABILITY
+# ======================================================
+def _seconds(t: time) -> int:
+    return t.hour * 3600 + t.minute * 60 + t.second
+
+
+@router.get("/availability")
+async def room_availability(
+    start: time = Query(...),
+    end: time = Query(...),
+    day: date = Query(..., alias="date"),
+    building_id: Optional[int] = None,
+    min_capacity: Optional[int] = Query(None, ge=1),
+    user=Depends(get_current_user),
+    db: AsyncClient = Depends(get_db),
+):
+    """
+    Rooms with no session between start and end on the date, answered from
+    the per-room occupancy bitmaps. Times are rounded out to whole
+    15-minute slots, so a room is only reported free if it is free for
+    every slot the window touches.
+    """
+    if end <= start:
+        raise HTTPException(status_code=400, detail="end must be after start")
+
+    snapshot = await location_cache.get(db)
+    await schedule_index.ensure(db)
+
+    rooms = [
+        r for r in snapshot.rooms
+        if (building_id is None or r["building_id"] == building_id)
+        and (min_capacity is None or (r["capacity"] or 0) >= min_capacity)
+    ]
+
+    free = set(schedule_index.free_rooms(
+        day.isoformat(), _seconds(start), _seconds(end), (r["id"] for r in rooms)
+    ))
+
+    return {
+        "date": day,
+        "start": start,
+        "end": end,
+        "slot_minutes": OCCUPANCY_SLOT_MINUTES,
+        "checked": len(rooms),
+        "rooms": [r for r in rooms if r["id"] in free],
+    }
+
+
+@router.get("/buildings/{building_id}/day-grid")
+async def building_day_grid(
+    building_id: int,
+    day: date = Query(..., alias="date"),
+    user=Depends(get_current_user),
+    db: AsyncClient = Depends(get_db),
+):
+    """
+    Occupancy of every room in a building for one day. `occupancy` has
+    one character per 15-minute slot from 00:00 ("1" = booked).
+    """
+    snapshot = await location_cache.get(db)
+
+    if not any(b["id"] == building_id for b in snapshot.buildings):
+        raise HTTPException(status_code=404, detail="Building not found")
+
+    await schedule_index.ensure(db)
+
+    rooms = []
+    for r in snapshot.rooms:
+        if r["building_id"] != building_id:
+            continue
+
+        mask, bookings = schedule_index.room_day(day.isoformat(), r["id"])
+        rooms.append({
+            **r,
+            # Bit 0 is the first slot, so reverse the binary string
+            "occupancy": format(mask, f"0{SLOTS_PER_DAY}b")[::-1],
+            "sessions": [b.describe() for b in bookings],
+        })
+
+    return {
+        "building_id": building_id,
+        "date": day,
+        "slot_minutes": OCCUPANCY_SLOT_MINUTES,
+        "rooms": rooms,
+    }
@@ -1,5 +1,16 @@
-from fastapi import APIRouter, Depends
-from app.api.deps import get_current_user
+import asyncio
+from typing import AsyncIterator, Optional
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from app.api.deps import get_current_user, get_db, get_stream_user
+from app.api.schemas.notifications import InboxPage, InboxRead
+from app.core.config import PUSH_HEARTBEAT_SECONDS
+from app.core.pagination import decode_cursor, encode_cursor
+from app.core.pubsub import OVERFLOW, hub
+from app.services import inbox
+from supabase import AsyncClient
 
 router = APIRouter()
 
@@ -12,3 +23,122 @@ def read_me(user=Depends(get_current_user)):
         "role": user["role"],
         "firstname": user["firstname"],
     }
+
+
+# ======================================================
+# NOTIFICATION INBOX
+# ======================================================
+@router.get("/me/notifications", response_model=InboxPage)
+async def list_my_notifications(
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    unread_only: bool = False,
+    user=Depends(get_current_user),
+    db: AsyncClient = Depends(get_db),
+):
+    """
+    Notifications delivered to the current user, newest first.
+    Pass the returned next_cursor back as `cursor` for the next page.
+    """
+    after = decode_cursor(cursor)
+    after_id = None
+    if after:
+        try:
+            after_id = int(after["id"])
+        except (KeyError, TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    rows = await inbox.list_inbox(db, user["id"], limit, after_id, unread_only)
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    return {
+        "items": [inbox.inbox_item(r) for r in rows],
+        "next_cursor": encode_cursor(id=rows[-1]["id"]) if has_more and rows else None,
+    }
+
+
+@router.get("/me/notifications/unread-count")
+async def my_unread_count(
+    user=Depends(get_current_user),
+    db: AsyncClient = Depends(get_db),
+):
+    return {"unread": await inbox.unread_counter.get(db, user["id"])}
+
+
+@router.post("/me/notifications/read")
+async def mark_my_notifications_read(
+    payload: InboxRead,
+    user=Depends(get_current_user),
+    db: AsyncClient = Depends(get_db),
+):
+    if payload.all:
+        updated = await inbox.mark_read(db, user["id"])
+    elif payload.notification_ids:
+        updated = await inbox.mark_read(db, user["id"], payload.notification_ids)
+    else:
+        raise HTTPException(status_code=400, detail="Give notification_ids or all=true")
+
+    return {
+        "updated": updated,
+        "unread": await inbox.unread_counter.get(db, user["id"]),
+    }
+
+
+# ======================================================
+# NOTIFICATION STREAM (SERVER-SENT EVENTS)
+# ======================================================
+def _sse(event: str, data) -> bytes:
+    return b"event: " + event.encode() + b"\ndata: " + orjson.dumps(data) + b"\n\n"
+
+
+async def _event_stream(db: AsyncClient, user_id: int) -> AsyncIterator[bytes]:
+    # Subscribed inside the generator so the finally below always pairs with it,
+    # and before the unread snapshot so nothing published in between is lost
+    sub = hub.subscribe(user_id)
+    try:
+        unread = await inbox.unread_counter.get(db, user_id)
+
+        yield b"retry: 5000\n\n"
+        yield _sse("unread", {"unread": unread})
+
+        while True:
+            try:
+                message = await asyncio.wait_for(sub.get(), PUSH_HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                # Comment line: keeps proxies from closing an idle stream
+                yield b": ping\n\n"
+                continue
+
+            if message is OVERFLOW:
+                # Fell too far behind; the client reloads its inbox and reconnects
+                yield _sse("resync", {})
+                return
+
+            yield _sse("notification", message)
+    finally:
+        hub.unsubscribe(sub)
+
+
+@router.get("/me/notifications/stream")
+async def stream_my_notifications(
+    user=Depends(get_stream_user),
+    db: AsyncClient = Depends(get_db),
+):
+    """
+    Server-Sent Events: `notification` for each new delivery, `unread` once
+    on connect, `resync` when this connection fell behind, and a comment
+    heartbeat every PUSH_HEARTBEAT_SECONDS. Authenticate with the usual
+    bearer header or ?access_token= (EventSource can't send headers; the
+    token is redacted from access logs).
+    """
+    return StreamingResponse(
+        _event_stream(db, user["id"]),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            # Stop nginx-style proxies from buffering the stream
+            "X-Accel-Buffering": "no",
+        },
+    )
@@ -1,8 +1,25 @@
-from fastapi import APIRouter, Depends, HTTPException
-from datetime import datetime
-from app.api.deps import get_current_user
-from app.api.schemas.notifications import NotificationCreate, NotificationPublish, NotificationUpdate
-from app.core.supabase import supabase
+import asyncio
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from datetime import date, datetime, timedelta
+from app.api.deps import conditional_get, get_current_user, get_db
+from app.api.schemas.notifications import (
+    MessageType,
+    NotificationCreate,
+    NotificationDetail,
+    NotificationPage,
+    NotificationPublish,
+    NotificationUpdate,
+    TargetType,
+)
+from app.core import http_cache
+from app.core.cache import TTLCache
+from app.core.config import NOTIFICATION_COUNT_TTL_SECONDS
+from app.core.pagination import decode_cursor, encode_cursor, keyset_after
+from app.core.jobs import job_runner
+from app.services import notifications as notification_service
+from supabase import AsyncClient
 
 router = APIRouter(prefix="/notifications", tags=["Notifications"])
 
@@ -10,26 +27,176 @@ router = APIRouter(prefix="/notifications", tags=["Notifications"])
 # ======================================================
 # LIST NOTIFICATIONS (ADMIN)
 # ======================================================
-@router.get("")
-def list_notifications(
+LIST_COLUMNS = (
+    "id, title, target_type, message_type, "
+    "is_active, from_admin_user_id, published_at, created_at"
+)
+
+# `content` list modes -> extra column selected
+CONTENT_COLUMNS = {
+    "none": "",
+    # Computed column, see migrations/005_notification_listing.sql
+    "preview": ", content:content_preview",
+    "full": ", content",
+}
+
+# (mode, filters, data version) -> total
+_totals = TTLCache(maxsize=256, ttl=NOTIFICATION_COUNT_TTL_SECONDS)
+
+
+def _filtered(query, filters: dict):
+    if filters["is_active"] is not None:
+        query = query.eq("is_active", filters["is_active"])
+
+    if filters["message_type"]:
+        query = query.eq("message_type", filters["message_type"])
+
+    if filters["target_type"]:
+        query = query.eq("target_type", filters["target_type"])
+
+    if filters["author_id"] is not None:
+        query = query.eq("from_admin_user_id", filters["author_id"])
+
+    if filters["created_from"]:
+        query = query.gte("created_at", filters["created_from"].isoformat())
+
+    if filters["created_to"]:
+        query = query.lt("created_at", (filters["created_to"] + timedelta(days=1)).isoformat())
+
+    return query
+
+
+async def _total(db: AsyncClient, filters: dict, mode: str) -> Optional[int]:
+    key = (mode, tuple(sorted(filters.items())), http_cache.version("notifications"))
+
+    cached = _totals.get(key)
+    if cached is not None:
+        return cached
+
+    res = await _filtered(
+        db.table("nu_notifications").select("id", count=mode),
+        filters,
+    ).limit(1).execute()
+
+    _totals.set(key, res.count)
+    return res.count
+
+
+@router.get(
+    "",
+    response_model=NotificationPage,
+    dependencies=[conditional_get("notifications")],
+)
+async def list_notifications(
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    is_active: Optional[bool] = None,
+    message_type: Optional[MessageType] = None,
+    target_type: Optional[TargetType] = None,
+    created_from: Optional[date] = None,
+    created_to: Optional[date] = None,
+    author_id: Optional[int] = None,
+    content: Literal["none", "preview", "full"] = "preview",
+    total: Optional[Literal["estimated", "exact"]] = None,
     user=Depends(get_current_user),
+    db: AsyncClient = Depends(get_db),
 ):
     """
-    Admin: list all notifications (draft + published)
+    Admin: list notifications (draft + published), newest first.
+    Keyset-paginated on (created_at, id); pass next_cursor back as `cursor`.
+    `content` picks the body projection (preview = first 200 characters).
+    `total` adds a pager count: "estimated" uses the planner's estimate,
+    "exact" counts; both are cached until the next notification write.
     """
-    res = (
-        supabase
-        .table("nu_notifications")
-        .select(
-            "id, title, content, target_type, message_type, "
-            "is_active, published_at, created_at"
+    filters = {
+        "is_active": is_active,
+        "message_type": message_type,
+        "target_type": target_type,
+        "author_id": author_id,
+        "created_from": created_from,
+        "created_to": created_to,
+    }
+
+    query = _filtered(
+        db.table("nu_notifications").select(LIST_COLUMNS + CONTENT_COLUMNS[content]),
+        filters,
+    )
+
+    after = decode_cursor(cursor)
+    if after:
+        try:
+            after_id = int(after["id"])
+            after_created_at = str(after["created_at"]).replace('"', "")
+        except (KeyError, TypeError, ValueError):
+            raise HTTPException(400, "Invalid cursor")
+
+        query = query.or_(
+            keyset_after("created_at", after_created_at, "id", after_id)
         )
 
+    page_query = (
+        query
         .order("created_at", desc=True)
+        .order("id", desc=True)
+        .limit(limit + 1)
+        .execute()
+    )
+
+    if total:
+        res, count = await asyncio.gather(page_query, _total(db, filters, total))
+    else:
+        res, count = await page_query, None
+
+    rows = res.data or []
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    next_cursor = None
+    if has_more and rows:
+        last = rows[-1]
+        next_cursor = encode_cursor(created_at=last["created_at"], id=last["id"])
+
+    return {
+        "items": rows,
+        "next_cursor": next_cursor,
+        "total": count,
+    }
+
+
+# ======================================================
+# GET ONE NOTIFICATION (FULL CONTENT)
+# ======================================================
+@router.get(
+    "/{notification_id}",
+    response_model=NotificationDetail,
+    dependencies=[conditional_get("notifications")],
+)
+async def get_notification(
+    notification_id: int,
+    user=Depends(get_current_user),
+    db: AsyncClient = Depends(get_db),
+):
+    res = await (
+        db
+        .table("nu_notifications")
+        .select(
+            LIST_COLUMNS + CONTENT_COLUMNS["full"]
+            + ", nu_notification_targets (target_id)"
+        )
+        .eq("id", notification_id)
+        .maybe_single()
         .execute()
     )
 
-    return res.data or []
+    if not res or not res.data:
+        raise HTTPException(404, "Notification not found")
+
+    notif = res.data
+    notif["target_ids"] = sorted(
+        t["target_id"] for t in notif.pop("nu_notification_targets", None) or []
+    )
+
+    return notif
 
 
 # ======================================================
@@ -37,9 +204,10 @@ def list_notifications(
 # ======================================================
 
 @router.post("")
-def create_notification_draft(
+async def create_notification_draft(
     payload: NotificationCreate,
     user=Depends(get_current_user),
+    db: AsyncClient = Depends(get_db),
 ):
     if payload.target_type == "all":
         if payload.event_ids or payload.session_ids or payload.target_user_ids:
@@ -57,67 +225,43 @@ def create_notification_draft(
         if not payload.target_user_ids or payload.event_ids or payload.session_ids:
             raise HTTPException(400, "Invalid target fields for 'user'")
 
-    rows = []
-    now = datetime.utcnow().isoformat()
+    ids = notification_service.target_ids(
+        payload.target_type,
+        payload.event_ids,
+        payload.session_ids,
+        payload.target_user_ids,
+    )
 
-    if payload.target_type == "all":
-        rows.append({
-            "from_admin_user_id": user["id"],
-            "title": payload.title,
-            "content": payload.content,
-            "target_type": "all",
-            "message_type": payload.message_type,
-            "is_active": False,
-            "created_at": now,
-        })
+    # 1️⃣ One notification row, whatever the number of targets
+    res = await db.table("nu_notifications").insert({
+        "from_admin_user_id": user["id"],
+        "title": payload.title,
+        "content": payload.content,
+        "target_type": payload.target_type,
+        "message_type": payload.message_type,
+        "is_active": False,
+        "created_at": datetime.utcnow().isoformat(),
+    }).execute()
 
-    elif payload.target_type == "event":
-        for event_id in payload.event_ids:
-            rows.append({
-                "from_admin_user_id": user["id"],
-                "title": payload.title,
-                "content": payload.content,
-                "target_type": "event",
-                "event_id": event_id,
-                "message_type": payload.message_type,
-                "is_active": False,
-                "created_at": now,
-            })
+    if not res.data:
+        raise HTTPException(400, "Failed to create notification draft")
 
-    elif payload.target_type == "session":
-        for session_id in payload.session_ids:
-            rows.append({
-                "from_admin_user_id": user["id"],
-                "title": payload.title,
-                "content": payload.content,
-                "target_type": "session",
-                "session_id": session_id,
-                "message_type": payload.message_type,
-                "is_active": False,
-                "created_at": now,
-            })
+    notif_id = res.data[0]["id"]
 
-    elif payload.target_type == "user":
-        for target_user_id in payload.target_user_ids:
-            rows.append({
-                "from_admin_user_id": user["id"],
-                "title": payload.title,
-                "content": payload.content,
-                "target_type": "user",
-                "target_user_id": target_user_id,
-                "message_type": payload.message_type,
-                "is_active": False,
-                "created_at": now,
-            })
-
-    res = supabase.table("nu_notifications").insert(rows).execute()
+    # 2️⃣ Its targets in one bulk insert
+    try:
+        await notification_service.save_targets(db, notif_id, ids)
+    except Exception:
+        # Don't leave a draft without its audience behind
+        await db.table("nu_notifications").delete().eq("id", notif_id).execute()
+        raise
 
-    if not res.data:
-        raise HTTPException(400, "Failed to create notification drafts")
+    http_cache.bump("notifications")
 
     return {
-        "created_count": len(res.data),
-        "notification_ids": [n["id"] for n in res.data],
+        "created_count": 1,
+        "notification_ids": [notif_id],
+        "target_count": len(ids),
     }
 
 
@@ -125,107 +269,55 @@ def create_notification_draft(
 # PUBLISH NOTIFICATIONS (FAN-OUT)
 # ======================================================
 @router.post("/publish")
-def publish_notifications(
+async def publish_notifications(
     payload: NotificationPublish,
+    response: Response,
     user=Depends(get_current_user),
+    db: AsyncClient = Depends(get_db),
 ):
-    published = []
-    skipped = []
-    failed = []
-
-    now = datetime.utcnow().isoformat()
-
-    for notif_id in payload.notification_ids:
-        notif_res = (
-            supabase
-            .table("nu_notifications")
-            .select("*")
-            .eq("id", notif_id)
-            .single()
-            .execute()
+    """
+    Publish drafts in one batched pass: one load, one recipient query per
+    target type, chunked status inserts and a single bulk update.
+    With background=true the fan-out is queued and a job id is returned.
+    """
+    if payload.background:
+        job = await job_runner.submit(
+            notification_service.PUBLISH_JOB,
+            {"notification_ids": payload.notification_ids},
         )
+        response.status_code = status.HTTP_202_ACCEPTED
+        return {"job_id": job["id"], "status": job["status"]}
+
+    result = await notification_service.publish_notifications(
+        db, payload.notification_ids
+    )
+    http_cache.bump("notifications")
+
+    return result
+
+
+# ======================================================
+# PUBLISH JOB PROGRESS
+# ======================================================
+@router.get("/jobs/{job_id}")
+async def get_publish_job(
+    job_id: str,
+    user=Depends(get_current_user),
+):
+    job = await job_runner.get(job_id)
 
-        if not notif_res.data:
-            failed.append(notif_id)
-            continue
-
-        notif = notif_res.data
-
-        if notif["is_active"]:
-            skipped.append(notif_id)
-            continue
-
-
-        # --------------------------------------------------
-        # Determine recipients
-        # --------------------------------------------------
-        recipient_ids = set()
-
-        if notif["target_type"] == "all":
-            attendees = (
-                supabase
-                .table("nu_event_attendees")
-                .select("user_id")
-                .execute()
-            )
-            recipient_ids = {r["user_id"] for r in attendees.data or []}
-
-        elif notif["target_type"] == "event":
-            attendees = (
-                supabase
-                .table("nu_event_attendees")
-                .select("user_id")
-                .eq("event_id", notif["event_id"])
-                .execute()
-            )
-            recipient_ids = {r["user_id"] for r in attendees.data or []}
-
-        elif notif["target_type"] == "session":
-            attendees = (
-                supabase
-                .table("nu_event_attendees")
-                .select("user_id")
-                .eq("session_id", notif["session_id"])
-                .execute()
-            )
-            recipient_ids = {r["user_id"] for r in attendees.data or []}
-
-        elif notif["target_type"] == "user":
-            recipient_ids = {notif["target_user_id"]}
-
-        # --------------------------------------------------
-        # Fan-out insert
-        # --------------------------------------------------
-        rows = [
-            {
-                "notif_id": notif_id,
-                "user_id_receiver": uid,
-            }
-            for uid in recipient_ids
-        ]
-
-        if rows:
-            supabase.table("nu_notification_status") \
-                .insert(rows, upsert=False) \
-                .execute()
-
-        # --------------------------------------------------
-        # Mark as published
-        # --------------------------------------------------
-        supabase.table("nu_notifications") \
-            .update({
-                "is_active": True,
-                "published_at": now,
-            }) \
-            .eq("id", notif_id) \
-            .execute()
-
-        published.append(notif_id)
+    if not job:
+        raise HTTPException(404, "Job not found")
 
     return {
-        "published": published,
-        "skipped": skipped,
-        "failed": failed,
+        "id": job["id"],
+        "kind": job["kind"],
+        "status": job["status"],
+        "progress": job["progress"],
+        "result": job["result"],
+        "error": job["error"],
+        "created_at": job["created_at"],
+        "updated_at": job["updated_at"],
     }
 
 
@@ -233,13 +325,14 @@ def publish_notifications(
 # UPDATE NOTIFICATION (DRAFT ONLY)
 # ======================================================
 @router.put("/{notification_id}")
-def update_notification_draft(
+async def update_notification_draft(
     notification_id: int,
     payload: NotificationCreate,
     user=Depends(get_current_user),
+    db: AsyncClient = Depends(get_db),
 ):
-    notif_res = (
-        supabase
+    notif_res = await (
+        db
         .table("nu_notifications")
         .select("*")
         .eq("id", notification_id)
@@ -277,26 +370,24 @@ def update_notification_draft(
         if not target_user_ids or event_ids or session_ids:
             raise HTTPException(400, "Invalid target fields for 'user'")
 
-    update_data = {
-    "title": payload.title,
-    "content": payload.content,
-    "message_type": payload.message_type,
-    "target_type": payload.target_type,
-}
-
-    if payload.target_type == "event":
-        update_data["event_id"] = event_ids[0]
-
-    elif payload.target_type == "session":
-        update_data["session_id"] = session_ids[0]
-
-    elif payload.target_type == "user":
-        update_data["target_user_id"] = target_user_ids[0]
+    # Fields and the whole target set in one transaction
+    # (migrations/014_notification_draft_update.sql)
+    res = await db.rpc("update_notification_draft", {
+        "p_notif_id": notification_id,
+        "p_notif": {
+            "title": payload.title,
+            "content": payload.content,
+            "message_type": payload.message_type,
+            "target_type": payload.target_type,
+        },
+        "p_target_ids": notification_service.target_ids(
+            payload.target_type, event_ids, session_ids, target_user_ids
+        ),
+    }).execute()
 
+    if not res.data:
+        raise HTTPException(400, "Published notifications cannot be edited")
 
-    supabase.table("nu_notifications") \
-        .update(update_data) \
-        .eq("id", notification_id) \
-        .execute()
+    http_cache.bump("notifications")
 
     return {"status": "updated"}
@@ -1,14 +1,15 @@
 # backend/app/api/routes/places.py
 
-from fastapi import APIRouter
-from app.core.supabase import supabase
+from fastapi import APIRouter, Depends
+from app.api.deps import conditional_get, get_db
+from supabase import AsyncClient
 
 router = APIRouter(prefix="/places", tags=["Places"])
 
-@router.get("")
-def list_places():
-    res = (
-        supabase
+@router.get("", dependencies=[conditional_get(None, "public, max-age=300", authenticated=False)])
+async def list_places(db: AsyncClient = Depends(get_db)):
+    res = await (
+        db
         .table("nu_places")               # ✅ correct table
         .select("id, place_name")         # ✅ correct column
         .order("place_name")
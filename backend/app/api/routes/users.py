@@ -1,26 +1,31 @@
 from fastapi import APIRouter, Depends
-from app.api.deps import get_current_user
-from app.core.supabase import supabase
+from app.api.deps import conditional_get, get_current_user, get_db
+from app.services.speakers import speaker_cache
+from supabase import AsyncClient
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
 
-@router.get("/speakers")
-def list_speakers(
+@router.get("/speakers", dependencies=[conditional_get(None, "private, max-age=60")])
+async def list_speakers(
     user=Depends(get_current_user),  # ensures authenticated access
+    db: AsyncClient = Depends(get_db),
 ):
     """
     Returns users eligible to be speakers.
     Business rule: role = 1
     """
 
-    res = (
-        supabase
-        .table("nu_users")
-        .select("id, firstname, middlename, lastname, ext")
-        .eq("role", 1)
-        .order("lastname", desc=False)
-        .execute()
-    )
+    # Same cache event details resolve session speakers from
+    speakers = await speaker_cache.all(db)
 
-    return res.data or []
+    return [
+        {
+            "id": u["id"],
+            "firstname": u["firstname"],
+            "middlename": u["middlename"],
+            "lastname": u["lastname"],
+            "ext": u["ext"],
+        }
+        for u in speakers
+    ]
@@ -0,0 +1,8 @@
+from pydantic import BaseModel
+from typing import Literal
+
+
+class CheckinCreate(BaseModel):
+    session_id: int
+    user_id: int
+    method: Literal["qr", "manual", "auto"] = "qr"
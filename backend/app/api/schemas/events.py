@@ -1,12 +1,16 @@
 # backend/app/api/schemas/events.py
 from pydantic import BaseModel
 from datetime import datetime
-from typing import List, Optional, Literal
+from typing import List, Optional, Literal, Union
 
 
 from datetime import date, time
 
+EventStatus = Literal["draft", "upcoming", "ongoing", "published", "archived"]
+
 class SessionCreate(BaseModel):
+    # Set when editing an existing session; omitted for new ones
+    id: Optional[int] = None
     session_topic: Optional[str]
     session_speaker_id: Optional[int]
     session_date: date
@@ -28,16 +32,64 @@ class EventCreate(BaseModel):
 
 
 
+class EventBulkStatus(BaseModel):
+    event_ids: List[int]
+
+
 class SessionOut(SessionCreate):
     id: int
 
 
+# ======================================================
+# RESPONSES
+# ======================================================
+class EventListItem(BaseModel):
+    id: int
+    event_name: str
+    event_description: Optional[str] = None
+    start_datetime: datetime
+    end_datetime: datetime
+    status: str
+    sessions_count: int = 0
+    venue: Optional[str] = None
+    first_session_date: Optional[date] = None
+    last_session_date: Optional[date] = None
+    speaker_count: int = 0
+    created_at: datetime
+
+
+class EventPage(BaseModel):
+    items: List[EventListItem]
+    next_cursor: Optional[str] = None
+
+
+class SpeakerOut(BaseModel):
+    id: int
+    name: str
+    email: Optional[str] = None
+
+
+class VenueOut(BaseModel):
+    building: Optional[str] = None
+    floor: Optional[str] = None
+    room: Optional[Union[str, int]] = None
+
+
+class SessionDetailOut(BaseModel):
+    id: int
+    topic: Optional[str] = None
+    date: date
+    start_time: time
+    end_time: time
+    speaker: Optional[SpeakerOut] = None
+    venue: Optional[VenueOut] = None
+
+
 class EventOut(BaseModel):
     id: int
     event_name: str
-    event_description: Optional[str]
+    event_description: Optional[str] = None
     start_datetime: datetime
     end_datetime: datetime
-    place_id: Optional[int]
     status: str
-    sessions: List[SessionOut]
+    sessions: List[SessionDetailOut]
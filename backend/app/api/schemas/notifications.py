@@ -1,6 +1,10 @@
 from pydantic import BaseModel
+from datetime import datetime
 from typing import List, Optional, Literal
 
+MessageType = Literal["announcement", "alert", "reminder", "warning"]
+TargetType = Literal["all", "event", "session", "user"]
+
 class NotificationUpdate(BaseModel):
     title: Optional[str] = None
     content: Optional[str] = None
@@ -13,8 +17,8 @@ class NotificationUpdate(BaseModel):
 
 
 class NotificationCreate(BaseModel):
-    message_type: Literal["announcement", "alert", "reminder", "warning"]
-    target_type: Literal["all", "event", "session", "user"]
+    message_type: MessageType
+    target_type: TargetType
 
     title: str
     content: str
@@ -26,3 +30,54 @@ class NotificationCreate(BaseModel):
 
 class NotificationPublish(BaseModel):
     notification_ids: List[int]
+    # Run the fan-out as a background job and return its id immediately
+    background: bool = False
+
+
+class NotificationOut(BaseModel):
+    id: int
+    title: str
+    # Full body, a preview, or omitted depending on the list's `content` mode
+    content: Optional[str] = None
+    target_type: str
+    message_type: str
+    is_active: bool
+    from_admin_user_id: Optional[int] = None
+    published_at: Optional[datetime] = None
+    created_at: datetime
+
+
+class NotificationDetail(NotificationOut):
+    # Event, session or user ids, per target_type
+    target_ids: List[int] = []
+
+
+class NotificationPage(BaseModel):
+    items: List[NotificationOut]
+    next_cursor: Optional[str] = None
+    # Only when requested with ?total=
+    total: Optional[int] = None
+
+
+# ======================================================
+# INBOX (/me/notifications)
+# ======================================================
+class InboxItem(BaseModel):
+    id: int
+    title: str
+    content: Optional[str] = None
+    message_type: str
+    published_at: Optional[datetime] = None
+    is_read: bool
+    read_at: Optional[datetime] = None
+
+
+class InboxPage(BaseModel):
+    items: List[InboxItem]
+    next_cursor: Optional[str] = None
+
+
+class InboxRead(BaseModel):
+    # Omit (or leave empty) together with all=true to mark everything read
+    notification_ids: Optional[List[int]] = None
+    all: bool = False
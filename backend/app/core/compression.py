@@ -0,0 +1,160 @@
+import zlib
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # optional: fall back to gzip only
+    brotli = None
+
+# Already compressed, or must reach the client unbuffered
+SKIP_CONTENT_TYPES = (
+    "text/event-stream",
+    "application/zip",
+    "application/vnd.openxmlformats-officedocument",  # xlsx/docx are ZIPs
+    "application/gzip",
+    "image/",
+)
+
+
+class _Gzip:
+    encoding = "gzip"
+
+    def __init__(self, level: int):
+        self._z = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def process(self, data: bytes) -> bytes:
+        return self._z.compress(data)
+
+    def flush(self) -> bytes:
+        return self._z.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._z.flush()
+
+
+class _Brotli:
+    encoding = "br"
+
+    def __init__(self, quality: int):
+        self._c = brotli.Compressor(quality=quality)
+
+    def process(self, data: bytes) -> bytes:
+        return self._c.process(data)
+
+    def flush(self) -> bytes:
+        return self._c.flush()
+
+    def finish(self) -> bytes:
+        return self._c.finish()
+
+
+class CompressionMiddleware:
+    """
+    Brotli (when the `brotli` package is installed and the client accepts it)
+    or gzip for responses of at least `minimum_size` bytes.
+    Streaming bodies are compressed and flushed chunk by chunk.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    def _pick(self, accept_encoding: str):
+        accepted = {e.split(";")[0].strip() for e in accept_encoding.split(",")}
+
+        if brotli is not None and "br" in accepted:
+            return lambda: _Brotli(self.brotli_quality)
+        if "gzip" in accepted:
+            return lambda: _Gzip(self.gzip_level)
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        make_compressor = self._pick(Headers(scope=scope).get("accept-encoding", ""))
+        if make_compressor is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Optional[Message] = None
+        compressor = None
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, compressor, passthrough
+
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                content_type = headers.get("content-type", "")
+
+                if (
+                    "content-encoding" in headers
+                    or content_type.startswith(SKIP_CONTENT_TYPES)
+                ):
+                    passthrough = True
+                    await send(message)
+                    return
+
+                start = {**message, "headers": list(message["headers"])}
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if compressor is None:
+                # Small single-chunk bodies aren't worth compressing
+                if not more_body and len(body) < self.minimum_size:
+                    passthrough = True
+                    await send(start)
+                    await send(message)
+                    return
+
+                compressor = make_compressor()
+
+                headers = MutableHeaders(raw=start["headers"])
+                headers["Content-Encoding"] = compressor.encoding
+                headers.add_vary_header("Accept-Encoding")
+
+                # The compressed bytes differ, so the validator becomes weak
+                etag = headers.get("etag")
+                if etag and not etag.startswith("W/"):
+                    headers["ETag"] = "W/" + etag
+
+                if more_body:
+                    del headers["Content-Length"]
+                    await send(start)
+                else:
+                    data = compressor.process(body) + compressor.finish()
+                    headers["Content-Length"] = str(len(data))
+                    await send(start)
+                    await send({"type": "http.response.body", "body": data})
+                    return
+
+            # Flush every streamed chunk so the client isn't kept waiting
+            data = compressor.process(body)
+            data += compressor.flush() if more_body else compressor.finish()
+
+            await send({
+                "type": "http.response.body",
+                "body": data,
+                "more_body": more_body,
+            })
+
+        await self.app(scope, receive, send_wrapper)
@@ -7,3 +7,101 @@ PROJECT_NAME = "NU Phil Backend"
 API_V1_STR = "/api/v1"
 
 FRONTEND_ORIGIN = os.getenv("FRONTEND_ORIGIN", "http://localhost:8080")
+
+SUPABASE_URL = os.getenv("SUPABASE_URL")
+
+# ======================================================
+# AUTH
+# ======================================================
+# "remote" asks Supabase Auth to validate every token (one round trip per call).
+# "local" verifies the JWT signature, expiry and audience in-process.
+AUTH_JWT_VERIFICATION = os.getenv("AUTH_JWT_VERIFICATION", "remote")
+
+# HS256 projects sign with the shared JWT secret; asymmetric projects publish a JWKS.
+SUPABASE_JWT_SECRET = os.getenv("SUPABASE_JWT_SECRET")
+SUPABASE_JWT_AUDIENCE = os.getenv("SUPABASE_JWT_AUDIENCE", "authenticated")
+SUPABASE_JWKS_URL = os.getenv(
+    "SUPABASE_JWKS_URL",
+    f"{SUPABASE_URL}/auth/v1/.well-known/jwks.json" if SUPABASE_URL else "",
+)
+SUPABASE_JWKS_CACHE_SECONDS = int(os.getenv("SUPABASE_JWKS_CACHE_SECONDS", "600"))
+
+# nu_users profile cache used by get_current_user
+USER_CACHE_TTL_SECONDS = int(os.getenv("USER_CACHE_TTL_SECONDS", "300"))
+USER_CACHE_MAX_ENTRIES = int(os.getenv("USER_CACHE_MAX_ENTRIES", "1024"))
+
+# ======================================================
+# BACKGROUND JOBS
+# ======================================================
+# "memory" loses queued jobs on restart; "sqlite" resumes them from their checkpoint.
+JOB_STORE = os.getenv("JOB_STORE", "memory")
+JOB_STORE_PATH = os.getenv("JOB_STORE_PATH", "jobs.sqlite3")
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+# A running job is resumed elsewhere if its process stops renewing it this long
+JOB_LEASE_SECONDS = float(os.getenv("JOB_LEASE_SECONDS", "60"))
+
+# ======================================================
+# CACHES
+# ======================================================
+# Building -> floor -> room -> place tree served by /locations
+LOCATION_TREE_TTL_SECONDS = int(os.getenv("LOCATION_TREE_TTL_SECONDS", "3600"))
+
+# role = 1 users shared by /users/speakers and event details
+SPEAKER_CACHE_TTL_SECONDS = int(os.getenv("SPEAKER_CACHE_TTL_SECONDS", "300"))
+
+# Assembled GET /events/{id} documents; event writes drop their entry
+EVENT_DETAIL_TTL_SECONDS = int(os.getenv("EVENT_DETAIL_TTL_SECONDS", "60"))
+EVENT_DETAIL_CACHE_MAX_ENTRIES = int(os.getenv("EVENT_DETAIL_CACHE_MAX_ENTRIES", "512"))
+
+# Per-user unread notification counts. Kept current in-process by fan-out
+# and mark-read, and re-read after the TTL so other workers' writes show up.
+UNREAD_COUNT_TTL_SECONDS = int(os.getenv("UNREAD_COUNT_TTL_SECONDS", "300"))
+UNREAD_COUNT_MAX_USERS = int(os.getenv("UNREAD_COUNT_MAX_USERS", "10000"))
+
+# Pager totals for the admin notification list; writes invalidate sooner
+NOTIFICATION_COUNT_TTL_SECONDS = int(os.getenv("NOTIFICATION_COUNT_TTL_SECONDS", "300"))
+
+# Room/speaker interval index used for double-booking checks; this
+# worker's writes update it at once, other workers' after a reload
+SCHEDULE_INDEX_TTL_SECONDS = int(os.getenv("SCHEDULE_INDEX_TTL_SECONDS", "300"))
+
+# /dashboard/summary; concurrent misses share a single computation
+DASHBOARD_TTL_SECONDS = int(os.getenv("DASHBOARD_TTL_SECONDS", "15"))
+
+# How long a route may answer 304 from a remembered ETag without re-running.
+# This worker's writes invalidate sooner by bumping the resource version;
+# other workers' writes show up once it expires. 0 disables the shortcut.
+HTTP_VALIDATOR_TTL_SECONDS = int(os.getenv("HTTP_VALIDATOR_TTL_SECONDS", "60"))
+
+# ======================================================
+# PUSH (/me/notifications/stream)
+# ======================================================
+# Undelivered messages buffered per connection before it is told to resync
+PUSH_QUEUE_SIZE = int(os.getenv("PUSH_QUEUE_SIZE", "100"))
+PUSH_HEARTBEAT_SECONDS = float(os.getenv("PUSH_HEARTBEAT_SECONDS", "15"))
+
+# ======================================================
+# CHECK-INS (write-behind to nu_event_attendees)
+# ======================================================
+CHECKIN_BATCH_SIZE = int(os.getenv("CHECKIN_BATCH_SIZE", "200"))
+CHECKIN_FLUSH_INTERVAL_SECONDS = float(os.getenv("CHECKIN_FLUSH_INTERVAL_SECONDS", "0.5"))
+# Scans are refused (503) rather than queued past this depth
+CHECKIN_QUEUE_MAX = int(os.getenv("CHECKIN_QUEUE_MAX", "10000"))
+CHECKIN_DEDUP_TTL_SECONDS = int(os.getenv("CHECKIN_DEDUP_TTL_SECONDS", "86400"))
+CHECKIN_DEDUP_MAX_ENTRIES = int(os.getenv("CHECKIN_DEDUP_MAX_ENTRIES", "500000"))
+
+# ======================================================
+# CERTIFICATES
+# ======================================================
+CERTIFICATE_TEMPLATE_PATH = os.getenv(
+    "CERTIFICATE_TEMPLATE_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(__file__)), "templates", "certificate.json"),
+)
+# Render processes; 0 means one per CPU core
+CERTIFICATE_WORKERS = int(os.getenv("CERTIFICATE_WORKERS", "0")) or os.cpu_count() or 1
+
+# ======================================================
+# RESPONSES
+# ======================================================
+# Bodies smaller than this are sent uncompressed
+COMPRESSION_MINIMUM_SIZE = int(os.getenv("COMPRESSION_MINIMUM_SIZE", "1024"))
@@ -0,0 +1,165 @@
+import hashlib
+from collections import defaultdict
+from typing import Dict, Optional
+
+from fastapi import Request, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.cache import TTLCache
+from app.core.config import HTTP_VALIDATOR_TTL_SECONDS
+
+# Per-resource write counters. Every API write to a resource calls bump();
+# a changed version means previously issued ETags can no longer be trusted
+# without re-running the handler. Counters are per process, so writes
+# handled by another worker only show up once the remembered validator
+# expires (HTTP_VALIDATOR_TTL_SECONDS; 0 turns the fast path off).
+_versions: Dict[str, int] = defaultdict(int)
+
+# request key -> (resource version, etag) of the last 200 served
+_validators = TTLCache(maxsize=4096, ttl=HTTP_VALIDATOR_TTL_SECONDS)
+
+STATE_KEY = "conditional_get"
+
+
+def bump(*resources: str) -> None:
+    for resource in resources:
+        _versions[resource] += 1
+
+
+def version(resource: str) -> int:
+    return _versions[resource]
+
+
+def etag_for(body: bytes) -> str:
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+
+    candidates = [c.strip() for c in if_none_match.split(",")]
+    if "*" in candidates:
+        return True
+
+    # Weak comparison, as RFC 9110 requires for If-None-Match
+    return etag.removeprefix("W/") in {c.removeprefix("W/") for c in candidates}
+
+
+class NotModified(Exception):
+    def __init__(self, etag: str, cache_control: str):
+        self.etag = etag
+        self.cache_control = cache_control
+
+
+def not_modified_response(request: Request, exc: NotModified) -> Response:
+    return Response(
+        status_code=304,
+        headers={"ETag": exc.etag, "Cache-Control": exc.cache_control},
+    )
+
+
+def prepare_conditional(
+    request: Request,
+    response: Response,
+    resource: Optional[str],
+    cache_control: str,
+) -> None:
+    """
+    Declare the Cache-Control policy for a GET route and short-circuit
+    with 304 when the client's ETag was issued at the current version.
+    resource=None (data with no write hook in this app) skips the
+    shortcut: the route always runs and only the content-hash ETag
+    decides between 200 and 304.
+    """
+    response.headers["Cache-Control"] = cache_control
+
+    if resource is None:
+        return
+
+    key = f"{resource}|{request.url.path}?{request.url.query}"
+    current = version(resource)
+
+    known = _validators.get(key)
+    if known and known[0] == current and etag_matches(request.headers.get("if-none-match"), known[1]):
+        raise NotModified(known[1], cache_control)
+
+    # Picked up by ETagMiddleware once the body is known
+    request.state.conditional_get = (key, current)
+
+
+class ETagMiddleware:
+    """
+    Adds a strong content-hash ETag to buffered JSON GET responses and
+    answers a matching If-None-Match with 304 Not Modified.
+    Routes that set their own ETag or stream non-JSON bodies pass through.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = None
+        for name, value in scope["headers"]:
+            if name == b"if-none-match":
+                if_none_match = value.decode("latin-1")
+
+        start: Optional[Message] = None
+        chunks = []
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, passthrough
+
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                headers = {k.lower(): v for k, v in message.get("headers", [])}
+                content_type = headers.get(b"content-type", b"")
+
+                if (
+                    message["status"] != 200
+                    or b"etag" in headers
+                    or not content_type.startswith(b"application/json")
+                ):
+                    passthrough = True
+                    await send(message)
+                    return
+
+                start = message
+                return
+
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            body = b"".join(chunks)
+            etag = etag_for(body)
+
+            tracked = scope.get("state", {}).get(STATE_KEY)
+            if tracked:
+                key, current = tracked
+                _validators.set(key, (current, etag))
+
+            headers = [*start.get("headers", []), (b"etag", etag.encode("latin-1"))]
+
+            if etag_matches(if_none_match, etag):
+                keep = (b"etag", b"cache-control", b"vary")
+                await send({
+                    "type": "http.response.start",
+                    "status": 304,
+                    "headers": [(k, v) for k, v in headers if k.lower() in keep],
+                })
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+            await send({**start, "headers": headers})
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,372 @@
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, List, Optional, Set
+
+from app.core.config import JOB_LEASE_SECONDS, JOB_STORE, JOB_STORE_PATH, JOB_WORKERS
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+UNFINISHED = (QUEUED, RUNNING)
+
+
+def _now() -> str:
+    return datetime.utcnow().isoformat()
+
+
+def _claimable(job: dict, now: float) -> bool:
+    if job["status"] == QUEUED:
+        return True
+    # A running job whose owner stopped renewing its lease (crashed or stopped)
+    return job["status"] == RUNNING and (job.get("lease_until") or 0) < now
+
+
+# ======================================================
+# JOB STORES
+# ======================================================
+class JobStore(ABC):
+    """
+    Persists job state. Jobs are plain dicts:
+    id, kind, status, params, checkpoint, progress, result, error,
+    created_at, updated_at, plus owner / lease_until while claimed.
+    Methods are coroutines so stores backed by disk or a network can do
+    their I/O off the event loop.
+    """
+
+    @abstractmethod
+    async def create(self, job: dict) -> None:
+        ...
+
+    @abstractmethod
+    async def get(self, job_id: str) -> Optional[dict]:
+        ...
+
+    @abstractmethod
+    async def update(self, job_id: str, **fields) -> None:
+        ...
+
+    @abstractmethod
+    async def list_unfinished(self) -> List[dict]:
+        ...
+
+    @abstractmethod
+    async def claim(self, job_id: str, owner: str, lease_seconds: float) -> Optional[dict]:
+        """
+        Atomically mark a job running for `owner` and return it, if it is
+        queued or its previous owner's lease ran out; otherwise None.
+        Several processes sharing a store run each job once this way.
+        """
+
+
+class MemoryJobStore(JobStore):
+    def __init__(self):
+        self._jobs: Dict[str, dict] = {}
+
+    async def create(self, job: dict) -> None:
+        self._jobs[job["id"]] = dict(job)
+
+    async def get(self, job_id: str) -> Optional[dict]:
+        job = self._jobs.get(job_id)
+        return dict(job) if job else None
+
+    async def update(self, job_id: str, **fields) -> None:
+        self._jobs[job_id].update(fields, updated_at=_now())
+
+    async def list_unfinished(self) -> List[dict]:
+        return [dict(j) for j in self._jobs.values() if j["status"] in UNFINISHED]
+
+    async def claim(self, job_id: str, owner: str, lease_seconds: float) -> Optional[dict]:
+        job = self._jobs.get(job_id)
+        if job is None or not _claimable(job, time.time()):
+            return None
+        job.update(status=RUNNING, owner=owner, lease_until=time.time() + lease_seconds, updated_at=_now())
+        return dict(job)
+
+
+class SqliteJobStore(JobStore):
+    """
+    Survives restarts, so interrupted jobs resume from their checkpoint.
+    sqlite3 blocks, so every query runs in a worker thread (asyncio.to_thread)
+    and a slow disk never stalls the event loop; the lock serializes them
+    on the shared connection.
+    """
+
+    JSON_FIELDS = ("params", "checkpoint", "progress", "result")
+    COLUMNS = (
+        "id", "kind", "status", "params", "checkpoint", "progress",
+        "result", "error", "created_at", "updated_at",
+    )
+
+    def __init__(self, path: str):
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+
+        with self._lock, self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    params TEXT,
+                    checkpoint TEXT,
+                    progress TEXT,
+                    result TEXT,
+                    error TEXT,
+                    created_at TEXT,
+                    updated_at TEXT,
+                    owner TEXT,
+                    lease_until REAL
+                )
+            """)
+            # Stores created before jobs were claimed with a lease
+            existing = {r["name"] for r in self._conn.execute("PRAGMA table_info(jobs)")}
+            for column, kind in (("owner", "TEXT"), ("lease_until", "REAL")):
+                if column not in existing:
+                    self._conn.execute(f"ALTER TABLE jobs ADD COLUMN {column} {kind}")
+
+    def _encode(self, fields: dict) -> dict:
+        return {
+            k: json.dumps(v) if k in self.JSON_FIELDS else v
+            for k, v in fields.items()
+        }
+
+    def _decode(self, row: sqlite3.Row) -> dict:
+        job = dict(row)
+        for k in self.JSON_FIELDS:
+            job[k] = json.loads(job[k]) if job[k] is not None else None
+        return job
+
+    def _create(self, job: dict) -> None:
+        row = self._encode({c: job.get(c) for c in self.COLUMNS})
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"INSERT INTO jobs ({', '.join(row)}) VALUES ({', '.join('?' * len(row))})",
+                list(row.values()),
+            )
+
+    def _get(self, job_id: str) -> Optional[dict]:
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._decode(row) if row else None
+
+    def _update(self, job_id: str, fields: dict) -> None:
+        fields = self._encode({**fields, "updated_at": _now()})
+        assignments = ", ".join(f"{k} = ?" for k in fields)
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"UPDATE jobs SET {assignments} WHERE id = ?",
+                [*fields.values(), job_id],
+            )
+
+    def _list_unfinished(self) -> List[dict]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM jobs WHERE status IN (?, ?) ORDER BY created_at",
+                UNFINISHED,
+            ).fetchall()
+        return [self._decode(r) for r in rows]
+
+    def _claim(self, job_id: str, owner: str, lease_seconds: float) -> Optional[dict]:
+        now = time.time()
+        with self._lock, self._conn:
+            # One statement, so two processes can't both move the job to running
+            claimed = self._conn.execute(
+                """
+                UPDATE jobs SET status = ?, owner = ?, lease_until = ?, updated_at = ?
+                WHERE id = ?
+                  AND (status = ? OR (status = ? AND COALESCE(lease_until, 0) < ?))
+                """,
+                (RUNNING, owner, now + lease_seconds, _now(), job_id, QUEUED, RUNNING, now),
+            ).rowcount
+        return self._get(job_id) if claimed else None
+
+    async def create(self, job: dict) -> None:
+        await asyncio.to_thread(self._create, job)
+
+    async def get(self, job_id: str) -> Optional[dict]:
+        return await asyncio.to_thread(self._get, job_id)
+
+    async def update(self, job_id: str, **fields) -> None:
+        await asyncio.to_thread(self._update, job_id, fields)
+
+    async def list_unfinished(self) -> List[dict]:
+        return await asyncio.to_thread(self._list_unfinished)
+
+    async def claim(self, job_id: str, owner: str, lease_seconds: float) -> Optional[dict]:
+        return await asyncio.to_thread(self._claim, job_id, owner, lease_seconds)
+
+
+def build_job_store() -> JobStore:
+    if JOB_STORE == "sqlite":
+        return SqliteJobStore(JOB_STORE_PATH)
+    return MemoryJobStore()
+
+
+# ======================================================
+# RUNNER
+# ======================================================
+class JobContext:
+    """Handed to job handlers: their params plus checkpoint/progress saving."""
+
+    def __init__(self, store: JobStore, job: dict):
+        self._store = store
+        self.id = job["id"]
+        self.params = job["params"] or {}
+        self.checkpoint = job["checkpoint"] or {}
+        self.progress = job["progress"] or {}
+
+    async def save(self, checkpoint: Optional[dict] = None, progress: Optional[dict] = None) -> None:
+        fields = {}
+        if checkpoint is not None:
+            self.checkpoint = fields["checkpoint"] = checkpoint
+        if progress is not None:
+            self.progress = fields["progress"] = progress
+        if fields:
+            await self._store.update(self.id, **fields)
+
+
+JobHandler = Callable[[JobContext], Awaitable[Optional[dict]]]
+
+
+class JobRunner:
+    """
+    asyncio worker pool for long-running work started by a request.
+    Handlers are registered by kind; unfinished jobs are picked up
+    again on start() and continue from their last checkpoint.
+
+    Several server processes may share one store: a job runs only after
+    claim() hands it to this process, the claim is a lease renewed while
+    the handler runs, and a periodic sweep re-queues jobs whose owner
+    stopped renewing (crashed, or shut down mid-job).
+    """
+
+    def __init__(self, store: JobStore, workers: int = 2, lease_seconds: float = JOB_LEASE_SECONDS):
+        self.store = store
+        self.workers = workers
+        self.lease_seconds = lease_seconds
+        self.owner = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._handlers: Dict[str, JobHandler] = {}
+        self._queue: "asyncio.Queue[str]" = asyncio.Queue()
+        # Ids queued or running here, so the sweep doesn't queue them twice
+        self._local: Set[str] = set()
+        self._tasks: List[asyncio.Task] = []
+
+    def register(self, kind: str, handler: JobHandler) -> None:
+        self._handlers[kind] = handler
+
+    async def submit(self, kind: str, params: dict) -> dict:
+        if kind not in self._handlers:
+            raise ValueError(f"Unknown job kind: {kind}")
+
+        now = _now()
+        job = {
+            "id": uuid.uuid4().hex,
+            "kind": kind,
+            "status": QUEUED,
+            "params": params,
+            "checkpoint": None,
+            "progress": None,
+            "result": None,
+            "error": None,
+            "created_at": now,
+            "updated_at": now,
+        }
+        await self.store.create(job)
+        self._enqueue(job["id"])
+        return job
+
+    async def get(self, job_id: str) -> Optional[dict]:
+        return await self.store.get(job_id)
+
+    def _enqueue(self, job_id: str) -> None:
+        if job_id not in self._local:
+            self._local.add(job_id)
+            self._queue.put_nowait(job_id)
+
+    async def _queue_claimable(self) -> None:
+        now = time.time()
+        for job in await self.store.list_unfinished():
+            if job["id"] not in self._local and _claimable(job, now):
+                logger.info(f"Resuming job {job['id']} ({job['kind']})")
+                self._enqueue(job["id"])
+
+    async def _sweep(self) -> None:
+        while True:
+            await asyncio.sleep(self.lease_seconds)
+            try:
+                await self._queue_claimable()
+            except Exception:
+                logger.exception("Job sweep failed")
+
+    async def start(self) -> None:
+        await self._queue_claimable()
+
+        self._tasks = [
+            asyncio.create_task(self._worker()) for _ in range(self.workers)
+        ]
+        self._tasks.append(asyncio.create_task(self._sweep()))
+
+    async def stop(self) -> None:
+        # Interrupted jobs give up their lease and resume in whichever
+        # process claims them next
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _worker(self) -> None:
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self._run(job_id)
+            finally:
+                self._local.discard(job_id)
+                self._queue.task_done()
+
+    async def _renew(self, job_id: str) -> None:
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            await self.store.update(job_id, lease_until=time.time() + self.lease_seconds)
+
+    async def _run(self, job_id: str) -> None:
+        # Another process may have claimed it first
+        job = await self.store.claim(job_id, self.owner, self.lease_seconds)
+        if job is None:
+            return
+
+        handler = self._handlers.get(job["kind"])
+        if handler is None:
+            await self.store.update(job_id, status=FAILED, error=f"Unknown job kind: {job['kind']}")
+            return
+
+        renew = asyncio.create_task(self._renew(job_id))
+        try:
+            result = await handler(JobContext(self.store, job))
+        except asyncio.CancelledError:
+            # Shutting down: let the next process resume without waiting out the lease
+            await asyncio.shield(self.store.update(job_id, lease_until=None))
+            raise
+        except Exception as e:
+            logger.exception(f"Job {job_id} failed")
+            await self.store.update(job_id, status=FAILED, error=str(e), lease_until=None)
+            return
+        finally:
+            renew.cancel()
+
+        await self.store.update(job_id, status=SUCCEEDED, result=result, lease_until=None)
+
+
+job_runner = JobRunner(build_job_store(), workers=JOB_WORKERS)
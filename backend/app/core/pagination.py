@@ -0,0 +1,71 @@
+import base64
+import json
+from typing import Any, Dict, List, Optional
+
+from fastapi import HTTPException
+
+
+def encode_cursor(**values: Any) -> str:
+    """Opaque, URL-safe cursor for keyset pagination."""
+    raw = json.dumps(values, separators=(",", ":"), default=str).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[dict]:
+    if not cursor:
+        return None
+
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded))
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    if not isinstance(values, dict):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    return values
+
+
+def keyset_after(column: str, value: Any, id_column: str, id_value: Any, desc: bool = True) -> str:
+    """
+    PostgREST `or` filter selecting rows strictly after (value, id)
+    in (column, id_column) order.
+    """
+    op = "lt" if desc else "gt"
+    return (
+        f'{column}.{op}."{value}",'
+        f'and({column}.eq."{value}",{id_column}.{op}.{id_value})'
+    )
+
+
+async def fetch_all(
+    db,
+    table: str,
+    columns: str,
+    page_size: int = 1000,
+    eq: Optional[Dict[str, Any]] = None,
+) -> List[dict]:
+    """
+    Read a whole (small) table, paging on id so PostgREST's
+    max-rows limit never truncates the result. `columns` must include id.
+    `eq` restricts the rows with column = value filters.
+    """
+    rows: List[dict] = []
+    after = None
+
+    while True:
+        query = db.table(table).select(columns)
+        for column, value in (eq or {}).items():
+            query = query.eq(column, value)
+        if after is not None:
+            query = query.gt("id", after)
+
+        res = await query.order("id").limit(page_size).execute()
+        batch = res.data or []
+        rows.extend(batch)
+
+        if len(batch) < page_size:
+            return rows
+
+        after = batch[-1]["id"]
@@ -0,0 +1,136 @@
+from typing import List, Optional, Sequence, Tuple
+
+# Advance widths (1/1000 em) of Helvetica for ASCII 32-126, from the
+# standard Type 1 metrics. Used to centre and right-align text.
+_HELVETICA_WIDTHS = [
+    278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+    1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+    333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+    556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584,
+]
+
+# Helvetica-Bold runs about 6% wider; close enough for alignment
+_BOLD_FACTOR = 1.06
+
+FONTS = {
+    "regular": ("F1", "Helvetica"),
+    "bold": ("F2", "Helvetica-Bold"),
+}
+
+Color = Tuple[float, float, float]
+
+
+def text_width(text: str, size: float, font: str = "regular") -> float:
+    units = sum(
+        _HELVETICA_WIDTHS[ord(ch) - 32] if 32 <= ord(ch) <= 126 else 556
+        for ch in text
+    )
+    if font == "bold":
+        units *= _BOLD_FACTOR
+    return units * size / 1000
+
+
+def _pdf_string(text: str) -> bytes:
+    # WinAnsi covers Latin-1 names (ñ, é, ...); anything else becomes "?"
+    raw = text.encode("cp1252", errors="replace")
+    return b"(" + raw.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)") + b")"
+
+
+def _color(c: Color) -> str:
+    return " ".join(f"{v:.3f}" for v in c)
+
+
+class Page:
+    """Drawing operations for one page; coordinates in points from bottom-left."""
+
+    def __init__(self, width: float, height: float):
+        self.width = width
+        self.height = height
+        self._ops: List[bytes] = []
+
+    def rect(self, x: float, y: float, w: float, h: float, line_width: float = 1,
+             color: Color = (0, 0, 0)) -> None:
+        self._ops.append(
+            f"q {_color(color)} RG {line_width:.2f} w {x:.2f} {y:.2f} {w:.2f} {h:.2f} re S Q\n".encode()
+        )
+
+    def text(self, text: str, y: float, size: float = 12, font: str = "regular",
+             align: str = "center", x: Optional[float] = None,
+             color: Color = (0, 0, 0)) -> None:
+        width = text_width(text, size, font)
+
+        if align == "center":
+            left = (x if x is not None else self.width / 2) - width / 2
+        elif align == "right":
+            left = (x if x is not None else self.width) - width
+        else:
+            left = x if x is not None else 0
+
+        name, _ = FONTS[font]
+        self._ops.append(
+            f"BT {_color(color)} rg /{name} {size:.2f} Tf {left:.2f} {y:.2f} Td ".encode()
+            + _pdf_string(text)
+            + b" Tj ET\n"
+        )
+
+    def content(self) -> bytes:
+        return b"".join(self._ops)
+
+
+def render(pages: Sequence[Page]) -> bytes:
+    """Serialize pages into a small PDF 1.4 file using the base-14 fonts."""
+    objects: List[bytes] = []
+
+    def add(body: bytes) -> int:
+        objects.append(body)
+        return len(objects)
+
+    catalog = add(b"")  # filled in once the pages object exists
+    pages_id = add(b"")
+    font_ids = {
+        name: add(
+            f"<< /Type /Font /Subtype /Type1 /BaseFont /{base} "
+            f"/Encoding /WinAnsiEncoding >>".encode()
+        )
+        for name, base in FONTS.values()
+    }
+    fonts = " ".join(f"/{name} {oid} 0 R" for name, oid in font_ids.items())
+
+    kids = []
+    for page in pages:
+        content = page.content()
+        stream_id = add(
+            f"<< /Length {len(content)} >>\nstream\n".encode() + content + b"endstream"
+        )
+        kids.append(add(
+            f"<< /Type /Page /Parent {pages_id} 0 R "
+            f"/MediaBox [0 0 {page.width:g} {page.height:g}] "
+            f"/Resources << /Font << {fonts} >> >> "
+            f"/Contents {stream_id} 0 R >>".encode()
+        ))
+
+    objects[catalog - 1] = f"<< /Type /Catalog /Pages {pages_id} 0 R >>".encode()
+    objects[pages_id - 1] = (
+        f"<< /Type /Pages /Kids [{' '.join(f'{k} 0 R' for k in kids)}] "
+        f"/Count {len(kids)} >>".encode()
+    )
+
+    out = bytearray(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+    offsets = []
+    for i, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{i} 0 obj\n".encode() + body + b"\nendobj\n"
+
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    for off in offsets:
+        out += f"{off:010d} 00000 n \n".encode()
+    out += (
+        f"trailer\n<< /Size {len(objects) + 1} /Root {catalog} 0 R >>\n"
+        f"startxref\n{xref}\n%%EOF\n"
+    ).encode()
+
+    return bytes(out)
+
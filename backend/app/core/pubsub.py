@@ -0,0 +1,83 @@
+import asyncio
+from collections import defaultdict
+from typing import Any, Dict, Hashable, Iterable, Set
+
+from app.core.config import PUSH_QUEUE_SIZE
+
+# Queued in place of a message a slow subscriber could not take
+OVERFLOW = object()
+
+
+class Subscription:
+    """
+    One live connection's mailbox. The queue is bounded: when a client
+    falls `maxsize` messages behind, further messages are dropped and the
+    subscription is marked overflowed so the connection can tell the
+    client to resync (e.g. reload its inbox) instead of buffering forever.
+    """
+
+    def __init__(self, key: Hashable, maxsize: int):
+        self.key = key
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.overflowed = False
+
+    def offer(self, message: Any) -> bool:
+        if self.overflowed:
+            return False
+
+        try:
+            self.queue.put_nowait(message)
+            return True
+        except asyncio.QueueFull:
+            self.overflowed = True
+            # Make room for the marker so the reader sees it next
+            self.queue.get_nowait()
+            self.queue.put_nowait(OVERFLOW)
+            return False
+
+    async def get(self) -> Any:
+        return await self.queue.get()
+
+
+class Hub:
+    """
+    In-process pub/sub keyed by recipient (a user id).
+    Publishing never awaits a subscriber, so one slow connection can't
+    hold up a fan-out. Only connections served by this worker are reached.
+    """
+
+    def __init__(self, queue_size: int = PUSH_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._subscribers: Dict[Hashable, Set[Subscription]] = defaultdict(set)
+
+    def subscribe(self, key: Hashable) -> Subscription:
+        sub = Subscription(key, self.queue_size)
+        self._subscribers[key].add(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        subs = self._subscribers.get(sub.key)
+        if subs is None:
+            return
+
+        subs.discard(sub)
+        if not subs:
+            del self._subscribers[sub.key]
+
+    def publish(self, key: Hashable, message: Any) -> int:
+        """Offer `message` to every connection of `key`; returns how many took it."""
+        return sum(sub.offer(message) for sub in list(self._subscribers.get(key, ())))
+
+    def publish_many(self, keys: Iterable[Hashable], message: Any) -> int:
+        if not self._subscribers:
+            return 0
+        return sum(self.publish(key, message) for key in keys)
+
+    def stats(self) -> dict:
+        return {
+            "keys": len(self._subscribers),
+            "connections": sum(len(s) for s in self._subscribers.values()),
+        }
+
+
+hub = Hub()
@@ -1,5 +1,88 @@
+import logging
+import re
+from typing import Optional
+
+import jwt
 from fastapi import HTTPException
 
+from app.core.config import (
+    SUPABASE_JWT_SECRET,
+    SUPABASE_JWT_AUDIENCE,
+    SUPABASE_JWKS_URL,
+    SUPABASE_JWKS_CACHE_SECONDS,
+)
+
+ASYMMETRIC_ALGORITHMS = ["RS256", "ES256"]
+
+_jwks_client: Optional[jwt.PyJWKClient] = None
+
+
+# ?access_token= on the notification stream (EventSource can't send headers)
+_TOKEN_PARAM = re.compile(r"(access_token=)[^&\s]+")
+
+
+def redact_tokens(text: str) -> str:
+    return _TOKEN_PARAM.sub(r"\1[redacted]", text)
+
+
+class RedactTokensFilter(logging.Filter):
+    """Keeps bearer tokens passed in the query string out of access logs."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if isinstance(record.args, tuple):
+            record.args = tuple(
+                redact_tokens(a) if isinstance(a, str) and "access_token=" in a else a
+                for a in record.args
+            )
+        elif isinstance(record.msg, str) and "access_token=" in record.msg:
+            record.msg = redact_tokens(record.msg)
+        return True
+
+
 def require_admin(user):
     if user["role"] != 1:
         raise HTTPException(status_code=403, detail="Admin access required")
+
+
+def _get_jwks_client() -> jwt.PyJWKClient:
+    global _jwks_client
+
+    if _jwks_client is None:
+        if not SUPABASE_JWKS_URL:
+            raise jwt.InvalidTokenError("No JWT secret or JWKS URL configured")
+
+        # PyJWKClient keeps the key set in memory for `lifespan` seconds
+        _jwks_client = jwt.PyJWKClient(
+            SUPABASE_JWKS_URL,
+            cache_jwk_set=True,
+            lifespan=SUPABASE_JWKS_CACHE_SECONDS,
+        )
+
+    return _jwks_client
+
+
+def verify_supabase_jwt(token: str) -> dict:
+    """
+    Verify a Supabase access token without calling Supabase Auth.
+    Checks signature, expiry and audience; raises jwt.InvalidTokenError.
+    """
+    options = {"require": ["exp", "sub"]}
+
+    if SUPABASE_JWT_SECRET:
+        return jwt.decode(
+            token,
+            SUPABASE_JWT_SECRET,
+            algorithms=["HS256"],
+            audience=SUPABASE_JWT_AUDIENCE,
+            options=options,
+        )
+
+    signing_key = _get_jwks_client().get_signing_key_from_jwt(token)
+
+    return jwt.decode(
+        token,
+        signing_key.key,
+        algorithms=ASYMMETRIC_ALGORITHMS,
+        audience=SUPABASE_JWT_AUDIENCE,
+        options=options,
+    )
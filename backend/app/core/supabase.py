@@ -1,6 +1,10 @@
 import os
+from typing import Optional
+
+import httpx
 from dotenv import load_dotenv
-from supabase import create_client, Client
+from supabase import create_client, Client, AsyncClient, acreate_client
+from supabase.lib.client_options import AsyncClientOptions
 
 # Load environment variables
 load_dotenv()
@@ -11,7 +15,60 @@ SUPABASE_SERVICE_ROLE_KEY = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
 if not SUPABASE_URL or not SUPABASE_SERVICE_ROLE_KEY:
     raise RuntimeError("Supabase environment variables are not set")
 
+# Connection pool for the async client (shared by every request)
+HTTP_MAX_CONNECTIONS = int(os.getenv("SUPABASE_HTTP_MAX_CONNECTIONS", "200"))
+HTTP_MAX_KEEPALIVE = int(os.getenv("SUPABASE_HTTP_MAX_KEEPALIVE", "50"))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("SUPABASE_HTTP_KEEPALIVE_EXPIRY", "30"))
+HTTP_TIMEOUT = float(os.getenv("SUPABASE_HTTP_TIMEOUT", "30"))
+HTTP2 = os.getenv("SUPABASE_HTTP2", "true").lower() == "true"
+
+# Synchronous client, kept for scripts and one-off jobs
 supabase: Client = create_client(
     SUPABASE_URL,
     SUPABASE_SERVICE_ROLE_KEY
 )
+
+_async_client: Optional[AsyncClient] = None
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+async def init_async_client() -> AsyncClient:
+    """Create the pooled async client. Called once from the app lifespan."""
+    global _async_client, _http_client
+
+    if _async_client is not None:
+        return _async_client
+
+    _http_client = httpx.AsyncClient(
+        http2=HTTP2,
+        timeout=httpx.Timeout(HTTP_TIMEOUT),
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+        ),
+    )
+
+    _async_client = await acreate_client(
+        SUPABASE_URL,
+        SUPABASE_SERVICE_ROLE_KEY,
+        options=AsyncClientOptions(httpx_client=_http_client),
+    )
+
+    return _async_client
+
+
+async def close_async_client() -> None:
+    global _async_client, _http_client
+
+    if _http_client is not None:
+        await _http_client.aclose()
+
+    _async_client = None
+    _http_client = None
+
+
+def get_async_client() -> AsyncClient:
+    if _async_client is None:
+        raise RuntimeError("Async Supabase client is not initialised")
+    return _async_client
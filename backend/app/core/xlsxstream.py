@@ -0,0 +1,173 @@
+import re
+from datetime import date, datetime
+from typing import Any, Iterable, List, Sequence
+from xml.sax.saxutils import escape, quoteattr
+
+from app.core.zipstream import ZipStream
+
+# Excel's hard limit, header row included
+MAX_SHEET_ROWS = 1_048_576
+
+# Characters XML 1.0 can't carry at all
+_ILLEGAL_XML = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+_SHEET_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<sheetViews><sheetView workbookViewId="0">'
+    '<pane ySplit="1" topLeftCell="A2" activePane="bottomLeft" state="frozen"/>'
+    '</sheetView></sheetViews>'
+    '<sheetData>'
+)
+_SHEET_TAIL = "</sheetData></worksheet>"
+
+_STYLES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<fonts count="2"><font><sz val="11"/><name val="Calibri"/></font>'
+    '<font><b/><sz val="11"/><name val="Calibri"/></font></fonts>'
+    '<fills count="1"><fill><patternFill patternType="none"/></fill></fills>'
+    '<borders count="1"><border/></borders>'
+    '<cellStyleXfs count="1"><xf/></cellStyleXfs>'
+    '<cellXfs count="2"><xf/><xf fontId="1" applyFont="1"/></cellXfs>'
+    '</styleSheet>'
+)
+
+
+def _cell(value: Any, style: str = "") -> str:
+    if value is None or value == "":
+        return "<c/>"
+    if isinstance(value, bool):
+        return f'<c t="b"{style}><v>{int(value)}</v></c>'
+    if isinstance(value, (int, float)):
+        return f"<c{style}><v>{value}</v></c>"
+    if isinstance(value, (date, datetime)):
+        value = value.isoformat()
+    text = escape(_ILLEGAL_XML.sub("", str(value)))
+    return f'<c t="inlineStr"{style}><is><t xml:space="preserve">{text}</t></is></c>'
+
+
+class XlsxStream:
+    """
+    Streaming .xlsx writer on top of ZipStream. Rows go straight into the
+    worksheet XML as inline strings (no shared-strings table), so memory
+    stays flat however many rows are written. A sheet that reaches
+    Excel's row limit continues on a new one with the header repeated.
+
+        xs = XlsxStream("Attendance")
+        yield xs.start(["Event", "Name", ...])
+        yield xs.rows(page)          # any number of times
+        yield xs.finish()
+    """
+
+    def __init__(self, sheet_name: str = "Sheet1"):
+        self.sheet_name = sheet_name
+        self._zip = ZipStream(compress=True, level=6)
+        self._header: List[str] = []
+        self._sheets = 0
+        self._rows_in_sheet = 0
+
+    def _open_sheet(self) -> bytes:
+        self._sheets += 1
+        self._rows_in_sheet = 1
+        header = "".join(_cell(h, ' s="1"') for h in self._header)
+        return (
+            self._zip.start_entry(f"xl/worksheets/sheet{self._sheets}.xml")
+            + self._zip.write((_SHEET_HEAD + f"<row>{header}</row>").encode())
+        )
+
+    def _close_sheet(self) -> bytes:
+        return self._zip.write(_SHEET_TAIL.encode()) + self._zip.end_entry()
+
+    def start(self, header: Sequence[str]) -> bytes:
+        self._header = list(header)
+        return self._open_sheet()
+
+    def rows(self, rows: Iterable[Sequence[Any]]) -> bytes:
+        out = bytearray()
+        xml: List[str] = []
+
+        for row in rows:
+            if self._rows_in_sheet >= MAX_SHEET_ROWS:
+                out += self._zip.write("".join(xml).encode())
+                xml = []
+                out += self._close_sheet() + self._open_sheet()
+
+            xml.append("<row>" + "".join(_cell(v) for v in row) + "</row>")
+            self._rows_in_sheet += 1
+
+        out += self._zip.write("".join(xml).encode())
+        return bytes(out)
+
+    def _sheet_title(self, n: int) -> str:
+        # Sheet names: at most 31 characters, none of []:*?/\
+        base = re.sub(r"[\[\]:*?/\\]", " ", self.sheet_name)[:28] or "Sheet"
+        return base if n == 1 else f"{base} {n}"
+
+    def finish(self) -> bytes:
+        out = self._close_sheet()
+        sheets = range(1, self._sheets + 1)
+
+        workbook = (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+            'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+            "<sheets>"
+            + "".join(
+                f'<sheet name={quoteattr(self._sheet_title(n))} sheetId="{n}" r:id="rId{n}"/>'
+                for n in sheets
+            )
+            + "</sheets></workbook>"
+        )
+
+        workbook_rels = (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            + "".join(
+                f'<Relationship Id="rId{n}" '
+                'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+                f'Target="worksheets/sheet{n}.xml"/>'
+                for n in sheets
+            )
+            + f'<Relationship Id="rId{self._sheets + 1}" '
+            'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+            'Target="styles.xml"/>'
+            "</Relationships>"
+        )
+
+        root_rels = (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            '<Relationship Id="rId1" '
+            'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+            'Target="xl/workbook.xml"/>'
+            "</Relationships>"
+        )
+
+        content_types = (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Override PartName="/xl/workbook.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+            '<Override PartName="/xl/styles.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+            + "".join(
+                f'<Override PartName="/xl/worksheets/sheet{n}.xml" '
+                'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+                for n in sheets
+            )
+            + "</Types>"
+        )
+
+        for name, xml in (
+            ("xl/workbook.xml", workbook),
+            ("xl/_rels/workbook.xml.rels", workbook_rels),
+            ("xl/styles.xml", _STYLES),
+            ("_rels/.rels", root_rels),
+            ("[Content_Types].xml", content_types),
+        ):
+            out += self._zip.add(name, xml.encode())
+
+        return out + self._zip.finish()
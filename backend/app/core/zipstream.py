@@ -0,0 +1,133 @@
+import struct
+import time
+import zlib
+from typing import List, Optional
+
+# Local file header / data descriptor / central directory signatures
+_LOCAL = 0x04034B50
+_DESCRIPTOR = 0x08074B50
+_CENTRAL = 0x02014B50
+_END = 0x06054B50
+
+# General purpose flags: sizes follow the data (bit 3), UTF-8 names (bit 11)
+_FLAGS = 0x0008 | 0x0800
+
+_ZIP32_LIMIT = 0xFFFFFFFF
+
+
+def _dos_datetime(ts: float):
+    t = time.localtime(ts)
+    dos_time = (t.tm_hour << 11) | (t.tm_min << 5) | (t.tm_sec // 2)
+    dos_date = ((t.tm_year - 1980) << 9) | (t.tm_mon << 4) | t.tm_mday
+    return dos_time, dos_date
+
+
+class _Entry:
+    def __init__(self, name: bytes, offset: int, method: int, dos_time: int, dos_date: int):
+        self.name = name
+        self.offset = offset
+        self.method = method
+        self.dos_time = dos_time
+        self.dos_date = dos_date
+        self.crc = 0
+        self.size = 0
+        self.compressed_size = 0
+
+
+class ZipStream:
+    """
+    Incremental ZIP writer: every call returns the bytes to send next, so
+    an archive can be streamed while its members are still being produced.
+    Only the central directory (about 100 bytes per member) is kept.
+
+        zs = ZipStream()
+        yield zs.start_entry("a.pdf")
+        yield zs.write(data)        # any number of times
+        yield zs.end_entry()
+        yield zs.finish()
+
+    Sizes are written in data descriptors after each member, so nothing
+    needs to be known up front. Archives are limited to 4 GiB (no ZIP64).
+    """
+
+    def __init__(self, compress: bool = True, level: int = 6):
+        self.method = 8 if compress else 0
+        self.level = level
+        self._entries: List[_Entry] = []
+        self._current: Optional[_Entry] = None
+        self._compressor = None
+        self._offset = 0
+
+    def _out(self, data: bytes) -> bytes:
+        self._offset += len(data)
+        if self._offset > _ZIP32_LIMIT:
+            raise ValueError("ZIP archive exceeds 4 GiB")
+        return data
+
+    def start_entry(self, name: str, mtime: Optional[float] = None) -> bytes:
+        if self._current is not None:
+            raise RuntimeError("end_entry() the previous member first")
+
+        dos_time, dos_date = _dos_datetime(mtime if mtime is not None else time.time())
+        entry = _Entry(name.encode("utf-8"), self._offset, self.method, dos_time, dos_date)
+        self._current = entry
+        self._compressor = (
+            zlib.compressobj(self.level, zlib.DEFLATED, -15) if self.method == 8 else None
+        )
+
+        header = struct.pack(
+            "<IHHHHHIIIHH",
+            _LOCAL, 20, _FLAGS, entry.method, dos_time, dos_date,
+            0, 0, 0, len(entry.name), 0,
+        )
+        return self._out(header + entry.name)
+
+    def write(self, data: bytes) -> bytes:
+        entry = self._current
+        entry.crc = zlib.crc32(data, entry.crc)
+        entry.size += len(data)
+
+        out = self._compressor.compress(data) if self._compressor else data
+        entry.compressed_size += len(out)
+        return self._out(out)
+
+    def end_entry(self) -> bytes:
+        entry = self._current
+        out = self._compressor.flush() if self._compressor else b""
+        entry.compressed_size += len(out)
+
+        if entry.size > _ZIP32_LIMIT or entry.compressed_size > _ZIP32_LIMIT:
+            raise ValueError(f"ZIP member {entry.name!r} exceeds 4 GiB")
+
+        descriptor = struct.pack(
+            "<IIII", _DESCRIPTOR, entry.crc, entry.compressed_size, entry.size
+        )
+
+        self._entries.append(entry)
+        self._current = None
+        self._compressor = None
+        return self._out(out + descriptor)
+
+    def add(self, name: str, data: bytes) -> bytes:
+        """A whole member at once."""
+        return self.start_entry(name) + self.write(data) + self.end_entry()
+
+    def finish(self) -> bytes:
+        directory_offset = self._offset
+        directory = bytearray()
+
+        for e in self._entries:
+            directory += struct.pack(
+                "<IHHHHHHIIIHHHHHII",
+                _CENTRAL, 20, 20, _FLAGS, e.method, e.dos_time, e.dos_date,
+                e.crc, e.compressed_size, e.size, len(e.name),
+                0, 0, 0, 0, 0, e.offset,
+            )
+            directory += e.name
+
+        end = struct.pack(
+            "<IHHHHIIH",
+            _END, 0, 0, len(self._entries), len(self._entries),
+            len(directory), directory_offset, 0,
+        )
+        return self._out(bytes(directory) + end)
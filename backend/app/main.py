@@ -1,11 +1,65 @@
 # backend/app/main.py
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from app.api.router import api_router
-from app.core.config import PROJECT_NAME, API_V1_STR, FRONTEND_ORIGIN
+from app.core.compression import CompressionMiddleware
+from app.core.config import (
+    PROJECT_NAME,
+    API_V1_STR,
+    FRONTEND_ORIGIN,
+    COMPRESSION_MINIMUM_SIZE,
+)
 from app.api.routes import notifications
+from app.core.http_cache import ETagMiddleware, NotModified, not_modified_response
+from app.core.jobs import job_runner
+from app.core.security import RedactTokensFilter
+from app.core.supabase import init_async_client, close_async_client
+from app.services.checkins import checkin_writer
+from app.services.certificates import shutdown_pool as shutdown_certificate_pool
+from app.services.schedule import schedule_index
+
+logger = logging.getLogger(__name__)
+
+# The notification stream may carry its token as ?access_token=
+logging.getLogger("uvicorn.access").addFilter(RedactTokensFilter())
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One pooled async Supabase client for the lifetime of the worker
+    client = await init_async_client()
+    try:
+        # Warm the double-booking index so the first save doesn't pay for it
+        await schedule_index.ensure(client)
+    except Exception as e:
+        logger.warning(f"Schedule index not warmed, loading on first use: {e}")
+    await job_runner.start()
+    await checkin_writer.start()
+    yield
+    # Write out queued check-ins while the client is still open
+    await checkin_writer.stop()
+    await job_runner.stop()
+    shutdown_certificate_pool()
+    await close_async_client()
+
+
+app = FastAPI(
+    title=PROJECT_NAME,
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
+
+app.add_exception_handler(NotModified, not_modified_response)
+
+# Conditional GET: content-hash ETags and 304 Not Modified
+app.add_middleware(ETagMiddleware)
 
-app = FastAPI(title=PROJECT_NAME)
+# Outside ETagMiddleware so validators are computed on the identity body
+app.add_middleware(CompressionMiddleware, minimum_size=COMPRESSION_MINIMUM_SIZE)
 
 app.add_middleware(
     CORSMiddleware,
@@ -17,6 +71,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],
 )
 
 app.include_router(api_router, prefix=API_V1_STR)
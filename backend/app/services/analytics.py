@@ -0,0 +1,130 @@
+#backend/app/services/analytics.py
+import asyncio
+from datetime import date
+from typing import List, Optional
+
+from supabase import AsyncClient
+
+from app.services.speakers import speaker_cache
+
+# Rollup tables are maintained by triggers (migrations/008_attendance_rollups.sql)
+# and aggregated across events by the RPCs in migrations/012_analytics_aggregates.sql;
+# no query here reads nu_event_attendees or folds a whole table in Python.
+
+
+async def attendance_by_day(
+    db: AsyncClient,
+    event_id: Optional[int] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+) -> List[dict]:
+    # Summed over events in SQL: one row per day whatever the event count
+    res = await db.rpc("attendance_daily_totals", {
+        "p_event_id": event_id,
+        "p_from": date_from.isoformat() if date_from else None,
+        "p_to": date_to.isoformat() if date_to else None,
+    }).execute()
+
+    return [{"day": r["day"], "attendance": r["checkins"]} for r in res.data or []]
+
+
+async def session_popularity(
+    db: AsyncClient,
+    event_id: Optional[int] = None,
+    limit: int = 10,
+) -> List[dict]:
+    query = (
+        db
+        .table("nu_session_attendance")
+        .select("session_id, event_id, checkins, nu_event_sessions (session_topic, session_date)")
+        .gt("checkins", 0)
+    )
+
+    if event_id is not None:
+        query = query.eq("event_id", event_id)
+
+    res = await query.order("checkins", desc=True).limit(limit).execute()
+
+    return [
+        {
+            "session_id": r["session_id"],
+            "event_id": r["event_id"],
+            "session": (r.get("nu_event_sessions") or {}).get("session_topic"),
+            "date": (r.get("nu_event_sessions") or {}).get("session_date"),
+            "attendees": r["checkins"],
+        }
+        for r in res.data or []
+    ]
+
+
+async def event_capacity(db: AsyncClient, event_ids: List[int]) -> List[dict]:
+    """
+    Check-ins and distinct attendees against seat capacity per event.
+    Capacity is the sum of nu_rooms.capacity over the event's sessions
+    (null when no session room has a capacity set).
+    """
+    if not event_ids:
+        return []
+
+    attendance_res, capacity_res = await asyncio.gather(
+        db
+        .table("nu_event_attendance")
+        .select("event_id, checkins, attendees")
+        .in_("event_id", event_ids)
+        .execute(),
+        db.rpc("event_room_capacity", {"p_event_ids": event_ids}).execute(),
+    )
+
+    attendance = {r["event_id"]: r for r in attendance_res.data or []}
+    capacity = {r["event_id"]: r["capacity"] for r in capacity_res.data or []}
+
+    rows = []
+    for event_id in event_ids:
+        a = attendance.get(event_id) or {}
+        cap = capacity.get(event_id)
+        checkins = a.get("checkins", 0)
+        rows.append({
+            "event_id": event_id,
+            "checkins": checkins,
+            "attendees": a.get("attendees", 0),
+            "capacity": cap,
+            "utilization": round(checkins / cap, 3) if cap else None,
+        })
+
+    return rows
+
+
+async def speaker_reach(db: AsyncClient, limit: int = 10) -> List[dict]:
+    """Check-ins summed over each speaker's sessions, ranked in SQL."""
+    res = await db.rpc("speaker_reach", {"p_limit": limit}).execute()
+    top = res.data or []
+
+    speakers = await speaker_cache.resolve(db, (r["speaker_id"] for r in top))
+
+    return [
+        {
+            "speaker": speakers.get(r["speaker_id"]) or {"id": r["speaker_id"], "name": None, "email": None},
+            "sessions": r["sessions"],
+            "checkins": r["checkins"],
+        }
+        for r in top
+    ]
+
+
+async def recent_event_ids(db: AsyncClient, limit: int) -> List[int]:
+    res = await (
+        db
+        .table("nu_event_summaries")
+        .select("event_id")
+        .neq("status", "archived")
+        .order("start_datetime", desc=True)
+        .limit(limit)
+        .execute()
+    )
+    return [r["event_id"] for r in res.data or []]
+
+
+async def rebuild_attendance_rollups(db: AsyncClient) -> Optional[int]:
+    """Recompute every rollup server-side; returns attendance rows read."""
+    res = await db.rpc("rebuild_attendance_rollups").execute()
+    return res.data
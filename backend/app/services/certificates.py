@@ -0,0 +1,339 @@
+#backend/app/services/certificates.py
+import asyncio
+import json
+import logging
+import multiprocessing
+import re
+import time
+import unicodedata
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from datetime import date
+from typing import AsyncIterator, List, Optional, Tuple
+
+from supabase import AsyncClient
+
+from app.core import pdf
+from app.core.config import CERTIFICATE_TEMPLATE_PATH, CERTIFICATE_WORKERS
+from app.core.zipstream import ZipStream
+from app.services.speakers import speaker_cache
+
+logger = logging.getLogger(__name__)
+
+# Attendees read per query (keyset on user_id)
+ATTENDEE_PAGE_SIZE = 1000
+
+# Certificates per worker task; large enough to amortize pickling,
+# small enough that the first bytes go out quickly
+RENDER_BATCH_SIZE = 50
+
+# Batches queued per worker; bounds how many rendered PDFs sit in memory
+BATCHES_PER_WORKER = 2
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+# ======================================================
+# RENDERING (runs in the worker processes)
+# ======================================================
+class _Fields(dict):
+    def __missing__(self, key):
+        return ""
+
+
+def load_template(path: str = CERTIFICATE_TEMPLATE_PATH) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def render_certificate(template: dict, fields: dict) -> bytes:
+    """One PDF from a template of rect/text elements; {field} placeholders are filled in."""
+    values = _Fields(fields)
+    page = pdf.Page(template["page"]["width"], template["page"]["height"])
+
+    for el in template["elements"]:
+        if el.get("when") and not values[el["when"]]:
+            continue
+
+        if el["type"] == "rect":
+            page.rect(
+                el["x"], el["y"], el["w"], el["h"],
+                line_width=el.get("line_width", 1),
+                color=tuple(el.get("color", (0, 0, 0))),
+            )
+        elif el["type"] == "text":
+            text = el["text"].format_map(values)
+            font = el.get("font", "regular")
+            size = el.get("size", 12)
+
+            # Shrink long names and topics to fit rather than run off the page
+            max_width = el.get("max_width")
+            if max_width:
+                width = pdf.text_width(text, size, font)
+                if width > max_width:
+                    size = size * max_width / width
+
+            page.text(
+                text, el["y"],
+                size=size,
+                font=font,
+                align=el.get("align", "center"),
+                x=el.get("x"),
+                color=tuple(el.get("color", (0, 0, 0))),
+            )
+
+    return pdf.render([page])
+
+
+def render_batch(template: dict, batch: List[dict]) -> List[Tuple[str, bytes]]:
+    return [(fields["filename"], render_certificate(template, fields)) for fields in batch]
+
+
+# ======================================================
+# PROCESS POOL
+# ======================================================
+def get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        # spawn: forking a process that is running an event loop and
+        # HTTP pools copies state the workers must not touch
+        _pool = ProcessPoolExecutor(
+            max_workers=CERTIFICATE_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _pool
+
+
+def shutdown_pool() -> None:
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(cancel_futures=True)
+        _pool = None
+
+
+# ======================================================
+# DATA
+# ======================================================
+def full_name(u: dict) -> str:
+    middle = (u.get("middlename") or "").strip()
+    parts = [
+        u.get("firstname"),
+        f"{middle[0].upper()}." if middle else None,
+        u.get("lastname"),
+        u.get("ext"),
+    ]
+    return " ".join(p.strip() for p in parts if p and p.strip())
+
+
+def _slug(text: str) -> str:
+    ascii_text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode()
+    return re.sub(r"[^A-Za-z0-9]+", "_", ascii_text).strip("_") or "attendee"
+
+
+def _long_date(value: Optional[str]) -> str:
+    if not value:
+        return ""
+    try:
+        d = date.fromisoformat(value[:10])
+    except ValueError:
+        return value
+    return f"{d:%B} {d.day}, {d.year}"
+
+
+async def session_context(db: AsyncClient, session_id: int) -> Optional[dict]:
+    """The per-session template fields, or None when the session doesn't exist."""
+    res = await (
+        db
+        .table("nu_event_sessions")
+        .select("id, session_topic, session_date, session_speaker_id, nu_events (id, event_name)")
+        .eq("id", session_id)
+        .maybe_single()
+        .execute()
+    )
+
+    if not res or not res.data:
+        return None
+
+    s = res.data
+    event = s.get("nu_events") or {}
+
+    speaker = None
+    if s.get("session_speaker_id"):
+        speakers = await speaker_cache.resolve(db, [s["session_speaker_id"]])
+        speaker = speakers.get(s["session_speaker_id"])
+
+    return {
+        "session_id": s["id"],
+        "event_id": event.get("id"),
+        "session_topic": s.get("session_topic") or "",
+        "session_date": _long_date(s.get("session_date")),
+        "event_name": event.get("event_name") or "",
+        "speaker": (speaker or {}).get("name") or "",
+    }
+
+
+async def iter_attendee_pages(
+    db: AsyncClient,
+    session_id: int,
+    page_size: int = ATTENDEE_PAGE_SIZE,
+) -> AsyncIterator[List[dict]]:
+    after = 0
+
+    while True:
+        res = await (
+            db
+            .table("nu_event_attendees")
+            .select("user_id, nu_users (firstname, middlename, lastname, ext, email)")
+            .eq("session_id", session_id)
+            .gt("user_id", after)
+            .order("user_id")
+            .limit(page_size)
+            .execute()
+        )
+        rows = res.data or []
+
+        if rows:
+            yield [
+                {"user_id": r["user_id"], **(r.get("nu_users") or {})}
+                for r in rows
+            ]
+
+        if len(rows) < page_size:
+            return
+
+        after = rows[-1]["user_id"]
+
+
+def certificate_fields(context: dict, attendee: dict) -> dict:
+    name = full_name(attendee)
+    certificate_no = f"{context['session_id']}-{attendee['user_id']:06d}"
+    return {
+        **context,
+        "name": name,
+        "email": attendee.get("email") or "",
+        "certificate_no": certificate_no,
+        "filename": f"{certificate_no}_{_slug(name)}.pdf",
+    }
+
+
+# ======================================================
+# PIPELINE
+# ======================================================
+async def render_certificates(
+    pages: AsyncIterator[List[dict]],
+    context: dict,
+    template: dict,
+    executor: Optional[Executor] = None,
+    workers: int = CERTIFICATE_WORKERS,
+    batch_size: int = RENDER_BATCH_SIZE,
+) -> AsyncIterator[Tuple[str, bytes]]:
+    """
+    Yield (filename, pdf) in attendee order. Batches are rendered on the
+    executor (the process pool by default) with at most
+    `workers * BATCHES_PER_WORKER` in flight, so memory stays flat no
+    matter how many attendees the session has. executor=None with
+    workers=0 renders inline, for benchmarking a single process.
+    """
+    loop = asyncio.get_running_loop()
+    if executor is None and workers:
+        executor = get_pool()
+
+    max_in_flight = max(workers, 1) * BATCHES_PER_WORKER
+    in_flight: deque = deque()
+
+    try:
+        batch: List[dict] = []
+        async for page in pages:
+            for attendee in page:
+                batch.append(certificate_fields(context, attendee))
+                if len(batch) < batch_size:
+                    continue
+
+                if executor is None:
+                    for item in render_batch(template, batch):
+                        yield item
+                else:
+                    in_flight.append(loop.run_in_executor(executor, render_batch, template, batch))
+                    while len(in_flight) >= max_in_flight:
+                        for item in await in_flight.popleft():
+                            yield item
+                batch = []
+
+        if batch:
+            if executor is None:
+                for item in render_batch(template, batch):
+                    yield item
+            else:
+                in_flight.append(loop.run_in_executor(executor, render_batch, template, batch))
+
+        while in_flight:
+            for item in await in_flight.popleft():
+                yield item
+    finally:
+        # Client went away: don't leave queued batches for the pool
+        for future in in_flight:
+            future.cancel()
+
+
+async def zip_certificates(certificates: AsyncIterator[Tuple[str, bytes]]) -> AsyncIterator[bytes]:
+    # PDF content streams are plain text and deflate well
+    zs = ZipStream(compress=True, level=6)
+    count = 0
+
+    try:
+        async for filename, data in certificates:
+            yield zs.add(filename, data)
+            count += 1
+
+        yield zs.finish()
+    except Exception:
+        # Headers are gone already; all we can do is cut the archive short
+        logger.exception(f"Certificate archive aborted after {count} files")
+        raise
+
+
+async def session_archive(db: AsyncClient, context: dict) -> AsyncIterator[bytes]:
+    template = load_template()
+    pages = iter_attendee_pages(db, context["session_id"])
+    async for chunk in zip_certificates(render_certificates(pages, context, template)):
+        yield chunk
+
+
+async def measure(
+    pages: AsyncIterator[List[dict]],
+    context: dict,
+    template: dict,
+    executor: Optional[Executor] = None,
+    workers: int = CERTIFICATE_WORKERS,
+) -> dict:
+    """Render and zip everything, discarding the output; reports throughput."""
+    started = time.perf_counter()
+    certificates = 0
+    pdf_bytes = 0
+    zip_bytes = 0
+
+    async def counted():
+        nonlocal certificates, pdf_bytes
+        async for filename, data in render_certificates(pages, context, template, executor, workers):
+            certificates += 1
+            pdf_bytes += len(data)
+            yield filename, data
+
+    async for chunk in zip_certificates(counted()):
+        zip_bytes += len(chunk)
+
+    seconds = time.perf_counter() - started
+    return {
+        "certificates": certificates,
+        "workers": workers,
+        "seconds": round(seconds, 3),
+        "per_second": round(certificates / seconds, 1) if seconds else None,
+        "pdf_bytes": pdf_bytes,
+        "zip_bytes": zip_bytes,
+    }
+
+
+async def dry_run(db: AsyncClient, context: dict) -> dict:
+    return await measure(
+        iter_attendee_pages(db, context["session_id"]), context, load_template()
+    )
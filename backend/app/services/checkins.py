@@ -0,0 +1,244 @@
+#backend/app/services/checkins.py
+import asyncio
+import logging
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from supabase import AsyncClient
+
+from app.core.cache import TTLCache
+from app.core.config import (
+    CHECKIN_BATCH_SIZE,
+    CHECKIN_DEDUP_MAX_ENTRIES,
+    CHECKIN_DEDUP_TTL_SECONDS,
+    CHECKIN_FLUSH_INTERVAL_SECONDS,
+    CHECKIN_QUEUE_MAX,
+)
+from app.core.supabase import get_async_client
+
+logger = logging.getLogger(__name__)
+
+# Attempts per batch before it is split into single-row inserts
+FLUSH_RETRIES = 3
+
+# session id -> event id, so a scan needs no lookup after the first
+_session_events = TTLCache(maxsize=4096, ttl=3600)
+
+
+class CheckinQueueFull(Exception):
+    pass
+
+
+async def session_event_id(db: AsyncClient, session_id: int) -> Optional[int]:
+    event_id = _session_events.get(session_id)
+    if event_id is not None:
+        return event_id
+
+    res = await (
+        db
+        .table("nu_event_sessions")
+        .select("session_event_id")
+        .eq("id", session_id)
+        .maybe_single()
+        .execute()
+    )
+
+    if not res or not res.data:
+        return None
+
+    event_id = res.data["session_event_id"]
+    _session_events.set(session_id, event_id)
+    return event_id
+
+
+class CheckinWriter:
+    """
+    Write-behind buffer for check-ins.
+
+    accept() answers from memory: a (session_id, user_id) seen before is a
+    duplicate, anything else is queued. A background task drains the queue
+    into nu_event_attendees in micro-batches, flushing when `batch_size`
+    rows are waiting or `flush_interval` seconds have passed. The queue is
+    bounded; stop() writes out whatever is still queued.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = CHECKIN_BATCH_SIZE,
+        flush_interval: float = CHECKIN_FLUSH_INTERVAL_SECONDS,
+        max_queue: int = CHECKIN_QUEUE_MAX,
+    ):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_queue = max_queue
+
+        self._seen = TTLCache(maxsize=CHECKIN_DEDUP_MAX_ENTRIES, ttl=CHECKIN_DEDUP_TTL_SECONDS)
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+        self._latencies: deque = deque(maxlen=200)
+        self._counters = {
+            "accepted": 0,
+            "duplicates": 0,
+            "rejected": 0,
+            "written": 0,
+            # Reached the database but were already there (another worker,
+            # or the dedup set forgot them)
+            "already_recorded": 0,
+            "failed": 0,
+            "batches": 0,
+        }
+        self._last_flush_at: Optional[str] = None
+
+    # --------------------------------------------------
+    # Intake
+    # --------------------------------------------------
+    def accept(self, session_id: int, event_id: int, user_id: int, method: str) -> bool:
+        """
+        Queue a check-in. Returns False for a repeat scan.
+        Raises CheckinQueueFull when the writer is too far behind.
+        """
+        key = (session_id, user_id)
+
+        if self._seen.get(key) is not None:
+            self._counters["duplicates"] += 1
+            return False
+
+        if self._queue is None or self._queue.qsize() >= self.max_queue:
+            self._counters["rejected"] += 1
+            raise CheckinQueueFull()
+
+        self._seen.set(key, True)
+        self._queue.put_nowait({
+            "session_id": session_id,
+            "event_id": event_id,
+            "user_id": user_id,
+            "checkin_method": method,
+            "checked_in_at": datetime.now(timezone.utc).isoformat(),
+        })
+        self._counters["accepted"] += 1
+        return True
+
+    # --------------------------------------------------
+    # Lifecycle
+    # --------------------------------------------------
+    async def start(self) -> None:
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop taking new check-ins and write out the queue."""
+        if self._task is None:
+            return
+
+        queue, self._queue = self._queue, None
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+        remaining = []
+        while not queue.empty():
+            remaining.append(queue.get_nowait())
+
+        for i in range(0, len(remaining), self.batch_size):
+            await self._flush(remaining[i:i + self.batch_size])
+
+        if remaining:
+            logger.info(f"Flushed {len(remaining)} queued check-ins on shutdown")
+
+    async def _run(self) -> None:
+        queue = self._queue
+
+        while True:
+            batch: List[dict] = []
+            try:
+                batch.append(await queue.get())
+                deadline = time.monotonic() + self.flush_interval
+
+                while len(batch) < self.batch_size:
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+
+                await self._flush(batch)
+            except asyncio.CancelledError:
+                # Shutting down: hand the batch back so stop() writes it
+                # (re-inserting rows that did land is a no-op)
+                for row in batch:
+                    queue.put_nowait(row)
+                raise
+
+    # --------------------------------------------------
+    # Writes
+    # --------------------------------------------------
+    async def _insert(self, rows: List[dict]) -> int:
+        """Returns how many rows were new; duplicates are skipped and not returned."""
+        res = await get_async_client().table("nu_event_attendees") \
+            .upsert(rows, on_conflict="session_id,user_id", ignore_duplicates=True) \
+            .execute()
+        return len(res.data or [])
+
+    def _count(self, submitted: int, inserted: int) -> None:
+        self._counters["written"] += inserted
+        self._counters["already_recorded"] += submitted - inserted
+
+    async def _flush(self, batch: List[dict]) -> None:
+        started = time.perf_counter()
+
+        for attempt in range(1, FLUSH_RETRIES + 1):
+            try:
+                self._count(len(batch), await self._insert(batch))
+                break
+            except Exception as e:
+                logger.warning(f"Check-in batch of {len(batch)} failed (attempt {attempt}): {e}")
+                if attempt < FLUSH_RETRIES:
+                    await asyncio.sleep(0.2 * attempt)
+        else:
+            # One bad row (e.g. unknown user) must not sink the rest
+            for row in batch:
+                try:
+                    self._count(1, await self._insert([row]))
+                except Exception as e:
+                    logger.error(f"Dropping check-in {row}: {e}")
+                    self._counters["failed"] += 1
+                    # Let a rescan try again
+                    self._seen.pop((row["session_id"], row["user_id"]))
+
+        self._counters["batches"] += 1
+        self._latencies.append(time.perf_counter() - started)
+        self._last_flush_at = datetime.now(timezone.utc).isoformat()
+
+    # --------------------------------------------------
+    # Stats
+    # --------------------------------------------------
+    def stats(self) -> dict:
+        latencies = sorted(self._latencies)
+
+        def pct(p: float) -> Optional[float]:
+            if not latencies:
+                return None
+            return round(latencies[min(int(len(latencies) * p), len(latencies) - 1)] * 1000, 1)
+
+        return {
+            "running": self._task is not None,
+            "queue_depth": self._queue.qsize() if self._queue else 0,
+            "queue_max": self.max_queue,
+            "batch_size": self.batch_size,
+            "flush_interval_seconds": self.flush_interval,
+            **self._counters,
+            "flush_latency_ms": {
+                "p50": pct(0.5),
+                "p95": pct(0.95),
+                "max": pct(1.0),
+            },
+            "last_flush_at": self._last_flush_at,
+        }
+
+
+checkin_writer = CheckinWriter()
@@ -0,0 +1,239 @@
+#backend/app/services/dashboard.py
+import asyncio
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import List
+from zoneinfo import ZoneInfo
+
+from supabase import AsyncClient
+
+from app.core.cache import SingleFlight, TTLCache
+from app.core.config import DASHBOARD_TTL_SECONDS
+from app.services import analytics
+from app.services.speakers import speaker_cache
+
+# Same calendar as attendance_day() in migrations/008_attendance_rollups.sql
+CAMPUS_TZ = ZoneInfo("Asia/Manila")
+
+ATTENDANCE_DAYS = 7
+UPCOMING_LIMIT = 5
+ACTIVITY_LIMIT = 10
+
+ACTIVE_STATUSES = ("upcoming", "ongoing", "published")
+
+# The summary is the same for every admin, so one entry serves everyone
+_summaries = TTLCache(maxsize=1, ttl=DASHBOARD_TTL_SECONDS)
+_flights = SingleFlight()
+
+_stats = {"hits": 0, "computed": 0}
+
+
+def _today() -> date:
+    return datetime.now(CAMPUS_TZ).date()
+
+
+# ======================================================
+# WIDGETS
+# ======================================================
+async def _events_by_status(db: AsyncClient) -> dict:
+    # Grouped in SQL (migrations/011_dashboard_totals.sql): one row per status
+    res = await db.rpc("dashboard_event_statuses").execute()
+    return {r["status"]: r["events"] for r in res.data or []}
+
+
+async def _attendee_totals(db: AsyncClient) -> dict:
+    res = await db.rpc("dashboard_attendance_totals").execute()
+    totals = (res.data or [{}])[0]
+    return {
+        "checkins": totals.get("checkins") or 0,
+        "attendees": totals.get("attendees") or 0,
+    }
+
+
+async def _sessions_on(db: AsyncClient, day: date) -> int:
+    res = await (
+        db
+        .table("nu_event_sessions")
+        .select("id", count="exact")
+        .eq("session_date", day.isoformat())
+        .limit(1)
+        .execute()
+    )
+    return res.count or 0
+
+
+async def _attendance(db: AsyncClient, today: date) -> List[dict]:
+    first = today - timedelta(days=ATTENDANCE_DAYS - 1)
+    by_day = {
+        r["day"]: r["attendance"]
+        for r in await analytics.attendance_by_day(db, date_from=first, date_to=today)
+    }
+
+    # Days without check-ins still get a point on the chart
+    days = (first + timedelta(days=i) for i in range(ATTENDANCE_DAYS))
+    return [{"day": d.isoformat(), "attendance": by_day.get(d.isoformat(), 0)} for d in days]
+
+
+async def _upcoming_sessions(db: AsyncClient, today: date) -> List[dict]:
+    res = await (
+        db
+        .table("nu_event_sessions")
+        .select("""
+            id,
+            session_topic,
+            session_date,
+            session_start_time,
+            session_end_time,
+            session_speaker_id,
+            nu_events!inner (id, event_name, status),
+            nu_rooms (room_no, capacity)
+        """)
+        .gte("session_date", today.isoformat())
+        .neq("nu_events.status", "archived")
+        .order("session_date")
+        .order("session_start_time")
+        .limit(UPCOMING_LIMIT)
+        .execute()
+    )
+    sessions = res.data or []
+
+    if not sessions:
+        return []
+
+    attendance_res, speakers = await asyncio.gather(
+        db
+        .table("nu_session_attendance")
+        .select("session_id, checkins")
+        .in_("session_id", [s["id"] for s in sessions])
+        .execute(),
+        speaker_cache.resolve(
+            db, (s["session_speaker_id"] for s in sessions if s.get("session_speaker_id"))
+        ),
+    )
+    checkins = {r["session_id"]: r["checkins"] for r in attendance_res.data or []}
+
+    return [
+        {
+            "id": s["id"],
+            "topic": s["session_topic"],
+            "event": (s.get("nu_events") or {}).get("event_name"),
+            "date": s["session_date"],
+            "start_time": s["session_start_time"],
+            "end_time": s["session_end_time"],
+            "speaker": speakers.get(s.get("session_speaker_id")),
+            "room": (s.get("nu_rooms") or {}).get("room_no"),
+            "capacity": (s.get("nu_rooms") or {}).get("capacity"),
+            "checkins": checkins.get(s["id"], 0),
+        }
+        for s in sessions
+    ]
+
+
+async def _recent_activity(db: AsyncClient) -> List[dict]:
+    checkins_res, notifications_res = await asyncio.gather(
+        db
+        .table("nu_event_attendees")
+        .select("""
+            user_id,
+            checked_in_at,
+            checkin_method,
+            nu_users (firstname, lastname),
+            nu_event_sessions (id, session_topic)
+        """)
+        .order("checked_in_at", desc=True)
+        .limit(ACTIVITY_LIMIT)
+        .execute(),
+        db
+        .table("nu_notifications")
+        .select("id, title, message_type, created_at")
+        .order("created_at", desc=True)
+        .order("id", desc=True)
+        .limit(ACTIVITY_LIMIT)
+        .execute(),
+    )
+
+    activity = [
+        {
+            "type": "checkin",
+            "at": r["checked_in_at"],
+            "user": f'{(r.get("nu_users") or {}).get("firstname") or ""} '
+                    f'{(r.get("nu_users") or {}).get("lastname") or ""}'.strip(),
+            "target": (r.get("nu_event_sessions") or {}).get("session_topic"),
+            "detail": r.get("checkin_method"),
+        }
+        for r in checkins_res.data or []
+    ] + [
+        {
+            "type": "notification",
+            "at": n["created_at"],
+            "user": None,
+            "target": n["title"],
+            "detail": n.get("message_type"),
+        }
+        for n in notifications_res.data or []
+    ]
+
+    activity.sort(key=lambda a: a["at"] or "", reverse=True)
+    return activity[:ACTIVITY_LIMIT]
+
+
+# ======================================================
+# SUMMARY
+# ======================================================
+async def _compute(db: AsyncClient) -> dict:
+    started = time.perf_counter()
+    today = _today()
+
+    (
+        statuses,
+        totals,
+        sessions_today,
+        attendance,
+        upcoming,
+        activity,
+    ) = await asyncio.gather(
+        _events_by_status(db),
+        _attendee_totals(db),
+        _sessions_on(db, today),
+        _attendance(db, today),
+        _upcoming_sessions(db, today),
+        _recent_activity(db),
+    )
+
+    summary = {
+        "kpis": {
+            "attendees": totals["attendees"],
+            "checkins": totals["checkins"],
+            "checkins_today": attendance[-1]["attendance"],
+            "sessions_today": sessions_today,
+            "active_events": sum(statuses.get(s, 0) for s in ACTIVE_STATUSES),
+        },
+        "events_by_status": statuses,
+        "attendance": attendance,
+        "upcoming_sessions": upcoming,
+        "recent_activity": activity,
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "compute_ms": round((time.perf_counter() - started) * 1000, 1),
+    }
+
+    _summaries.set("summary", summary)
+    _stats["computed"] += 1
+    return summary
+
+
+async def dashboard_summary(db: AsyncClient) -> dict:
+    """
+    Every dashboard widget in one document. Served from memory for
+    DASHBOARD_TTL_SECONDS; on a miss, concurrent callers share one
+    computation instead of each running the queries.
+    """
+    summary = _summaries.get("summary")
+    if summary is not None:
+        _stats["hits"] += 1
+        return summary
+
+    return await _flights.do("summary", lambda: _compute(db))
+
+
+def stats() -> dict:
+    return {**_stats, "coalesced": _flights.coalesced, "ttl_seconds": DASHBOARD_TTL_SECONDS}
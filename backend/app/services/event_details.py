@@ -0,0 +1,114 @@
+#backend/app/services/event_details.py
+import asyncio
+from typing import Iterable, Optional
+
+from supabase import AsyncClient
+
+from app.core.cache import TTLCache
+from app.core.config import EVENT_DETAIL_CACHE_MAX_ENTRIES, EVENT_DETAIL_TTL_SECONDS
+from app.services.speakers import speaker_cache
+
+# Assembled GET /events/{id} documents keyed by event id
+event_detail_cache = TTLCache(
+    maxsize=EVENT_DETAIL_CACHE_MAX_ENTRIES,
+    ttl=EVENT_DETAIL_TTL_SECONDS,
+)
+
+
+def invalidate_event_details(event_ids: Iterable[int]) -> None:
+    for event_id in event_ids:
+        event_detail_cache.pop(event_id)
+
+
+def _venue(s: dict) -> Optional[dict]:
+    try:
+        return {
+            "building": s["nu_rooms"]["nu_floors"]["nu_buildings"]["building_name"],
+            "floor": s["nu_rooms"]["nu_floors"]["floor_name"],
+            "room": s["nu_rooms"]["room_no"],
+        }
+    except (TypeError, KeyError):
+        return None
+
+
+async def load_event_details(db: AsyncClient, event_id: int) -> Optional[dict]:
+    """
+    Event with its sessions, venues and speakers, or None when the event
+    doesn't exist or is archived. The event and session queries run
+    concurrently; speakers come from the shared speaker cache.
+    """
+    event_query = (
+        db
+        .table("nu_events")
+        .select("""
+            id,
+            event_name,
+            event_description,
+            start_datetime,
+            end_datetime,
+            status
+        """)
+        .eq("id", event_id)
+        .neq("status", "archived")
+        .maybe_single()
+        .execute()
+    )
+
+    sessions_query = (
+        db
+        .table("nu_event_sessions")
+        .select("""
+            id,
+            session_topic,
+            session_date,
+            session_start_time,
+            session_end_time,
+            session_speaker_id,
+            nu_rooms (
+                room_no,
+                nu_floors (
+                    floor_name,
+                    nu_buildings (
+                        building_name
+                    )
+                )
+            )
+        """)
+        .eq("session_event_id", event_id)
+        .order("session_date")
+        .execute()
+    )
+
+    event_res, sessions_res = await asyncio.gather(event_query, sessions_query)
+
+    # maybe_single() yields None rather than raising when there is no row
+    if not event_res or not event_res.data:
+        return None
+
+    event = event_res.data
+    sessions = sessions_res.data or []
+
+    speakers = await speaker_cache.resolve(
+        db, (s["session_speaker_id"] for s in sessions if s.get("session_speaker_id"))
+    )
+
+    return {
+        "id": event["id"],
+        "event_name": event["event_name"],
+        "event_description": event["event_description"],
+        "start_datetime": event["start_datetime"],
+        "end_datetime": event["end_datetime"],
+        "status": event["status"],
+        "sessions": [
+            {
+                "id": s["id"],
+                "topic": s["session_topic"],
+                "date": s["session_date"],
+                "start_time": s["session_start_time"],
+                "end_time": s["session_end_time"],
+                "speaker": speakers.get(s.get("session_speaker_id")),
+                "venue": _venue(s),
+            }
+            for s in sessions
+        ],
+    }
@@ -0,0 +1,239 @@
+#backend/app/services/event_import.py
+import codecs
+import csv
+import io
+import logging
+import time
+from typing import Any, AsyncIterator, Iterable, List, Optional, Tuple
+
+from pydantic import ValidationError
+from supabase import AsyncClient
+
+from app.api.schemas.events import EventCreate
+from app.services.schedule import schedule_index
+from app.services.sessions import session_row
+
+logger = logging.getLogger(__name__)
+
+# Events per import_events() RPC call
+IMPORT_CHUNK_SIZE = 50
+
+EVENT_COLUMNS = (
+    "event_name",
+    "event_description",
+    "start_datetime",
+    "end_datetime",
+    "status",
+)
+
+SESSION_COLUMNS = (
+    "session_topic",
+    "session_speaker_id",
+    "session_date",
+    "session_start_time",
+    "session_end_time",
+    "session_building_id",
+    "session_floor_id",
+    "session_room_id",
+)
+
+# New events have no session ids to carry over
+NEW_EVENT_EXCLUDE = {"sessions": {"__all__": {"id"}}}
+
+
+# ======================================================
+# INPUT FORMATS
+# ======================================================
+async def json_events(items: List[Any]) -> AsyncIterator[Tuple[Any, Any]]:
+    for index, item in enumerate(items):
+        yield index, item
+
+
+def _split_complete_records(text: str) -> Tuple[str, str]:
+    """Cut after the last newline that isn't inside a quoted field."""
+    quotes = 0
+    cut = -1
+    for i, ch in enumerate(text):
+        if ch == '"':
+            quotes += 1
+        elif ch == "\n" and quotes % 2 == 0:
+            cut = i
+    return text[:cut + 1], text[cut + 1:]
+
+
+async def _csv_rows(chunks: AsyncIterator[bytes]) -> AsyncIterator[List[str]]:
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        complete, pending = _split_complete_records(pending)
+        for row in csv.reader(io.StringIO(complete)):
+            yield row
+
+    pending += decoder.decode(b"", final=True)
+    for row in csv.reader(io.StringIO(pending)):
+        yield row
+
+
+def _blank_to_none(values: Iterable[Tuple[str, str]]) -> dict:
+    return {k: (v if v != "" else None) for k, v in values}
+
+
+async def csv_events(chunks: AsyncIterator[bytes]) -> AsyncIterator[Tuple[Any, Any]]:
+    """
+    One CSV row per session; consecutive rows sharing `event_ref` form one
+    event. Event columns are read from the first row of each group, and a
+    row with no session_date adds no session.
+    """
+    header: Optional[List[str]] = None
+    current_ref = None
+    current: Optional[dict] = None
+
+    async for row in _csv_rows(chunks):
+        if not any(cell.strip() for cell in row):
+            continue
+
+        if header is None:
+            header = [h.strip() for h in row]
+            continue
+
+        record = dict(zip(header, row))
+        ref = record.get("event_ref") or record.get("event_name")
+
+        if current is None or ref != current_ref:
+            if current is not None:
+                yield current_ref, current
+
+            current_ref = ref
+            current = _blank_to_none((c, record.get(c, "")) for c in EVENT_COLUMNS)
+            current["sessions"] = []
+
+        if record.get("session_date"):
+            current["sessions"].append(
+                _blank_to_none((c, record.get(c, "")) for c in SESSION_COLUMNS)
+            )
+
+    if current is not None:
+        yield current_ref, current
+
+
+# ======================================================
+# IMPORT
+# ======================================================
+def _validation_message(e: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(p) for p in err['loc'])}: {err['msg']}"
+        for err in e.errors()
+    )
+
+
+async def import_events(
+    db: AsyncClient,
+    items: AsyncIterator[Tuple[Any, Any]],
+    host_user_id: int,
+    chunk_size: int = IMPORT_CHUNK_SIZE,
+    allow_conflicts: bool = False,
+) -> dict:
+    """
+    Validate every item against EventCreate, then create valid events in
+    chunks through the import_events() RPC. Each event and its sessions
+    commit atomically; one bad event never affects the others.
+    Events that double-book a room or speaker, against saved sessions or
+    earlier rows of the same import, fail unless allow_conflicts is set.
+    Each chunk is checked and saved under schedule_index.booking(), so
+    the check sees everything this worker saved before it.
+    """
+    started = time.perf_counter()
+    results: List[Tuple[int, dict]] = []
+    # (position in input, caller's row reference, EventCreate payload, session rows)
+    batch: List[Tuple[int, Any, dict, List[dict]]] = []
+    created = 0
+    sessions_total = 0
+
+    async def flush():
+        nonlocal created, sessions_total
+
+        if not batch:
+            return
+
+        async with schedule_index.booking():
+            await schedule_index.ensure(db)
+
+            # Bookings of this chunk's accepted rows, not saved yet
+            pending = {}
+            accepted = []
+
+            for seq, ref, payload, rows in batch:
+                conflicts = schedule_index.conflicts(rows, pending=pending)
+
+                if conflicts and not allow_conflicts:
+                    results.append((seq, {
+                        "row": ref,
+                        "error": "Room or speaker is already booked at that time",
+                        "conflicts": conflicts,
+                    }))
+                    continue
+
+                schedule_index.hold(pending, rows, ref)
+                accepted.append((seq, ref, payload))
+
+            batch.clear()
+
+            if not accepted:
+                return
+
+            try:
+                res = await db.rpc("import_events", {
+                    "p_events": [payload for _, _, payload in accepted],
+                    "p_host_user_id": host_user_id,
+                }).execute()
+                outcomes = res.data or []
+            except Exception as e:
+                logger.error(f"Bulk import chunk failed: {e}")
+                outcomes = [{"index": i, "error": str(e)} for i in range(len(accepted))]
+
+            for outcome in outcomes:
+                seq, ref, _ = accepted[outcome["index"]]
+
+                if outcome.get("error"):
+                    results.append((seq, {"row": ref, "error": outcome["error"]}))
+                    continue
+
+                sessions = outcome.get("sessions") or []
+                schedule_index.replace_event(outcome["id"], sessions)
+                created += 1
+                sessions_total += len(sessions)
+                results.append((seq, {"row": ref, "id": outcome["id"], "sessions": len(sessions)}))
+
+    total = 0
+
+    async for ref, raw in items:
+        seq = total
+        total += 1
+
+        try:
+            event = EventCreate.model_validate(raw)
+        except ValidationError as e:
+            results.append((seq, {"row": ref, "error": _validation_message(e)}))
+            continue
+
+        rows = [session_row(s, None) for s in event.sessions or []]
+        batch.append((seq, ref, event.model_dump(mode="json", exclude=NEW_EVENT_EXCLUDE), rows))
+
+        if len(batch) >= chunk_size:
+            await flush()
+
+    await flush()
+
+    elapsed = time.perf_counter() - started
+
+    return {
+        "total": total,
+        "created": created,
+        "failed": total - created,
+        "sessions_created": sessions_total,
+        "elapsed_seconds": round(elapsed, 3),
+        "rows_per_second": round(total / elapsed, 1) if elapsed > 0 else None,
+        "results": [r for _, r in sorted(results, key=lambda r: r[0])],
+    }
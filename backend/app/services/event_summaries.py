@@ -0,0 +1,94 @@
+#backend/app/services/event_summaries.py
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from supabase import AsyncClient
+
+# Columns GET /events reads; nothing else is needed to render a list row
+SUMMARY_COLUMNS = (
+    "event_id, event_name, event_description, start_datetime, end_datetime, "
+    "status, created_at, sessions_count, venue, first_session_date, "
+    "last_session_date, speaker_count"
+)
+
+
+def _session_sort_key(s: dict):
+    return (s["session_date"], s["session_start_time"], s.get("id") or 0)
+
+
+def build_summary(event: dict, sessions: List[dict], building_names: Dict[int, str]) -> dict:
+    """
+    Project an nu_events row plus its nu_event_sessions rows into
+    an nu_event_summaries row.
+    """
+    ordered = sorted(sessions, key=_session_sort_key)
+
+    venue = None
+    for s in ordered:
+        venue = building_names.get(s.get("session_building_id"))
+        if venue:
+            break
+
+    return {
+        "event_id": event["id"],
+        "event_name": event["event_name"],
+        "event_description": event.get("event_description"),
+        "start_datetime": event["start_datetime"],
+        "end_datetime": event["end_datetime"],
+        "status": event["status"],
+        "created_at": event["created_at"],
+        "sessions_count": len(ordered),
+        "venue": venue,
+        "building_ids": sorted({
+            s["session_building_id"] for s in ordered if s.get("session_building_id")
+        }),
+        "first_session_date": ordered[0]["session_date"] if ordered else None,
+        "last_session_date": ordered[-1]["session_date"] if ordered else None,
+        "speaker_count": len({
+            s["session_speaker_id"] for s in ordered if s.get("session_speaker_id")
+        }),
+        "updated_at": datetime.utcnow().isoformat(),
+    }
+
+
+async def _building_names(db: AsyncClient, sessions: List[dict]) -> Dict[int, str]:
+    ids = {s["session_building_id"] for s in sessions if s.get("session_building_id")}
+    if not ids:
+        return {}
+
+    res = await (
+        db
+        .table("nu_buildings")
+        .select("id, building_name")
+        .in_("id", list(ids))
+        .execute()
+    )
+
+    return {b["id"]: b["building_name"] for b in res.data or []}
+
+
+async def save_event_summary(db: AsyncClient, event: dict, sessions: List[dict]) -> dict:
+    """Recompute one event's summary from rows the caller already holds."""
+    summary = build_summary(event, sessions, await _building_names(db, sessions))
+
+    await db.table("nu_event_summaries") \
+        .upsert(summary, on_conflict="event_id") \
+        .execute()
+
+    return summary
+
+
+async def set_summary_status(db: AsyncClient, event_ids: List[int], status: str) -> None:
+    if not event_ids:
+        return
+
+    await db.table("nu_event_summaries") \
+        .update({"status": status, "updated_at": datetime.utcnow().isoformat()}) \
+        .in_("event_id", event_ids) \
+        .execute()
+
+
+async def rebuild_event_summaries(db: AsyncClient) -> Optional[int]:
+    """Recompute every summary server-side (see migrations/001_event_summaries.sql)."""
+    res = await db.rpc("rebuild_event_summaries").execute()
+    return res.data
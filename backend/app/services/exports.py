@@ -0,0 +1,315 @@
+#backend/app/services/exports.py
+import csv
+import io
+from typing import AsyncIterator, Dict, List, Optional, Sequence
+
+from supabase import AsyncClient
+
+from app.core.pagination import keyset_after
+from app.core.xlsxstream import XlsxStream
+from app.services.speakers import speaker_cache
+
+# Rows fetched per query; each page is encoded and sent before the next is read
+EXPORT_PAGE_SIZE = 1000
+
+# Events carry their sessions embedded, so fewer per page
+EVENT_EXPORT_PAGE_SIZE = 200
+
+MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+Rows = AsyncIterator[List[list]]
+
+
+# ======================================================
+# ENCODERS
+# ======================================================
+def _csv_value(value):
+    # Keep spreadsheet apps from evaluating user-entered text as a formula
+    if isinstance(value, str) and value[:1] in ("=", "+", "-", "@"):
+        return "'" + value
+    return value
+
+
+async def csv_stream(columns: Sequence[str], pages: Rows) -> AsyncIterator[bytes]:
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+
+    # BOM so Excel opens the file as UTF-8
+    writer.writerow(columns)
+    yield ("\ufeff" + buf.getvalue()).encode()
+
+    async for rows in pages:
+        buf.seek(0)
+        buf.truncate()
+        writer.writerows([_csv_value(v) for v in row] for row in rows)
+        yield buf.getvalue().encode()
+
+
+async def xlsx_stream(columns: Sequence[str], pages: Rows, sheet: str) -> AsyncIterator[bytes]:
+    xs = XlsxStream(sheet)
+    yield xs.start(columns)
+
+    async for rows in pages:
+        yield xs.rows(rows)
+
+    yield xs.finish()
+
+
+def encode(fmt: str, columns: Sequence[str], pages: Rows, sheet: str) -> AsyncIterator[bytes]:
+    if fmt == "xlsx":
+        return xlsx_stream(columns, pages, sheet)
+    return csv_stream(columns, pages)
+
+
+# ======================================================
+# ATTENDANCE
+# ======================================================
+ATTENDANCE_COLUMNS = [
+    "Event ID", "Session ID", "Session", "Session date",
+    "User ID", "Last name", "First name", "Middle name", "Email",
+    "Checked in at", "Method",
+]
+
+
+async def attendance_sessions(
+    db: AsyncClient,
+    event_id: Optional[int] = None,
+    session_id: Optional[int] = None,
+) -> Dict[int, dict]:
+    """Sessions covered by an attendance export, keyed by id."""
+    query = db.table("nu_event_sessions").select("id, session_event_id, session_topic, session_date")
+
+    if session_id is not None:
+        query = query.eq("id", session_id)
+    else:
+        query = query.eq("session_event_id", event_id)
+
+    res = await query.execute()
+    return {s["id"]: s for s in res.data or []}
+
+
+async def attendance_rows(
+    db: AsyncClient,
+    sessions: Dict[int, dict],
+    event_id: Optional[int] = None,
+    session_id: Optional[int] = None,
+    page_size: int = EXPORT_PAGE_SIZE,
+) -> Rows:
+    """
+    nu_event_attendees for one session (keyset on user_id) or one event
+    (keyset on session_id, user_id), a page at a time.
+    """
+    after = None
+
+    while True:
+        query = (
+            db
+            .table("nu_event_attendees")
+            .select("""
+                session_id,
+                user_id,
+                checked_in_at,
+                checkin_method,
+                nu_users (firstname, middlename, lastname, email)
+            """)
+        )
+
+        if session_id is not None:
+            query = query.eq("session_id", session_id)
+            if after:
+                query = query.gt("user_id", after["user_id"])
+            query = query.order("user_id")
+        else:
+            query = query.eq("event_id", event_id)
+            if after:
+                query = query.or_(keyset_after(
+                    "session_id", after["session_id"], "user_id", after["user_id"], desc=False
+                ))
+            query = query.order("session_id").order("user_id")
+
+        res = await query.limit(page_size).execute()
+        rows = res.data or []
+
+        if rows:
+            page = []
+            for r in rows:
+                s = sessions.get(r["session_id"]) or {}
+                u = r.get("nu_users") or {}
+                page.append([
+                    s.get("session_event_id", event_id),
+                    r["session_id"],
+                    s.get("session_topic"),
+                    s.get("session_date"),
+                    r["user_id"],
+                    u.get("lastname"),
+                    u.get("firstname"),
+                    u.get("middlename"),
+                    u.get("email"),
+                    r.get("checked_in_at"),
+                    r.get("checkin_method"),
+                ])
+            yield page
+
+        if len(rows) < page_size:
+            return
+
+        after = rows[-1]
+
+
+# ======================================================
+# EVENTS WITH SESSIONS
+# ======================================================
+EVENT_COLUMNS = [
+    "Event ID", "Event", "Status", "Starts", "Ends",
+    "Session ID", "Session", "Date", "Start time", "End time",
+    "Speaker", "Building", "Floor", "Room",
+]
+
+
+async def event_rows(
+    db: AsyncClient,
+    status: Optional[str] = None,
+    page_size: int = EVENT_EXPORT_PAGE_SIZE,
+) -> Rows:
+    """One row per session (one per event without sessions), in event id order."""
+    after = 0
+
+    while True:
+        query = (
+            db
+            .table("nu_events")
+            .select("""
+                id,
+                event_name,
+                status,
+                start_datetime,
+                end_datetime,
+                nu_event_sessions (
+                    id,
+                    session_topic,
+                    session_date,
+                    session_start_time,
+                    session_end_time,
+                    session_speaker_id,
+                    nu_rooms (
+                        room_no,
+                        nu_floors (
+                            floor_name,
+                            nu_buildings (building_name)
+                        )
+                    )
+                )
+            """)
+            .gt("id", after)
+        )
+
+        if status:
+            query = query.eq("status", status)
+
+        res = await query.order("id").limit(page_size).execute()
+        events = res.data or []
+
+        speakers = await speaker_cache.resolve(db, (
+            s["session_speaker_id"]
+            for e in events
+            for s in e.get("nu_event_sessions") or []
+            if s.get("session_speaker_id")
+        ))
+
+        page = []
+        for e in events:
+            event_cells = [
+                e["id"], e["event_name"], e["status"], e["start_datetime"], e["end_datetime"],
+            ]
+            sessions = sorted(
+                e.get("nu_event_sessions") or [],
+                key=lambda s: (s.get("session_date") or "", s.get("session_start_time") or ""),
+            )
+
+            if not sessions:
+                page.append(event_cells + [None] * 9)
+
+            for s in sessions:
+                room = s.get("nu_rooms") or {}
+                floor = room.get("nu_floors") or {}
+                building = floor.get("nu_buildings") or {}
+                speaker = speakers.get(s.get("session_speaker_id")) or {}
+                page.append(event_cells + [
+                    s["id"],
+                    s.get("session_topic"),
+                    s.get("session_date"),
+                    s.get("session_start_time"),
+                    s.get("session_end_time"),
+                    speaker.get("name"),
+                    building.get("building_name"),
+                    floor.get("floor_name"),
+                    room.get("room_no"),
+                ])
+
+        if page:
+            yield page
+
+        if len(events) < page_size:
+            return
+
+        after = events[-1]["id"]
+
+
+# ======================================================
+# NOTIFICATION DELIVERY
+# ======================================================
+DELIVERY_COLUMNS = [
+    "Notification ID", "User ID", "Last name", "First name", "Email",
+    "Delivered at", "Read", "Read at",
+]
+
+
+async def delivery_rows(
+    db: AsyncClient,
+    notif_id: int,
+    page_size: int = EXPORT_PAGE_SIZE,
+) -> Rows:
+    """nu_notification_status rows of one notification, keyset on receiver."""
+    after = 0
+
+    while True:
+        res = await (
+            db
+            .table("nu_notification_status")
+            .select("""
+                user_id_receiver,
+                created_at,
+                is_read,
+                read_at,
+                nu_users (firstname, lastname, email)
+            """)
+            .eq("notif_id", notif_id)
+            .gt("user_id_receiver", after)
+            .order("user_id_receiver")
+            .limit(page_size)
+            .execute()
+        )
+        rows = res.data or []
+
+        if rows:
+            yield [
+                [
+                    notif_id,
+                    r["user_id_receiver"],
+                    (r.get("nu_users") or {}).get("lastname"),
+                    (r.get("nu_users") or {}).get("firstname"),
+                    (r.get("nu_users") or {}).get("email"),
+                    r.get("created_at"),
+                    r.get("is_read"),
+                    r.get("read_at"),
+                ]
+                for r in rows
+            ]
+
+        if len(rows) < page_size:
+            return
+
+        after = rows[-1]["user_id_receiver"]
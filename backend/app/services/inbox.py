@@ -0,0 +1,135 @@
+#backend/app/services/inbox.py
+from datetime import datetime
+from typing import Iterable, List, Optional
+
+from supabase import AsyncClient
+
+from app.core.cache import TTLCache
+from app.core.config import UNREAD_COUNT_MAX_USERS, UNREAD_COUNT_TTL_SECONDS
+
+INBOX_COLUMNS = (
+    "id, notif_id, is_read, read_at, "
+    "nu_notifications (title, content, message_type, published_at)"
+)
+
+
+async def count_unread(db: AsyncClient, user_id: int) -> int:
+    res = await (
+        db
+        .table("nu_notification_status")
+        .select("id", count="exact")
+        .eq("user_id_receiver", user_id)
+        .eq("is_read", False)
+        .limit(1)
+        .execute()
+    )
+    return res.count or 0
+
+
+class UnreadCounter:
+    """
+    Per-user unread notification counts held in memory.
+    A user's count is read from the database on first use, then moved by
+    fan-out (+1 per new delivery) and mark-read (-rows updated) instead of
+    being recounted. Entries expire after `ttl` seconds, which bounds drift
+    from writes made by other workers.
+    """
+
+    def __init__(self, ttl: float = UNREAD_COUNT_TTL_SECONDS, maxsize: int = UNREAD_COUNT_MAX_USERS):
+        self._counts = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    async def get(self, db: AsyncClient, user_id: int) -> int:
+        count = self._counts.get(user_id)
+        if count is None:
+            count = await count_unread(db, user_id)
+            self._counts.set(user_id, count)
+        return count
+
+    def add(self, user_ids: Iterable[int], delta: int = 1) -> None:
+        # Users without a live count are skipped: their next get() reads the database
+        for user_id in user_ids:
+            self._counts.update(user_id, lambda n: max(n + delta, 0))
+
+    def set(self, user_id: int, count: int) -> None:
+        self._counts.set(user_id, count)
+
+
+unread_counter = UnreadCounter()
+
+
+# ======================================================
+# INBOX
+# ======================================================
+async def list_inbox(
+    db: AsyncClient,
+    user_id: int,
+    limit: int,
+    after_id: Optional[int] = None,
+    unread_only: bool = False,
+) -> List[dict]:
+    """
+    Deliveries for `user_id`, newest first, keyset-paged on the
+    nu_notification_status id. Fetches limit + 1 rows so callers can
+    tell whether another page exists.
+    """
+    query = (
+        db
+        .table("nu_notification_status")
+        .select(INBOX_COLUMNS)
+        .eq("user_id_receiver", user_id)
+    )
+
+    if unread_only:
+        query = query.eq("is_read", False)
+
+    if after_id is not None:
+        query = query.lt("id", after_id)
+
+    res = await query.order("id", desc=True).limit(limit + 1).execute()
+
+    return res.data or []
+
+
+def inbox_item(row: dict) -> dict:
+    n = row.get("nu_notifications") or {}
+    return {
+        "id": row["notif_id"],
+        "title": n.get("title"),
+        "content": n.get("content"),
+        "message_type": n.get("message_type"),
+        "published_at": n.get("published_at"),
+        "is_read": row["is_read"],
+        "read_at": row["read_at"],
+    }
+
+
+async def mark_read(
+    db: AsyncClient,
+    user_id: int,
+    notification_ids: Optional[List[int]] = None,
+) -> int:
+    """
+    Mark deliveries read; None marks every unread one.
+    Returns how many rows changed and moves the user's counter by that much.
+    """
+    query = (
+        db
+        .table("nu_notification_status")
+        .update({"is_read": True, "read_at": datetime.utcnow().isoformat()})
+        .eq("user_id_receiver", user_id)
+        .eq("is_read", False)
+    )
+
+    if notification_ids is not None:
+        query = query.in_("notif_id", list(dict.fromkeys(notification_ids)))
+
+    res = await query.execute()
+    changed = len(res.data or [])
+
+    if notification_ids is None:
+        # Everything is read now; no need to go back to the database
+        unread_counter.set(user_id, 0)
+    elif changed:
+        unread_counter.add([user_id], -changed)
+
+    return changed
@@ -0,0 +1,129 @@
+#backend/app/services/locations.py
+import asyncio
+import hashlib
+import json
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from supabase import AsyncClient
+
+from app.core.config import LOCATION_TREE_TTL_SECONDS
+from app.core.pagination import fetch_all
+
+
+def _sort_key(column: str):
+    # Same order as .order(column) in PostgREST: NULLs last
+    return lambda row: (row[column] is None, row[column])
+
+
+class LocationSnapshot:
+    """
+    One immutable load of nu_buildings/nu_floors/nu_rooms/nu_places.
+    `tree` is the nested document; the *_by_* maps answer the cascade
+    endpoints in the same shape they always returned.
+    """
+
+    def __init__(self, buildings: List[dict], floors: List[dict], rooms: List[dict], places: List[dict]):
+        self.buildings = [
+            {"id": b["id"], "building_name": b["building_name"]}
+            for b in sorted(buildings, key=_sort_key("building_name"))
+        ]
+
+        self.floors_by_building: Dict[int, List[dict]] = defaultdict(list)
+        for f in sorted(floors, key=_sort_key("floor_name")):
+            self.floors_by_building[f["building_id"]].append(
+                {"id": f["id"], "floor_name": f["floor_name"]}
+            )
+
+        capacity = {r["id"]: r.get("capacity") for r in rooms}
+
+        self.rooms_by_floor: Dict[int, List[dict]] = defaultdict(list)
+        for r in sorted(rooms, key=_sort_key("room_no")):
+            self.rooms_by_floor[r["floor_id"]].append(
+                {"id": r["id"], "room_no": r["room_no"]}
+            )
+
+        self.places_by_room: Dict[int, List[dict]] = defaultdict(list)
+        for p in sorted(places, key=_sort_key("place_name")):
+            self.places_by_room[p["room_id"]].append(
+                {"id": p["id"], "place_name": p["place_name"]}
+            )
+
+        self.tree = [
+            {
+                **b,
+                "floors": [
+                    {
+                        **f,
+                        "rooms": [
+                            {**r, "places": self.places_by_room.get(r["id"], [])}
+                            for r in self.rooms_by_floor.get(f["id"], [])
+                        ],
+                    }
+                    for f in self.floors_by_building.get(b["id"], [])
+                ],
+            }
+            for b in self.buildings
+        ]
+
+        # Every room with its floor and building, in tree order (availability)
+        self.rooms = [
+            {
+                "id": r["id"],
+                "room_no": r["room_no"],
+                "capacity": capacity.get(r["id"]),
+                "floor_id": f["id"],
+                "floor_name": f["floor_name"],
+                "building_id": b["id"],
+                "building_name": b["building_name"],
+            }
+            for b in self.buildings
+            for f in self.floors_by_building.get(b["id"], [])
+            for r in self.rooms_by_floor.get(f["id"], [])
+        ]
+
+        body = json.dumps(self.tree, separators=(",", ":"), sort_keys=True).encode()
+        self.version = hashlib.sha1(body).hexdigest()[:16]
+        self.etag = f'"{self.version}"'
+        self.loaded_at = time.time()
+
+
+class LocationTreeCache:
+    """
+    In-process cache of the whole location hierarchy.
+    Reloaded when older than `ttl` seconds or on invalidate().
+    """
+
+    def __init__(self, ttl: float = LOCATION_TREE_TTL_SECONDS):
+        self.ttl = ttl
+        self._snapshot: Optional[LocationSnapshot] = None
+        self._expires_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def get(self, db: AsyncClient, force: bool = False) -> LocationSnapshot:
+        if not force and self._snapshot and time.monotonic() < self._expires_at:
+            return self._snapshot
+
+        async with self._lock:
+            # Another request may have refreshed while we waited
+            if not force and self._snapshot and time.monotonic() < self._expires_at:
+                return self._snapshot
+
+            buildings, floors, rooms, places = await asyncio.gather(
+                fetch_all(db, "nu_buildings", "id, building_name"),
+                fetch_all(db, "nu_floors", "id, floor_name, building_id"),
+                fetch_all(db, "nu_rooms", "id, room_no, floor_id, capacity"),
+                fetch_all(db, "nu_places", "id, place_name, room_id"),
+            )
+
+            self._snapshot = LocationSnapshot(buildings, floors, rooms, places)
+            self._expires_at = time.monotonic() + self.ttl
+
+            return self._snapshot
+
+    def invalidate(self) -> None:
+        self._expires_at = 0.0
+
+
+location_cache = LocationTreeCache()
@@ -0,0 +1,303 @@
+#backend/app/services/notifications.py
+import asyncio
+import logging
+from datetime import datetime
+from typing import AsyncIterator, Dict, Iterable, List, Optional
+
+from supabase import AsyncClient
+
+from app.core import http_cache
+from app.core.jobs import JobContext, job_runner
+from app.core.pubsub import hub
+from app.core.supabase import get_async_client
+from app.services.inbox import unread_counter
+
+logger = logging.getLogger(__name__)
+
+# Rows per nu_notification_status insert request
+STATUS_INSERT_CHUNK_SIZE = 500
+
+# Distinct recipient ids fetched per notification_target_recipients() call
+RECIPIENT_PAGE_SIZE = 1000
+
+# Notifications fanned out at once by publish_notifications
+PUBLISH_CONCURRENCY = 4
+
+PUBLISH_JOB = "notification_publish"
+
+
+# ======================================================
+# LOAD
+# ======================================================
+async def load_notifications(db: AsyncClient, notification_ids: Iterable[int]) -> Dict[int, dict]:
+    ids = list(dict.fromkeys(notification_ids))
+    if not ids:
+        return {}
+
+    res = await (
+        db
+        .table("nu_notifications")
+        .select(
+            "id, title, content, message_type, target_type, is_active"
+        )
+        .in_("id", ids)
+        .execute()
+    )
+
+    return {n["id"]: n for n in res.data or []}
+
+
+# ======================================================
+# TARGETS
+# ======================================================
+def target_ids(target_type: str, event_ids, session_ids, target_user_ids) -> List[int]:
+    """The payload id list that applies to `target_type` ("all" has none)."""
+    ids = {
+        "event": event_ids,
+        "session": session_ids,
+        "user": target_user_ids,
+    }.get(target_type) or []
+    return list(dict.fromkeys(ids))
+
+
+async def save_targets(db: AsyncClient, notif_id: int, ids: List[int]) -> None:
+    """Store a new notification's targets with one bulk insert."""
+    if ids:
+        await db.table("nu_notification_targets") \
+            .insert([{"notif_id": notif_id, "target_id": t} for t in ids]) \
+            .execute()
+
+
+# ======================================================
+# RECIPIENTS (deduplicated and paged in the database)
+# ======================================================
+async def iter_recipient_pages(
+    db: AsyncClient,
+    notif: dict,
+    after: Optional[int] = None,
+    page_size: int = RECIPIENT_PAGE_SIZE,
+) -> AsyncIterator[List[int]]:
+    """
+    Yield pages of distinct recipient ids in ascending order, starting
+    after `after`. The union over all of the notification's targets,
+    DISTINCT and keyset paging run in the notification_target_recipients()
+    RPC (migrations/006_notification_targets.sql), so every page query is
+    cheap and resumable.
+    """
+    while True:
+        res = await db.rpc("notification_target_recipients", {
+            "p_notif_id": notif["id"],
+            "p_after": after,
+            "p_limit": page_size,
+        }).execute()
+
+        page = [r["user_id"] for r in res.data or []]
+        if page:
+            yield page
+            after = page[-1]
+
+        if len(page) < page_size:
+            return
+
+
+async def iter_recipient_batches(
+    db: AsyncClient,
+    notif: dict,
+    after: Optional[int] = None,
+    size: int = STATUS_INSERT_CHUNK_SIZE,
+) -> AsyncIterator[List[int]]:
+    """Recipient ids re-cut into batches of `size` (the last may be shorter)."""
+    batch: List[int] = []
+
+    async for page in iter_recipient_pages(db, notif, after=after):
+        batch.extend(page)
+        while len(batch) >= size:
+            yield batch[:size]
+            batch = batch[size:]
+
+    if batch:
+        yield batch
+
+
+def push_payload(notif: dict) -> dict:
+    """What /me/notifications/stream sends for a new delivery (InboxItem shape)."""
+    return {
+        "id": notif["id"],
+        "title": notif["title"],
+        "content": notif["content"],
+        "message_type": notif["message_type"],
+        "published_at": datetime.utcnow().isoformat(),
+        "is_read": False,
+        "read_at": None,
+    }
+
+
+async def insert_status_rows(db: AsyncClient, notif: dict, user_ids: List[int]) -> int:
+    """
+    Insert nu_notification_status rows, skipping ones that already exist.
+    Each new row bumps its receiver's unread counter and is pushed to the
+    receiver's live connections. Returns how many rows were new.
+    """
+    res = await db.table("nu_notification_status") \
+        .upsert(
+            [{"notif_id": notif["id"], "user_id_receiver": uid} for uid in user_ids],
+            on_conflict="notif_id,user_id_receiver",
+            ignore_duplicates=True,
+        ) \
+        .execute()
+
+    receivers = [r["user_id_receiver"] for r in res.data or []]
+
+    unread_counter.add(receivers)
+    hub.publish_many(receivers, push_payload(notif))
+
+    return len(receivers)
+
+
+# ======================================================
+# PUBLISH (FAN-OUT)
+# ======================================================
+async def publish_notifications(db: AsyncClient, notification_ids: List[int]) -> dict:
+    published = []
+    skipped = []
+    failed = []
+
+    notifs = await load_notifications(db, notification_ids)
+
+    to_publish = []
+    seen = set()
+
+    for notif_id in notification_ids:
+        notif = notifs.get(notif_id)
+
+        if notif is None:
+            failed.append(notif_id)
+        elif notif["is_active"] or notif_id in seen:
+            skipped.append(notif_id)
+        else:
+            to_publish.append(notif)
+
+        seen.add(notif_id)
+
+    # Bounds both concurrent requests and recipient ids held in memory
+    semaphore = asyncio.Semaphore(PUBLISH_CONCURRENCY)
+
+    async def fan_out(notif: dict) -> bool:
+        async with semaphore:
+            try:
+                async for batch in iter_recipient_batches(db, notif):
+                    await insert_status_rows(db, notif, batch)
+            except Exception as e:
+                # Rows already written are harmless: a retry skips them
+                logger.error(f"Fan-out failed for notification {notif['id']}: {e}")
+                return False
+            return True
+
+    outcomes = await asyncio.gather(*(fan_out(n) for n in to_publish))
+
+    for n, ok in zip(to_publish, outcomes):
+        if ok:
+            published.append(n["id"])
+        else:
+            failed.append(n["id"])
+
+    if published:
+        await db.table("nu_notifications") \
+            .update({
+                "is_active": True,
+                "published_at": datetime.utcnow().isoformat(),
+            }) \
+            .in_("id", published) \
+            .execute()
+
+    return {
+        "published": published,
+        "skipped": skipped,
+        "failed": failed,
+    }
+
+
+# ======================================================
+# BACKGROUND PUBLISH (LARGE FAN-OUTS)
+# ======================================================
+def _job_progress(state: dict, total: int) -> dict:
+    return {
+        "notifications_total": total,
+        "notifications_done": state["index"],
+        "recipients_inserted": state["recipients"],
+    }
+
+
+async def run_publish_job(ctx: JobContext) -> dict:
+    """
+    Fan-out for POST /notifications/publish with background=true.
+    The checkpoint records the current notification and the last
+    recipient inserted, so a restarted job carries on from there.
+    """
+    db = get_async_client()
+    ids: List[int] = ctx.params["notification_ids"]
+
+    state = {
+        "index": 0,
+        "current": None,
+        "after": None,
+        "recipients": 0,
+        "published": [],
+        "skipped": [],
+        "failed": [],
+        **ctx.checkpoint,
+    }
+
+    notifs = await load_notifications(db, ids)
+
+    while state["index"] < len(ids):
+        notif_id = ids[state["index"]]
+        notif = notifs.get(notif_id)
+        resuming = state["current"] == notif_id
+
+        if notif is None:
+            state["failed"].append(notif_id)
+
+        elif notif_id in state["published"] or notif_id in state["skipped"]:
+            state["skipped"].append(notif_id)
+
+        elif notif["is_active"] and not resuming:
+            state["skipped"].append(notif_id)
+
+        else:
+            state["current"] = notif_id
+
+            if not notif["is_active"]:
+                async for batch in iter_recipient_batches(db, notif, after=state["after"]):
+                    inserted = await insert_status_rows(db, notif, batch)
+
+                    state["after"] = batch[-1]
+                    # Rows left by an interrupted run come back as duplicates
+                    state["recipients"] += inserted
+                    await ctx.save(checkpoint=dict(state), progress=_job_progress(state, len(ids)))
+
+                await db.table("nu_notifications") \
+                    .update({
+                        "is_active": True,
+                        "published_at": datetime.utcnow().isoformat(),
+                    }) \
+                    .eq("id", notif_id) \
+                    .execute()
+
+                http_cache.bump("notifications")
+
+            state["published"].append(notif_id)
+
+        state["index"] += 1
+        state["current"] = None
+        state["after"] = None
+        await ctx.save(checkpoint=dict(state), progress=_job_progress(state, len(ids)))
+
+    return {
+        "published": state["published"],
+        "skipped": state["skipped"],
+        "failed": state["failed"],
+    }
+
+
+job_runner.register(PUBLISH_JOB, run_publish_job)
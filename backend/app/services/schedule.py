@@ -0,0 +1,337 @@
+#backend/app/services/schedule.py
+import asyncio
+import bisect
+import logging
+import time
+from datetime import date, time as dtime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from supabase import AsyncClient
+
+from app.core.config import SCHEDULE_INDEX_TTL_SECONDS
+from app.core.pagination import fetch_all
+
+logger = logging.getLogger(__name__)
+
+SCHEDULE_COLUMNS = (
+    "id, session_event_id, session_room_id, session_speaker_id, "
+    "session_date, session_start_time, session_end_time, nu_events (status)"
+)
+
+# (resource kind, resource id, ISO date)
+Key = Tuple[str, int, str]
+
+# Room occupancy bitmaps: bit i is the i-th slot of the day
+OCCUPANCY_SLOT_MINUTES = 15
+SLOTS_PER_DAY = 24 * 60 // OCCUPANCY_SLOT_MINUTES
+
+
+def _seconds(value) -> int:
+    if isinstance(value, str):
+        value = dtime.fromisoformat(value)
+    return value.hour * 3600 + value.minute * 60 + value.second
+
+
+def _day(value) -> str:
+    return value.isoformat() if isinstance(value, date) else str(value)[:10]
+
+
+def slot_mask(start: int, end: int) -> int:
+    """Bits of every slot that [start, end) seconds touches."""
+    slot = OCCUPANCY_SLOT_MINUTES * 60
+    first = start // slot
+    last = min(-(-end // slot), SLOTS_PER_DAY)
+    return ((1 << (last - first)) - 1) << first if last > first else 0
+
+
+class Booking:
+    __slots__ = ("start", "end", "session_id", "event_id", "ref")
+
+    def __init__(self, start: int, end: int, session_id: Optional[int], event_id: Optional[int], ref=None):
+        self.start = start
+        self.end = end
+        self.session_id = session_id
+        self.event_id = event_id
+        # Position in the payload being validated, for bookings not yet saved
+        self.ref = ref
+
+    def describe(self) -> dict:
+        out = {
+            "start_time": f"{self.start // 3600:02d}:{self.start // 60 % 60:02d}",
+            "end_time": f"{self.end // 3600:02d}:{self.end // 60 % 60:02d}",
+        }
+        if self.ref is not None:
+            out["payload_index"] = self.ref
+        else:
+            out["session_id"] = self.session_id
+            out["event_id"] = self.event_id
+        return out
+
+
+class _Slots:
+    """
+    Bookings of one room or speaker on one day, sorted by start.
+    A lookup bisects on start and walks back no further than the longest
+    booking could reach, so it touches O(log n + overlaps) entries.
+    """
+
+    __slots__ = ("starts", "items", "longest", "mask")
+
+    def __init__(self):
+        self.starts: List[int] = []
+        self.items: List[Booking] = []
+        self.longest = 0
+        # Occupied slots of the day, as a bitmap
+        self.mask = 0
+
+    def add(self, b: Booking) -> None:
+        i = bisect.bisect_right(self.starts, b.start)
+        self.starts.insert(i, b.start)
+        self.items.insert(i, b)
+        self.longest = max(self.longest, b.end - b.start)
+        self.mask |= slot_mask(b.start, b.end)
+
+    def remove(self, b: Booking) -> None:
+        i = bisect.bisect_left(self.starts, b.start)
+        while i < len(self.items) and self.starts[i] == b.start:
+            if self.items[i] is b:
+                del self.starts[i]
+                del self.items[i]
+                # Other bookings may share slots with this one
+                self.mask = 0
+                for other in self.items:
+                    self.mask |= slot_mask(other.start, other.end)
+                return
+            i += 1
+
+    def overlapping(self, start: int, end: int) -> List[Booking]:
+        found = []
+        i = bisect.bisect_left(self.starts, end) - 1
+        while i >= 0 and self.starts[i] + self.longest > start:
+            b = self.items[i]
+            if b.end > start:
+                found.append(b)
+            i -= 1
+        return found
+
+
+def _bookings(row: dict, ref=None) -> List[Tuple[Key, Booking]]:
+    """Room and speaker keys of one session row (DB row or session_row())."""
+    start = _seconds(row["session_start_time"])
+    end = _seconds(row["session_end_time"])
+    if end <= start:
+        return []
+
+    booking = Booking(start, end, row.get("id"), row.get("session_event_id"), ref)
+    day = _day(row["session_date"])
+
+    keys = []
+    if row.get("session_room_id") is not None:
+        keys.append((("room", row["session_room_id"], day), booking))
+    if row.get("session_speaker_id") is not None:
+        keys.append((("speaker", row["session_speaker_id"], day), booking))
+    return keys
+
+
+class ScheduleIndex:
+    """
+    In-memory interval index of session bookings per (room, day) and
+    (speaker, day), covering every non-archived event. Loaded on startup
+    and reloaded after `ttl` seconds so other workers' writes show up;
+    this worker's writes update it in place.
+
+    Callers that save bookings hold booking() from the conflict check until
+    replace_event(), so two overlapping requests in this worker can't both
+    pass. Requests on other workers are only seen after the next reload.
+    """
+
+    def __init__(self, ttl: float = SCHEDULE_INDEX_TTL_SECONDS):
+        self.ttl = ttl
+        self._slots: Dict[Key, _Slots] = {}
+        self._by_event: Dict[int, List[Tuple[Key, Booking]]] = {}
+        # day -> room id -> bookings, for availability over many rooms
+        self._rooms_by_day: Dict[str, Dict[int, _Slots]] = {}
+        self._expires_at = 0.0
+        self._lock = asyncio.Lock()
+        self._booking = asyncio.Lock()
+        # Writes made while a reload is fetching, replayed onto the fresh data
+        self._journal: Optional[List[Tuple[str, tuple]]] = None
+
+    # --------------------------------------------------
+    # Loading
+    # --------------------------------------------------
+    async def ensure(self, db: AsyncClient) -> None:
+        if time.monotonic() < self._expires_at:
+            return
+
+        async with self._lock:
+            # Another request may have reloaded while we waited
+            if time.monotonic() < self._expires_at:
+                return
+
+            # Writes that land while the fetch runs may be missing from its
+            # rows; they are journaled and replayed so the swap keeps them
+            self._journal = []
+            try:
+                rows = await fetch_all(db, "nu_event_sessions", SCHEDULE_COLUMNS)
+            finally:
+                journal, self._journal = self._journal, None
+
+            # No await from here on: build, replay and swap happen at once
+            # for every other request on this loop
+            self._slots = {}
+            self._by_event = {}
+            self._rooms_by_day = {}
+            by_event: Dict[int, List[dict]] = {}
+            for r in rows:
+                if (r.get("nu_events") or {}).get("status") != "archived":
+                    by_event.setdefault(r["session_event_id"], []).append(r)
+
+            for event_id, sessions in by_event.items():
+                self._replace(event_id, sessions)
+
+            for op, args in journal:
+                getattr(self, op)(*args)
+
+            self._expires_at = time.monotonic() + self.ttl
+            logger.info(f"Schedule index loaded: {len(rows)} sessions, {len(self._slots)} room/speaker days")
+
+    def invalidate(self) -> None:
+        self._expires_at = 0.0
+
+    def booking(self) -> asyncio.Lock:
+        """Serializes check-then-save of bookings (`async with index.booking():`)."""
+        return self._booking
+
+    # --------------------------------------------------
+    # Writes (call after the database write succeeded)
+    # --------------------------------------------------
+    def replace_event(self, event_id: int, sessions: Iterable[dict]) -> None:
+        sessions = list(sessions)
+        if self._journal is not None:
+            self._journal.append(("_replace", (event_id, sessions)))
+        self._replace(event_id, sessions)
+
+    def remove_events(self, event_ids: Iterable[int]) -> None:
+        event_ids = list(event_ids)
+        if self._journal is not None:
+            self._journal.append(("_remove", (event_ids,)))
+        self._remove(event_ids)
+
+    def _replace(self, event_id: int, sessions: List[dict]) -> None:
+        self._remove([event_id])
+
+        entries = []
+        for row in sessions:
+            for key, booking in _bookings({**row, "session_event_id": event_id}):
+                slots = self._slots.get(key)
+                if slots is None:
+                    slots = self._slots[key] = _Slots()
+                    kind, resource_id, day = key
+                    if kind == "room":
+                        self._rooms_by_day.setdefault(day, {})[resource_id] = slots
+                slots.add(booking)
+                entries.append((key, booking))
+
+        if entries:
+            self._by_event[event_id] = entries
+
+    def _remove(self, event_ids: List[int]) -> None:
+        for event_id in event_ids:
+            for key, booking in self._by_event.pop(event_id, []):
+                slots = self._slots.get(key)
+                if slots is None:
+                    continue
+                slots.remove(booking)
+                if not slots.items:
+                    del self._slots[key]
+                    kind, resource_id, day = key
+                    if kind == "room":
+                        rooms = self._rooms_by_day[day]
+                        del rooms[resource_id]
+                        if not rooms:
+                            del self._rooms_by_day[day]
+
+    # --------------------------------------------------
+    # Checks
+    # --------------------------------------------------
+    def conflicts(
+        self,
+        sessions: List[dict],
+        event_id: Optional[int] = None,
+        pending: Optional[Dict[Key, _Slots]] = None,
+    ) -> List[dict]:
+        """
+        Overlaps of `sessions` (session_row() dicts from one payload) with
+        saved bookings and with each other. Bookings of `event_id` itself
+        are ignored, since saving replaces them.
+
+        `pending` holds bookings accepted earlier in the same request but
+        not saved yet (see hold()); a bulk import checks each event against
+        the ones before it. Those report payload_index as [ref, i].
+        """
+        found = []
+        own: Dict[Key, _Slots] = {}
+
+        for i, row in enumerate(sessions):
+            for key, booking in _bookings(row, ref=i):
+                kind, resource_id, day = key
+                saved = self._slots.get(key)
+                clashes = [
+                    b for b in (saved.overlapping(booking.start, booking.end) if saved else [])
+                    if event_id is None or b.event_id != event_id
+                ]
+                for overlay in (pending or {}, own):
+                    if key in overlay:
+                        clashes += overlay[key].overlapping(booking.start, booking.end)
+
+                if clashes:
+                    times = booking.describe()
+                    for other in clashes:
+                        found.append({
+                            "payload_index": i,
+                            "type": kind,
+                            f"{kind}_id": resource_id,
+                            "date": day,
+                            "start_time": times["start_time"],
+                            "end_time": times["end_time"],
+                            "conflicts_with": other.describe(),
+                        })
+
+                own.setdefault(key, _Slots()).add(booking)
+
+        return found
+
+    @staticmethod
+    def hold(pending: Dict[Key, _Slots], sessions: List[dict], ref) -> None:
+        """Add an accepted payload's bookings to a `pending` overlay."""
+        for i, row in enumerate(sessions):
+            for key, booking in _bookings(row, ref=[ref, i]):
+                pending.setdefault(key, _Slots()).add(booking)
+
+    # --------------------------------------------------
+    # Room availability
+    # --------------------------------------------------
+    def free_rooms(self, day: str, start: int, end: int, room_ids: Iterable[int]) -> List[int]:
+        """Rooms with no booking in any slot [start, end) seconds touches."""
+        window = slot_mask(start, end)
+        occupied = self._rooms_by_day.get(day, {})
+        return [
+            room_id for room_id in room_ids
+            if room_id not in occupied or not occupied[room_id].mask & window
+        ]
+
+    def room_day(self, day: str, room_id: int) -> Tuple[int, List[Booking]]:
+        """(occupancy bitmap, bookings) of one room on one day."""
+        slots = self._rooms_by_day.get(day, {}).get(room_id)
+        return (slots.mask, list(slots.items)) if slots else (0, [])
+
+    def stats(self) -> dict:
+        return {
+            "events": len(self._by_event),
+            "keys": len(self._slots),
+            "bookings": sum(len(s.items) for s in self._slots.values()),
+        }
+
+
+schedule_index = ScheduleIndex()
@@ -0,0 +1,127 @@
+#backend/app/services/sessions.py
+import asyncio
+from typing import Dict, List, Tuple
+
+from fastapi import HTTPException
+from supabase import AsyncClient
+
+from app.api.schemas.events import SessionCreate
+
+# nu_event_sessions columns written from a SessionCreate
+SESSION_FIELDS = (
+    "session_topic",
+    "session_speaker_id",
+    "session_date",
+    "session_start_time",
+    "session_end_time",
+    "session_building_id",
+    "session_floor_id",
+    "session_room_id",
+)
+
+
+def session_row(s: SessionCreate, event_id: int) -> dict:
+    return {
+        "session_event_id": event_id,
+        "session_topic": s.session_topic,
+        "session_speaker_id": s.session_speaker_id,
+        "session_date": s.session_date.isoformat(),
+        "session_start_time": s.session_start_time.isoformat(),
+        "session_end_time": s.session_end_time.isoformat(),
+        "session_building_id": s.session_building_id,
+        "session_floor_id": s.session_floor_id,
+        "session_room_id": s.session_room_id,
+    }
+
+
+def _differs(existing: dict, row: dict) -> bool:
+    return any(
+        str(existing.get(f)) != str(row.get(f))
+        for f in SESSION_FIELDS
+    )
+
+
+async def plan_sessions(
+    db: AsyncClient,
+    event_id: int,
+    sessions: List[SessionCreate],
+) -> Dict[str, list]:
+    """
+    Work out how to bring an event's nu_event_sessions in line with
+    `sessions`, matching by id, without writing anything. Raises 400 for
+    ids that belong to another event, so callers can validate before any
+    write.
+    """
+    existing_res = await (
+        db
+        .table("nu_event_sessions")
+        .select("id, session_event_id, " + ", ".join(SESSION_FIELDS))
+        .eq("session_event_id", event_id)
+        .execute()
+    )
+    existing = {s["id"]: s for s in existing_res.data or []}
+
+    plan: Dict[str, list] = {"unchanged": [], "update": [], "insert": [], "delete": []}
+    kept_ids = set()
+
+    for s in sessions:
+        row = session_row(s, event_id)
+
+        if s.id is None:
+            plan["insert"].append(row)
+            continue
+
+        current = existing.get(s.id)
+        if current is None:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Session {s.id} does not belong to this event"
+            )
+
+        kept_ids.add(s.id)
+
+        if _differs(current, row):
+            plan["update"].append({"id": s.id, **row})
+        else:
+            plan["unchanged"].append(current)
+
+    plan["delete"] = [sid for sid in existing if sid not in kept_ids]
+    return plan
+
+
+async def reconcile_sessions(
+    db: AsyncClient,
+    plan: Dict[str, list],
+) -> Tuple[List[dict], Dict[str, int]]:
+    """
+    Apply a plan_sessions() plan. Unchanged rows are not touched, so session
+    ids (and the attendees and notifications keyed on them) survive an edit.
+    Returns the resulting session rows and inserted/updated/deleted counts.
+    """
+    to_update, to_insert, to_delete = plan["update"], plan["insert"], plan["delete"]
+
+    async def update():
+        if not to_update:
+            return []
+        res = await db.table("nu_event_sessions").upsert(to_update, on_conflict="id").execute()
+        return res.data or []
+
+    async def insert():
+        if not to_insert:
+            return []
+        res = await db.table("nu_event_sessions").insert(to_insert).execute()
+        return res.data or []
+
+    async def delete():
+        if to_delete:
+            await db.table("nu_event_sessions").delete().in_("id", to_delete).execute()
+
+    updated, inserted, _ = await asyncio.gather(update(), insert(), delete())
+
+    counts = {
+        "inserted": len(to_insert),
+        "updated": len(to_update),
+        "deleted": len(to_delete),
+    }
+
+    return plan["unchanged"] + updated + inserted, counts
@@ -0,0 +1,85 @@
+#backend/app/services/speakers.py
+import asyncio
+import time
+from typing import Dict, Iterable, List, Optional
+
+from supabase import AsyncClient
+
+from app.core.config import SPEAKER_CACHE_TTL_SECONDS
+from app.core.pagination import fetch_all
+
+SPEAKER_COLUMNS = "id, firstname, middlename, lastname, ext, email"
+
+
+def speaker_ref(u: dict) -> dict:
+    """The {id, name, email} shape embedded in event sessions."""
+    return {
+        "id": u["id"],
+        "name": f'{u.get("firstname") or ""} {u.get("lastname") or ""}'.strip(),
+        "email": u.get("email"),
+    }
+
+
+class SpeakerCache:
+    """
+    In-process copy of the users eligible to be speakers (role = 1).
+    Reloaded when older than `ttl` seconds or on invalidate().
+    """
+
+    def __init__(self, ttl: float = SPEAKER_CACHE_TTL_SECONDS):
+        self.ttl = ttl
+        self._rows: Optional[List[dict]] = None
+        self._by_id: Dict[int, dict] = {}
+        self._expires_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def all(self, db: AsyncClient) -> List[dict]:
+        if self._rows is not None and time.monotonic() < self._expires_at:
+            return self._rows
+
+        async with self._lock:
+            # Another request may have refreshed while we waited
+            if self._rows is not None and time.monotonic() < self._expires_at:
+                return self._rows
+
+            rows = await fetch_all(db, "nu_users", SPEAKER_COLUMNS, eq={"role": 1})
+            # Same order as .order("lastname") in PostgREST: NULLs last
+            rows.sort(key=lambda u: (u["lastname"] is None, u["lastname"]))
+
+            self._rows = rows
+            self._by_id = {u["id"]: u for u in rows}
+            self._expires_at = time.monotonic() + self.ttl
+
+            return self._rows
+
+    async def resolve(self, db: AsyncClient, ids: Iterable[int]) -> Dict[int, dict]:
+        """
+        Map user ids to speaker refs. Ids outside the cached role = 1 set
+        (e.g. a speaker whose role changed) are looked up directly.
+        """
+        ids = set(ids)
+        if not ids:
+            return {}
+
+        await self.all(db)
+
+        found = {i: speaker_ref(self._by_id[i]) for i in ids if i in self._by_id}
+        missing = ids - found.keys()
+
+        if missing:
+            res = await (
+                db
+                .table("nu_users")
+                .select("id, firstname, lastname, email")
+                .in_("id", list(missing))
+                .execute()
+            )
+            found.update({u["id"]: speaker_ref(u) for u in res.data or []})
+
+        return found
+
+    def invalidate(self) -> None:
+        self._expires_at = 0.0
+
+
+speaker_cache = SpeakerCache()
@@ -0,0 +1,87 @@
+-- Compact per-event projection read by GET /events.
+-- The API keeps it in sync on create/update/publish/archive;
+-- rebuild_event_summaries() recomputes it from scratch.
+
+create table if not exists nu_event_summaries (
+    event_id            bigint primary key references nu_events (id) on delete cascade,
+    event_name          text not null,
+    event_description   text,
+    start_datetime      timestamptz,
+    end_datetime        timestamptz,
+    status              text not null,
+    created_at          timestamptz not null default now(),
+    sessions_count      integer not null default 0,
+    venue               text,
+    building_ids        bigint[] not null default '{}',
+    first_session_date  date,
+    last_session_date   date,
+    speaker_count       integer not null default 0,
+    updated_at          timestamptz not null default now()
+);
+
+create index if not exists nu_event_summaries_created_idx
+    on nu_event_summaries (created_at desc, event_id desc);
+
+create index if not exists nu_event_summaries_building_ids_idx
+    on nu_event_summaries using gin (building_ids);
+
+create or replace function rebuild_event_summaries()
+returns integer
+language sql
+as $$
+    with agg as (
+        select
+            e.id as event_id,
+            count(s.id)::int as sessions_count,
+            coalesce(
+                array_agg(distinct s.session_building_id)
+                    filter (where s.session_building_id is not null),
+                '{}'
+            ) as building_ids,
+            min(s.session_date) as first_session_date,
+            max(s.session_date) as last_session_date,
+            count(distinct s.session_speaker_id)::int as speaker_count,
+            (
+                select b.building_name
+                from nu_event_sessions s1
+                join nu_buildings b on b.id = s1.session_building_id
+                where s1.session_event_id = e.id
+                order by s1.session_date, s1.session_start_time, s1.id
+                limit 1
+            ) as venue
+        from nu_events e
+        left join nu_event_sessions s on s.session_event_id = e.id
+        group by e.id
+    ),
+    upserted as (
+        insert into nu_event_summaries (
+            event_id, event_name, event_description, start_datetime, end_datetime,
+            status, created_at, sessions_count, venue, building_ids,
+            first_session_date, last_session_date, speaker_count, updated_at
+        )
+        select
+            e.id, e.event_name, e.event_description, e.start_datetime, e.end_datetime,
+            e.status, e.created_at, a.sessions_count, a.venue, a.building_ids,
+            a.first_session_date, a.last_session_date, a.speaker_count, now()
+        from nu_events e
+        join agg a on a.event_id = e.id
+        on conflict (event_id) do update set
+            event_name = excluded.event_name,
+            event_description = excluded.event_description,
+            start_datetime = excluded.start_datetime,
+            end_datetime = excluded.end_datetime,
+            status = excluded.status,
+            created_at = excluded.created_at,
+            sessions_count = excluded.sessions_count,
+            venue = excluded.venue,
+            building_ids = excluded.building_ids,
+            first_session_date = excluded.first_session_date,
+            last_session_date = excluded.last_session_date,
+            speaker_count = excluded.speaker_count,
+            updated_at = now()
+        returning 1
+    )
+    select count(*)::int from upserted;
+$$;
+
+select rebuild_event_summaries();
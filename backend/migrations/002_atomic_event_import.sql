@@ -0,0 +1,132 @@
+-- Atomic event + sessions creation in one round trip.
+-- create_event_with_sessions() backs POST /events; import_events() backs
+-- POST /events/bulk and wraps every event in its own subtransaction, so a
+-- bad row rolls back only itself.
+
+create or replace function refresh_event_summary(p_event_id bigint)
+returns void
+language sql
+as $$
+    insert into nu_event_summaries (
+        event_id, event_name, event_description, start_datetime, end_datetime,
+        status, created_at, sessions_count, venue, building_ids,
+        first_session_date, last_session_date, speaker_count, updated_at
+    )
+    select
+        e.id, e.event_name, e.event_description, e.start_datetime, e.end_datetime,
+        e.status, e.created_at,
+        count(s.id)::int,
+        (
+            select b.building_name
+            from nu_event_sessions s1
+            join nu_buildings b on b.id = s1.session_building_id
+            where s1.session_event_id = e.id
+            order by s1.session_date, s1.session_start_time, s1.id
+            limit 1
+        ),
+        coalesce(
+            array_agg(distinct s.session_building_id)
+                filter (where s.session_building_id is not null),
+            '{}'
+        ),
+        min(s.session_date),
+        max(s.session_date),
+        count(distinct s.session_speaker_id)::int,
+        now()
+    from nu_events e
+    left join nu_event_sessions s on s.session_event_id = e.id
+    where e.id = p_event_id
+    group by e.id
+    on conflict (event_id) do update set
+        event_name = excluded.event_name,
+        event_description = excluded.event_description,
+        start_datetime = excluded.start_datetime,
+        end_datetime = excluded.end_datetime,
+        status = excluded.status,
+        sessions_count = excluded.sessions_count,
+        venue = excluded.venue,
+        building_ids = excluded.building_ids,
+        first_session_date = excluded.first_session_date,
+        last_session_date = excluded.last_session_date,
+        speaker_count = excluded.speaker_count,
+        updated_at = now();
+$$;
+
+create or replace function create_event_with_sessions(p_event jsonb, p_host_user_id bigint)
+returns jsonb
+language plpgsql
+as $$
+declare
+    v_event_id bigint;
+    v_sessions jsonb;
+begin
+    insert into nu_events (
+        event_name, event_description, start_datetime, end_datetime,
+        status, event_host_user_id
+    )
+    values (
+        p_event ->> 'event_name',
+        p_event ->> 'event_description',
+        (p_event ->> 'start_datetime')::timestamptz,
+        (p_event ->> 'end_datetime')::timestamptz,
+        coalesce(p_event ->> 'status', 'draft'),
+        p_host_user_id
+    )
+    returning id into v_event_id;
+
+    with inserted as (
+        insert into nu_event_sessions (
+            session_event_id, session_topic, session_speaker_id, session_date,
+            session_start_time, session_end_time, session_building_id,
+            session_floor_id, session_room_id
+        )
+        select
+            v_event_id,
+            s ->> 'session_topic',
+            (s ->> 'session_speaker_id')::bigint,
+            (s ->> 'session_date')::date,
+            (s ->> 'session_start_time')::time,
+            (s ->> 'session_end_time')::time,
+            (s ->> 'session_building_id')::bigint,
+            (s ->> 'session_floor_id')::bigint,
+            (s ->> 'session_room_id')::bigint
+        from jsonb_array_elements(coalesce(p_event -> 'sessions', '[]'::jsonb)) as s
+        returning *
+    )
+    select coalesce(jsonb_agg(to_jsonb(inserted)), '[]'::jsonb)
+    into v_sessions
+    from inserted;
+
+    perform refresh_event_summary(v_event_id);
+
+    return jsonb_build_object('id', v_event_id, 'sessions', v_sessions);
+end;
+$$;
+
+create or replace function import_events(p_events jsonb, p_host_user_id bigint)
+returns jsonb
+language plpgsql
+as $$
+declare
+    v_item jsonb;
+    v_index int := 0;
+    v_created jsonb;
+    v_results jsonb := '[]'::jsonb;
+begin
+    for v_item in select value from jsonb_array_elements(p_events) loop
+        begin
+            v_created := create_event_with_sessions(v_item, p_host_user_id);
+            v_results := v_results || jsonb_build_array(
+                jsonb_build_object('index', v_index, 'id', v_created -> 'id', 'sessions', v_created -> 'sessions')
+            );
+        exception when others then
+            v_results := v_results || jsonb_build_array(
+                jsonb_build_object('index', v_index, 'error', sqlerrm)
+            );
+        end;
+        v_index := v_index + 1;
+    end loop;
+
+    return v_results;
+end;
+$$;
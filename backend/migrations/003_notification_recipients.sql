@@ -0,0 +1,67 @@
+-- Server-side recipient resolution for notification fan-out.
+-- notification_recipients() returns one page of DISTINCT attendee user ids
+-- after a keyset position, so the API never loads an audience into memory.
+-- The unique key makes re-running a fan-out (retries, resumed jobs) a no-op.
+
+-- Drop duplicate deliveries left by earlier fan-outs before adding the key
+delete from nu_notification_status a
+using nu_notification_status b
+where a.notif_id = b.notif_id
+  and a.user_id_receiver = b.user_id_receiver
+  and a.ctid > b.ctid;
+
+alter table nu_notification_status
+    add constraint nu_notification_status_notif_user_key
+    unique (notif_id, user_id_receiver);
+
+-- Ordered by user_id so DISTINCT + LIMIT stops after one page
+create index if not exists nu_event_attendees_user_idx
+    on nu_event_attendees (user_id);
+
+create index if not exists nu_event_attendees_event_user_idx
+    on nu_event_attendees (event_id, user_id);
+
+create index if not exists nu_event_attendees_session_user_idx
+    on nu_event_attendees (session_id, user_id);
+
+create or replace function notification_recipients(
+    p_target_type text,
+    p_event_id bigint default null,
+    p_session_id bigint default null,
+    p_after bigint default null,
+    p_limit integer default 1000
+)
+returns table (user_id bigint)
+language plpgsql
+stable
+as $$
+begin
+    -- One branch per target type so each uses its own (..., user_id) index
+    if p_target_type = 'all' then
+        return query
+            select distinct a.user_id
+            from nu_event_attendees a
+            where a.user_id > coalesce(p_after, -1)
+            order by a.user_id
+            limit p_limit;
+
+    elsif p_target_type = 'event' then
+        return query
+            select distinct a.user_id
+            from nu_event_attendees a
+            where a.event_id = p_event_id
+              and a.user_id > coalesce(p_after, -1)
+            order by a.user_id
+            limit p_limit;
+
+    elsif p_target_type = 'session' then
+        return query
+            select distinct a.user_id
+            from nu_event_attendees a
+            where a.session_id = p_session_id
+              and a.user_id > coalesce(p_after, -1)
+            order by a.user_id
+            limit p_limit;
+    end if;
+end;
+$$;
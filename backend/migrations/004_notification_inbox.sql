@@ -0,0 +1,15 @@
+-- Per-user inbox reads for /me/notifications.
+-- Read state lives on the delivery row; the indexes serve the keyset-paged
+-- inbox and the unread count the API seeds its in-memory counter from.
+
+alter table nu_notification_status
+    add column if not exists is_read boolean not null default false,
+    add column if not exists read_at timestamptz,
+    add column if not exists created_at timestamptz not null default now();
+
+create index if not exists nu_notification_status_receiver_idx
+    on nu_notification_status (user_id_receiver, id desc);
+
+create index if not exists nu_notification_status_unread_idx
+    on nu_notification_status (user_id_receiver)
+    where not is_read;
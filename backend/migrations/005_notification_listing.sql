@@ -0,0 +1,20 @@
+-- Admin notification listing: keyset index and a lightweight content projection.
+-- content_preview is a PostgREST computed column: select it like a field
+-- (`select=id,title,content_preview`) to get at most 200 characters of the body.
+
+create index if not exists nu_notifications_created_idx
+    on nu_notifications (created_at desc, id desc);
+
+create index if not exists nu_notifications_author_created_idx
+    on nu_notifications (from_admin_user_id, created_at desc, id desc);
+
+create or replace function content_preview(n nu_notifications)
+returns text
+language sql
+immutable
+as $$
+    select case
+        when char_length(n.content) > 200 then left(n.content, 200) || '...'
+        else n.content
+    end
+$$;
@@ -0,0 +1,81 @@
+-- One nu_notifications row per message, with its event/session/user ids in
+-- nu_notification_targets (interpreted by the row's target_type).
+-- Fan-out resolves the union of all targets' recipients in one DISTINCT
+-- pass, so a user in several targeted sessions gets a single delivery.
+
+create table if not exists nu_notification_targets (
+    notif_id    bigint not null references nu_notifications (id) on delete cascade,
+    target_id   bigint not null,
+    primary key (notif_id, target_id)
+);
+
+-- Carry over the single target of rows created before this table existed
+insert into nu_notification_targets (notif_id, target_id)
+select id,
+       case target_type
+           when 'event' then event_id
+           when 'session' then session_id
+           when 'user' then target_user_id
+       end
+from nu_notifications
+where target_type in ('event', 'session', 'user')
+on conflict do nothing;
+
+delete from nu_notification_targets where target_id is null;
+
+-- Page of DISTINCT recipient ids of one notification after a keyset position
+create or replace function notification_target_recipients(
+    p_notif_id bigint,
+    p_after bigint default null,
+    p_limit integer default 1000
+)
+returns table (user_id bigint)
+language plpgsql
+stable
+as $$
+declare
+    v_target_type text;
+begin
+    select n.target_type into v_target_type
+    from nu_notifications n
+    where n.id = p_notif_id;
+
+    if v_target_type = 'all' then
+        return query
+            select distinct a.user_id
+            from nu_event_attendees a
+            where a.user_id > coalesce(p_after, -1)
+            order by a.user_id
+            limit p_limit;
+
+    elsif v_target_type = 'event' then
+        return query
+            select distinct a.user_id
+            from nu_event_attendees a
+            join nu_notification_targets t
+              on t.notif_id = p_notif_id and t.target_id = a.event_id
+            where a.user_id > coalesce(p_after, -1)
+            order by a.user_id
+            limit p_limit;
+
+    elsif v_target_type = 'session' then
+        return query
+            select distinct a.user_id
+            from nu_event_attendees a
+            join nu_notification_targets t
+              on t.notif_id = p_notif_id and t.target_id = a.session_id
+            where a.user_id > coalesce(p_after, -1)
+            order by a.user_id
+            limit p_limit;
+
+    elsif v_target_type = 'user' then
+        return query
+            select t.target_id
+            from nu_notification_targets t
+            where t.notif_id = p_notif_id
+              and t.target_id > coalesce(p_after, -1)
+            order by t.target_id
+            limit p_limit;
+    end if;
+end;
+$$;
@@ -0,0 +1,54 @@
+-- QR/manual check-ins land in nu_event_attendees through the API's
+-- write-behind writer, which inserts with ON CONFLICT DO NOTHING on
+-- (session_id, user_id) so a re-sent batch never double-counts.
+
+-- Nullable first: a default here would stamp every existing row with the
+-- time this migration runs and pile all past attendance onto that day
+alter table nu_event_attendees
+    add column if not exists checked_in_at timestamptz,
+    add column if not exists checkin_method text not null default 'qr';
+
+-- Rows from before check-in times were recorded: assume the attendee
+-- arrived when the session started (sessions are scheduled in Manila time)
+update nu_event_attendees a
+set checked_in_at = (s.session_date + coalesce(s.session_start_time, time '00:00'))
+                    at time zone 'Asia/Manila'
+from nu_event_sessions s
+where s.id = a.session_id
+  and a.checked_in_at is null;
+
+do $$
+declare
+    v_orphans integer;
+begin
+    -- Only rows whose session no longer exists are left without a time
+    update nu_event_attendees set checked_in_at = now() where checked_in_at is null;
+    get diagnostics v_orphans = row_count;
+    if v_orphans > 0 then
+        raise warning 'nu_event_attendees: % rows without a session stamped with now()', v_orphans;
+    end if;
+end;
+$$;
+
+alter table nu_event_attendees
+    alter column checked_in_at set default now(),
+    alter column checked_in_at set not null;
+
+-- Keep the earliest row of any duplicate check-ins before adding the key
+do $$
+declare
+    v_deleted integer;
+begin
+    delete from nu_event_attendees a
+    using nu_event_attendees b
+    where a.session_id = b.session_id
+      and a.user_id = b.user_id
+      and a.ctid > b.ctid;
+    get diagnostics v_deleted = row_count;
+    raise notice 'nu_event_attendees: removed % duplicate check-in rows', v_deleted;
+end;
+$$;
+
+alter table nu_event_attendees
+    add constraint nu_event_attendees_session_user_key
+    unique (session_id, user_id);
@@ -0,0 +1,183 @@
+-- Attendance analytics rollups, maintained incrementally.
+-- Statement-level triggers on nu_event_attendees fold each inserted or
+-- deleted batch (the check-in writer inserts up to CHECKIN_BATCH_SIZE rows
+-- per statement) into per-day, per-session and per-event counters, so the
+-- /analytics endpoints read O(days/sessions) rows, never attendance rows.
+-- Updates that would move a check-in between counters are rejected.
+-- rebuild_attendance_rollups() recomputes everything from scratch.
+
+alter table nu_rooms
+    add column if not exists capacity integer;
+
+create table if not exists nu_attendance_daily (
+    event_id    bigint not null references nu_events (id) on delete cascade,
+    day         date not null,
+    checkins    integer not null default 0,
+    primary key (event_id, day)
+);
+
+create table if not exists nu_session_attendance (
+    session_id  bigint primary key references nu_event_sessions (id) on delete cascade,
+    event_id    bigint not null references nu_events (id) on delete cascade,
+    checkins    integer not null default 0
+);
+
+create index if not exists nu_session_attendance_event_idx
+    on nu_session_attendance (event_id, checkins desc);
+
+create table if not exists nu_event_attendance (
+    event_id    bigint primary key references nu_events (id) on delete cascade,
+    checkins    integer not null default 0,
+    -- Distinct users with at least one check-in to the event
+    attendees   integer not null default 0
+);
+
+-- The (event_id, user_id) lookup below uses nu_event_attendees_event_user_idx
+-- from 003_notification_recipients.sql
+
+-- Check-in days are counted in the venue's time zone
+create or replace function attendance_day(ts timestamptz)
+returns date
+language sql
+immutable
+as $$
+    select (ts at time zone 'Asia/Manila')::date
+$$;
+
+
+-- ------------------------------------------------------
+-- Incremental maintenance
+-- ------------------------------------------------------
+create or replace function attendance_rollup_apply()
+returns trigger
+language plpgsql
+as $$
+declare
+    -- Transition table of this statement and the direction of the change
+    v_delta text := case when tg_op = 'INSERT' then 'new_rows' else 'old_rows' end;
+    v_sign integer := case when tg_op = 'INSERT' then 1 else -1 end;
+begin
+    execute format($q$
+        insert into nu_attendance_daily as t (event_id, day, checkins)
+        select event_id, attendance_day(checked_in_at), $1 * count(*)
+        from %I
+        group by 1, 2
+        on conflict (event_id, day) do update
+            set checkins = greatest(t.checkins + excluded.checkins, 0)
+    $q$, v_delta) using v_sign;
+
+    execute format($q$
+        insert into nu_session_attendance as t (session_id, event_id, checkins)
+        select session_id, event_id, $1 * count(*)
+        from %I
+        group by 1, 2
+        on conflict (session_id) do update
+            set checkins = greatest(t.checkins + excluded.checkins, 0)
+    $q$, v_delta) using v_sign;
+
+    -- A user counts once per event. Only (event, user) pairs with no other
+    -- row left in the table change the distinct count: on insert those are
+    -- first check-ins, on delete the user's last one.
+    execute format($q$
+        insert into nu_event_attendance as t (event_id, checkins, attendees)
+        select
+            d.event_id,
+            $1 * count(*),
+            $1 * count(distinct d.user_id) filter (
+                where not exists (
+                    select 1
+                    from nu_event_attendees a
+                    where a.event_id = d.event_id
+                      and a.user_id = d.user_id
+                      and a.session_id not in (
+                          select d2.session_id
+                          from %1$I d2
+                          where d2.event_id = d.event_id
+                            and d2.user_id = d.user_id
+                      )
+                )
+            )
+        from %1$I d
+        group by d.event_id
+        on conflict (event_id) do update
+            set checkins = greatest(t.checkins + excluded.checkins, 0),
+                attendees = greatest(t.attendees + excluded.attendees, 0)
+    $q$, v_delta) using v_sign;
+
+    return null;
+end;
+$$;
+
+drop trigger if exists nu_event_attendees_rollup_insert on nu_event_attendees;
+create trigger nu_event_attendees_rollup_insert
+    after insert on nu_event_attendees
+    referencing new table as new_rows
+    for each statement execute function attendance_rollup_apply();
+
+drop trigger if exists nu_event_attendees_rollup_delete on nu_event_attendees;
+create trigger nu_event_attendees_rollup_delete
+    after delete on nu_event_attendees
+    referencing old table as old_rows
+    for each statement execute function attendance_rollup_apply();
+
+
+-- Rows are immutable as far as the rollups go: the triggers above only
+-- see inserts and deletes, so changing who, where or when a check-in was
+-- would leave the counters wrong. Correct a check-in by deleting it and
+-- inserting the right one.
+create or replace function attendance_rollup_guard()
+returns trigger
+language plpgsql
+as $$
+begin
+    if (new.session_id, new.event_id, new.user_id, new.checked_in_at)
+       is distinct from
+       (old.session_id, old.event_id, old.user_id, old.checked_in_at) then
+        raise exception 'nu_event_attendees check-ins are immutable; delete and re-insert instead'
+            using errcode = 'check_violation';
+    end if;
+    return new;
+end;
+$$;
+
+drop trigger if exists nu_event_attendees_rollup_guard on nu_event_attendees;
+create trigger nu_event_attendees_rollup_guard
+    before update on nu_event_attendees
+    for each row execute function attendance_rollup_guard();
+
+
+-- ------------------------------------------------------
+-- Full rebuild (python -m scripts.rebuild_analytics)
+-- ------------------------------------------------------
+create or replace function rebuild_attendance_rollups()
+returns integer
+language plpgsql
+as $$
+declare
+    v_rows integer;
+begin
+    delete from nu_attendance_daily;
+    delete from nu_session_attendance;
+    delete from nu_event_attendance;
+
+    insert into nu_attendance_daily (event_id, day, checkins)
+    select event_id, attendance_day(checked_in_at), count(*)
+    from nu_event_attendees
+    group by 1, 2;
+
+    insert into nu_session_attendance (session_id, event_id, checkins)
+    select session_id, event_id, count(*)
+    from nu_event_attendees
+    group by 1, 2;
+
+    insert into nu_event_attendance (event_id, checkins, attendees)
+    select event_id, count(*), count(distinct user_id)
+    from nu_event_attendees
+    group by 1;
+
+    select count(*) into v_rows from nu_event_attendees;
+    return v_rows;
+end;
+$$;
+
+select rebuild_attendance_rollups();
@@ -0,0 +1,6 @@
+-- Keyset order of the per-event attendance export: (session_id, user_id)
+-- within one event. Per-session exports use the (session_id, user_id) key
+-- and notification delivery the (notif_id, user_id_receiver) key.
+
+create index if not exists nu_event_attendees_event_session_user_idx
+    on nu_event_attendees (event_id, session_id, user_id);
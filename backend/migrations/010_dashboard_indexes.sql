@@ -0,0 +1,8 @@
+-- /dashboard/summary reads the newest check-ins and the next sessions;
+-- without these both are a sort over the whole table.
+
+create index if not exists nu_event_attendees_checked_in_idx
+    on nu_event_attendees (checked_in_at desc);
+
+create index if not exists nu_event_sessions_date_idx
+    on nu_event_sessions (session_date, session_start_time);
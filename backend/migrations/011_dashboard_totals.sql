@@ -0,0 +1,27 @@
+-- Dashboard KPIs aggregated server-side. Reading nu_event_summaries or
+-- nu_event_attendance whole and summing in Python is cut short by
+-- PostgREST's max-rows limit once either table outgrows one response.
+
+create or replace function dashboard_event_statuses()
+returns table (status text, events bigint)
+language sql
+stable
+as $$
+    select s.status, count(*)
+    from nu_event_summaries s
+    group by s.status
+$$;
+
+-- attendees counts people, not attendances: nu_event_attendance.attendees
+-- is distinct per event, so summing it counts a regular once per event.
+-- The distinct count walks nu_event_attendees_user_idx (003); the
+-- dashboard caches the result for DASHBOARD_TTL_SECONDS.
+create or replace function dashboard_attendance_totals()
+returns table (checkins bigint, attendees bigint)
+language sql
+stable
+as $$
+    select
+        (select coalesce(sum(a.checkins), 0) from nu_event_attendance a),
+        (select count(distinct u.user_id) from nu_event_attendees u)
+$$;
@@ -0,0 +1,52 @@
+-- Server-side aggregation for /analytics. The rollup tables are small per
+-- event, but reading them whole across all events and folding in Python
+-- is cut short by PostgREST's max-rows limit once they grow.
+
+-- Check-ins per day, summed over events (or one event)
+create or replace function attendance_daily_totals(
+    p_event_id bigint default null,
+    p_from date default null,
+    p_to date default null
+)
+returns table (day date, checkins bigint)
+language sql
+stable
+as $$
+    select d.day, sum(d.checkins)
+    from nu_attendance_daily d
+    where (p_event_id is null or d.event_id = p_event_id)
+      and (p_from is null or d.day >= p_from)
+      and (p_to is null or d.day <= p_to)
+    group by d.day
+    order by d.day
+$$;
+
+-- Seats per event: nu_rooms.capacity summed over its sessions
+-- (null when no session room has a capacity set)
+create or replace function event_room_capacity(p_event_ids bigint[])
+returns table (event_id bigint, capacity bigint)
+language sql
+stable
+as $$
+    select s.session_event_id, sum(r.capacity)
+    from nu_event_sessions s
+    join nu_rooms r on r.id = s.session_room_id
+    where s.session_event_id = any (p_event_ids)
+    group by s.session_event_id
+$$;
+
+-- Speakers ranked by check-ins over their sessions
+create or replace function speaker_reach(p_limit integer default 10)
+returns table (speaker_id bigint, sessions bigint, checkins bigint)
+language sql
+stable
+as $$
+    select s.session_speaker_id, count(*), sum(a.checkins)
+    from nu_session_attendance a
+    join nu_event_sessions s on s.id = a.session_id
+    where a.checkins > 0
+      and s.session_speaker_id is not null
+    group by s.session_speaker_id
+    order by 3 desc
+    limit p_limit
+$$;
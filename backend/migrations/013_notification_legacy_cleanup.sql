@@ -0,0 +1,12 @@
+-- Finish the move to nu_notification_targets (006_notification_targets.sql).
+-- Fan-out goes through notification_target_recipients(), and drafts keep
+-- their audience only in nu_notification_targets, so the single-target
+-- columns and the RPC that read them would otherwise go silently stale.
+-- 006 already copied every row's target into nu_notification_targets.
+
+drop function if exists notification_recipients(text, bigint, bigint, bigint, integer);
+
+alter table nu_notifications
+    drop column if exists event_id,
+    drop column if exists session_id,
+    drop column if exists target_user_id;
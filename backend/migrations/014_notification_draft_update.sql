@@ -0,0 +1,42 @@
+-- Atomic draft edit: the notification's fields and its whole target set
+-- change in one transaction, so a failed target write can't leave new
+-- content pointing at the old (or no) audience. Backs
+-- PUT /notifications/{id}.
+
+create or replace function update_notification_draft(
+    p_notif_id bigint,
+    p_notif jsonb,
+    p_target_ids bigint[]
+)
+returns boolean
+language plpgsql
+as $$
+declare
+    v_found boolean;
+begin
+    -- jsonb_populate_record casts each field to its column's type
+    update nu_notifications n
+    set title = r.title,
+        content = r.content,
+        message_type = r.message_type,
+        target_type = r.target_type
+    from jsonb_populate_record(null::nu_notifications, p_notif) r
+    where n.id = p_notif_id
+      -- Checked again here: it may have been published since the API looked
+      and n.is_active = false;
+
+    v_found := found;
+    if not v_found then
+        return false;
+    end if;
+
+    delete from nu_notification_targets where notif_id = p_notif_id;
+
+    insert into nu_notification_targets (notif_id, target_id)
+    select p_notif_id, t
+    from unnest(coalesce(p_target_ids, '{}')) as t
+    on conflict do nothing;
+
+    return true;
+end;
+$$;
@@ -0,0 +1,80 @@
+"""
+Certificate rendering throughput on synthetic attendees (no database).
+
+Runs the same render + ZIP pipeline as GET /certificates/sessions/{id}
+once in a single process and once on the process pool, and reports
+certificates per second for each.
+
+    cd backend
+    python -m scripts.bench_certificates --attendees 5000
+"""
+import argparse
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from app.core.config import CERTIFICATE_WORKERS
+from app.services import certificates
+
+FIRST = ["Juan", "Maria", "Jose", "Ana", "Miguel", "Andrea", "Paolo", "Nicole"]
+LAST = ["Dela Cruz", "Santos", "Reyes", "Bautista", "Garcia", "Mendoza", "Villanueva"]
+
+CONTEXT = {
+    "session_id": 1,
+    "event_id": 1,
+    "session_topic": "Applied Machine Learning for Campus Operations",
+    "session_date": "March 5, 2026",
+    "event_name": "Research and Innovation Week 2026",
+    "speaker": "Dr. Ramon Aquino",
+}
+
+
+async def synthetic_pages(n: int, page_size: int = certificates.ATTENDEE_PAGE_SIZE):
+    for start in range(1, n + 1, page_size):
+        yield [
+            {
+                "user_id": i,
+                "firstname": FIRST[i % len(FIRST)],
+                "middlename": "Lopez" if i % 3 else None,
+                "lastname": LAST[i % len(LAST)],
+                "ext": "Jr." if i % 11 == 0 else None,
+                "email": f"user{i}@students.national-u.edu.ph",
+            }
+            for i in range(start, min(start + page_size, n + 1))
+        ]
+
+
+async def main(args) -> None:
+    template = certificates.load_template()
+
+    single = await certificates.measure(
+        synthetic_pages(args.attendees), CONTEXT, template, workers=0
+    )
+    print(f"single process : {single['per_second']:>8} certs/s  "
+          f"({single['certificates']} in {single['seconds']}s, zip {single['zip_bytes']} bytes)")
+
+    # Start the workers before timing so spawn cost isn't counted
+    pool = ProcessPoolExecutor(args.workers, mp_context=multiprocessing.get_context("spawn"))
+    await asyncio.gather(*(
+        asyncio.get_running_loop().run_in_executor(pool, certificates.render_batch, template, [])
+        for _ in range(args.workers)
+    ))
+
+    pooled = await certificates.measure(
+        synthetic_pages(args.attendees), CONTEXT, template, executor=pool, workers=args.workers
+    )
+    print(f"{args.workers:>2} processes   : {pooled['per_second']:>8} certs/s  "
+          f"({pooled['certificates']} in {pooled['seconds']}s, zip {pooled['zip_bytes']} bytes)")
+
+    pool.shutdown()
+
+    if single["per_second"]:
+        print(f"speed-up       : {pooled['per_second'] / single['per_second']:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--attendees", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=CERTIFICATE_WORKERS,
+                        help="pool size (CERTIFICATE_WORKERS)")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,126 @@
+"""
+Micro-benchmark of the response pipeline on synthetic payloads shaped
+like the real routes.
+
+Compares FastAPI's default path (jsonable_encoder + stdlib json) with
+the typed response models serialized by pydantic-core and orjson, and
+reports bytes on the wire with gzip and brotli.
+
+    cd backend
+    python -m scripts.bench_responses
+"""
+import gzip
+import json
+import time
+from datetime import date, datetime, time as dtime, timedelta
+from typing import List
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from app.api.schemas.events import EventOut, EventPage
+from app.api.schemas.notifications import NotificationOut
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def list_events_payload(n: int = 100) -> dict:
+    base = datetime(2026, 1, 5, 8, 0)
+    return {
+        "items": [
+            {
+                "id": i,
+                "event_name": f"Research Colloquium {i}",
+                "event_description": "Quarterly research and extension showcase " * 3,
+                "start_datetime": (base + timedelta(days=i)).isoformat(),
+                "end_datetime": (base + timedelta(days=i, hours=8)).isoformat(),
+                "status": "published",
+                "sessions_count": 6,
+                "venue": "Main Building",
+                "first_session_date": (base + timedelta(days=i)).date().isoformat(),
+                "last_session_date": (base + timedelta(days=i + 1)).date().isoformat(),
+                "speaker_count": 4,
+                "created_at": (base - timedelta(days=i)).isoformat(),
+            }
+            for i in range(n)
+        ],
+        "next_cursor": "eyJjcmVhdGVkX2F0IjoiMjAyNi0wMS0wNSIsImlkIjoxMDB9",
+    }
+
+
+def list_notifications_payload(n: int = 500) -> List[dict]:
+    base = datetime(2026, 1, 5, 8, 0)
+    return [
+        {
+            "id": i,
+            "title": f"Reminder #{i}",
+            "content": "Please bring your student ID to the registration desk. " * 30,
+            "target_type": "event",
+            "message_type": "reminder",
+            "is_active": i % 2 == 0,
+            "published_at": (base + timedelta(hours=i)).isoformat() if i % 2 == 0 else None,
+            "created_at": (base + timedelta(hours=i)).isoformat(),
+        }
+        for i in range(n)
+    ]
+
+
+def event_details_payload(sessions: int = 40) -> dict:
+    return {
+        "id": 1,
+        "event_name": "Research Week",
+        "event_description": "Five days of talks and workshops " * 5,
+        "start_datetime": "2026-02-02T08:00:00",
+        "end_datetime": "2026-02-06T17:00:00",
+        "status": "published",
+        "sessions": [
+            {
+                "id": i,
+                "topic": f"Session {i}: Applied Machine Learning",
+                "date": (date(2026, 2, 2) + timedelta(days=i % 5)).isoformat(),
+                "start_time": dtime(8 + i % 8).isoformat(),
+                "end_time": dtime(9 + i % 8).isoformat(),
+                "speaker": {"id": i, "name": f"Speaker {i}", "email": f"s{i}@nu.edu.ph"},
+                "venue": {"building": "Main Building", "floor": "3F", "room": f"30{i % 10}"},
+            }
+            for i in range(sessions)
+        ],
+    }
+
+
+def timeit(fn, repeat: int) -> float:
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def bench(name: str, model, payload, repeat: int = 200) -> None:
+    adapter = TypeAdapter(model)
+
+    def baseline() -> bytes:
+        return json.dumps(jsonable_encoder(payload), ensure_ascii=False).encode()
+
+    def typed() -> bytes:
+        return orjson.dumps(adapter.dump_python(adapter.validate_python(payload), mode="json"))
+
+    body = typed()
+
+    print(f"\n{name}")
+    print(f"  jsonable_encoder + json : {timeit(baseline, repeat):9.1f} us")
+    print(f"  pydantic-core + orjson  : {timeit(typed, repeat):9.1f} us")
+    print(f"  identity                : {len(body):9d} B")
+    print(f"  gzip (level 6)          : {len(gzip.compress(body, 6)):9d} B")
+    if brotli is not None:
+        print(f"  brotli (quality 4)      : {len(brotli.compress(body, quality=4)):9d} B")
+
+
+if __name__ == "__main__":
+    bench("GET /events (100 rows)", EventPage, list_events_payload())
+    bench("GET /notifications (500 rows)", List[NotificationOut], list_notifications_payload())
+    bench("GET /events/{id} (40 sessions)", EventOut, event_details_payload())
@@ -0,0 +1,135 @@
+"""
+Idle-connection load test for GET /api/v1/me/notifications/stream.
+
+Opens N Server-Sent Events connections to a running server with plain
+asyncio sockets (so the client isn't the bottleneck), keeps them idle
+for --hold seconds and reports how many connected, how many heartbeats
+arrived and the live stream count the server reports on /health.
+
+    cd backend
+    PUSH_HEARTBEAT_SECONDS=5 uvicorn app.main:app --workers 1
+    python -m scripts.load_sse --token <access token> --connections 5000
+
+Raise the open-file limit on both sides first (ulimit -n 65536).
+"""
+import argparse
+import asyncio
+import json
+import time
+from urllib.parse import quote, urlsplit
+
+STREAM_PATH = "/api/v1/me/notifications/stream"
+HEALTH_PATH = "/api/v1/health"
+
+
+class Stats:
+    def __init__(self):
+        self.connected = 0
+        self.failed = 0
+        self.heartbeats = 0
+        self.events = 0
+        self.connect_times = []
+        self.errors = {}
+
+    def error(self, e: BaseException) -> None:
+        self.failed += 1
+        key = type(e).__name__
+        self.errors[key] = self.errors.get(key, 0) + 1
+
+
+async def hold_stream(host: str, port: int, token: str, hold: float, stats: Stats) -> None:
+    started = time.perf_counter()
+    try:
+        reader, writer = await asyncio.open_connection(host, port)
+    except OSError as e:
+        stats.error(e)
+        return
+
+    try:
+        writer.write(
+            f"GET {STREAM_PATH}?access_token={quote(token)} HTTP/1.1\r\n"
+            f"Host: {host}:{port}\r\n"
+            "Accept: text/event-stream\r\n"
+            "\r\n".encode()
+        )
+        await writer.drain()
+
+        status_line = await reader.readline()
+        if b" 200 " not in status_line:
+            raise ConnectionError(status_line.decode(errors="replace").strip())
+
+        # Skip response headers
+        while (await reader.readline()) not in (b"\r\n", b""):
+            pass
+
+        stats.connected += 1
+        stats.connect_times.append(time.perf_counter() - started)
+
+        deadline = time.monotonic() + hold
+        while time.monotonic() < deadline:
+            try:
+                line = await asyncio.wait_for(reader.readline(), deadline - time.monotonic())
+            except asyncio.TimeoutError:
+                break
+            if not line:
+                raise ConnectionError("server closed the stream")
+            if b": ping" in line:
+                stats.heartbeats += 1
+            elif line.startswith(b"event:"):
+                stats.events += 1
+    except (OSError, ConnectionError) as e:
+        stats.error(e)
+    finally:
+        writer.close()
+
+
+async def server_streams(host: str, port: int) -> dict:
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(
+        f"GET {HEALTH_PATH} HTTP/1.1\r\nHost: {host}:{port}\r\nConnection: close\r\n\r\n".encode()
+    )
+    raw = await reader.read()
+    writer.close()
+    body = raw.split(b"\r\n\r\n", 1)[1]
+    return json.loads(body).get("push", {})
+
+
+async def main(args) -> None:
+    url = urlsplit(args.url)
+    host, port = url.hostname, url.port or 80
+    stats = Stats()
+
+    print(f"Opening {args.connections} streams to {host}:{port} (ramp {args.ramp}/s) ...")
+    started = time.perf_counter()
+
+    tasks = []
+    for i in range(args.connections):
+        tasks.append(asyncio.create_task(hold_stream(host, port, args.token, args.hold, stats)))
+        if args.ramp and (i + 1) % args.ramp == 0:
+            await asyncio.sleep(1)
+
+    # Sample the server once everything had a chance to connect
+    await asyncio.sleep(min(args.hold / 2, 10))
+    print(f"Client: {stats.connected} connected, {stats.failed} failed "
+          f"after {time.perf_counter() - started:.1f}s")
+    print(f"Server: {await server_streams(host, port)}")
+
+    await asyncio.gather(*tasks)
+
+    times = sorted(stats.connect_times)
+    if times:
+        print(f"Connect p50 {times[len(times) // 2] * 1000:.1f} ms, "
+              f"p99 {times[int(len(times) * 0.99) - 1] * 1000:.1f} ms")
+    print(f"Heartbeats received: {stats.heartbeats}, events: {stats.events}")
+    if stats.errors:
+        print(f"Errors: {stats.errors}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--token", required=True, help="Supabase access token")
+    parser.add_argument("--connections", type=int, default=2000)
+    parser.add_argument("--hold", type=float, default=60, help="seconds to keep streams idle")
+    parser.add_argument("--ramp", type=int, default=500, help="new connections per second (0 = all at once)")
+    asyncio.run(main(parser.parse_args()))
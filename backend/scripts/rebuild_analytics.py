@@ -0,0 +1,29 @@
+"""
+Recompute the attendance rollups (nu_attendance_daily,
+nu_session_attendance, nu_event_attendance) from nu_event_attendees.
+Triggers keep them current; run this after bulk imports done with
+triggers disabled, or if the counters are ever in doubt.
+
+    cd backend
+    python -m scripts.rebuild_analytics
+"""
+import asyncio
+import time
+
+from app.core.supabase import close_async_client, init_async_client
+from app.services.analytics import rebuild_attendance_rollups
+
+
+async def main() -> None:
+    db = await init_async_client()
+    try:
+        started = time.perf_counter()
+        rows = await rebuild_attendance_rollups(db)
+        print(f"Rebuilt attendance rollups from {rows} check-ins "
+              f"in {time.perf_counter() - started:.1f}s")
+    finally:
+        await close_async_client()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,61 @@
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.deps import get_db
+from app.api.routes import locations
+from app.core.compression import CompressionMiddleware
+
+
+@pytest.fixture
+def client(monkeypatch):
+    # Large enough to be compressed, which turns the ETag weak
+    snapshot = SimpleNamespace(
+        version="c380c0251687e013",
+        etag='"c380c0251687e013"',
+        tree=[{"id": i, "building_name": f"Building {i}", "floors": []} for i in range(200)],
+    )
+
+    async def get(db, force=False):
+        return snapshot
+
+    monkeypatch.setattr(locations.location_cache, "get", get)
+
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=500)
+    app.include_router(locations.router)
+    app.dependency_overrides[get_db] = lambda: None
+    return TestClient(app)
+
+
+def test_tree_revalidates_through_compression(client):
+    first = client.get("/locations/tree", headers={"Accept-Encoding": "gzip"})
+    assert first.status_code == 200
+    assert first.headers["content-encoding"] == "gzip"
+
+    etag = first.headers["etag"]
+    assert etag == 'W/"c380c0251687e013"'
+
+    again = client.get(
+        "/locations/tree",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": etag},
+    )
+    assert again.status_code == 304
+
+
+@pytest.mark.parametrize("if_none_match", [
+    '"c380c0251687e013"',
+    '"stale", W/"c380c0251687e013"',
+    "*",
+])
+def test_tree_if_none_match_forms(client, if_none_match):
+    res = client.get("/locations/tree", headers={"If-None-Match": if_none_match})
+    assert res.status_code == 304
+
+
+def test_tree_changed_etag_gets_body(client):
+    res = client.get("/locations/tree", headers={"If-None-Match": '"stale"'})
+    assert res.status_code == 200
+    assert len(res.json()["buildings"]) == 200
@@ -26,7 +26,12 @@ import { Plus, Trash2, CalendarIcon } from "lucide-react";
 import { format } from "date-fns";
 
 import { createEvent, updateEvent } from "@/services/events";
-import { getBuildings, getFloors, getRooms } from "@/services/locations";
+import {
+  getBuildings,
+  getFloors,
+  getRoomAvailability,
+  getRooms,
+} from "@/services/locations";
 import { getSpeakers } from "@/services/users";
 
 /* ================= TYPES ================= */
@@ -60,6 +65,8 @@ interface Speaker {
 }
 
 interface SessionForm {
+  // Set for saved sessions so an edit updates them instead of re-inserting
+  id?: number;
   session_topic?: string;
   session_speaker_id?: number | null;
   session_date?: Date;
@@ -70,6 +77,9 @@ interface SessionForm {
   session_room_id?: string;
   floors?: Floor[];
   rooms?: Room[];
+  // Rooms of the building free for the session's date and times
+  free_room_ids?: number[];
+  availability_key?: string;
 }
 
 /* ================= COMPONENT ================= */
@@ -161,6 +171,7 @@ export function CreateEventModal({
         const room = rooms.find((r) => r.room_no === s.venue?.room);
 
         hydrated.push({
+          id: s.id,
           session_topic: s.session_topic ?? s.topic ?? "",
           session_speaker_id: speakerId,
           session_date: sessionDate,
@@ -232,6 +243,50 @@ export function CreateEventModal({
 
   /* ================= HELPERS ================= */
 
+  const sessionDay = (d: Date) => d.toISOString().split("T")[0];
+
+  const availabilityKey = (s: SessionForm) =>
+    s.session_date &&
+    s.session_building_id &&
+    s.session_start_time &&
+    s.session_end_time > s.session_start_time
+      ? [
+          sessionDay(s.session_date),
+          s.session_start_time,
+          s.session_end_time,
+          s.session_building_id,
+        ].join("|")
+      : undefined;
+
+  // Refresh the room picker's free/booked marks when a session's building,
+  // date or times change
+  useEffect(() => {
+    sessions.forEach((s, i) => {
+      const key = availabilityKey(s);
+      if (key === s.availability_key) return;
+
+      setSessions((prev) => {
+        const copy = [...prev];
+        copy[i] = { ...copy[i], availability_key: key, free_room_ids: undefined };
+        return copy;
+      });
+      if (!key) return;
+
+      const [date, start, end, buildingId] = key.split("|");
+      getRoomAvailability({ date, start, end, buildingId: Number(buildingId) })
+        .then((res) =>
+          setSessions((prev) =>
+            prev.map((p) =>
+              p.availability_key === key
+                ? { ...p, free_room_ids: res.rooms.map((r) => r.id) }
+                : p
+            )
+          )
+        )
+        .catch(console.error);
+    });
+  }, [sessions]);
+
   const buildDateTime = (date: Date, time: string) => {
     const [h, m] = time.split(":").map(Number);
     const d = new Date(date);
@@ -292,11 +347,10 @@ export function CreateEventModal({
       start_datetime: buildDateTime(form.startDate, form.startTime),
       end_datetime: buildDateTime(form.endDate, form.endTime),
       sessions: sessions.map((s) => ({
+        id: s.id,
         session_topic: s.session_topic || null,
         session_speaker_id: s.session_speaker_id ?? null,
-        session_date: s.session_date
-          ? s.session_date.toISOString().split("T")[0]
-          : null,
+        session_date: s.session_date ? sessionDay(s.session_date) : null,
         session_start_time: s.session_start_time,
         session_end_time: s.session_end_time,
         session_building_id: Number(s.session_building_id),
@@ -530,6 +584,9 @@ export function CreateEventModal({
                     {s.rooms?.map((r) => (
                       <SelectItem key={r.id} value={String(r.id)}>
                         {r.room_no}
+                        {s.free_room_ids && !s.free_room_ids.includes(r.id)
+                          ? " (booked)"
+                          : ""}
                       </SelectItem>
                     ))}
                   </SelectContent>
@@ -1,5 +1,6 @@
 import { useEffect, useState } from "react";
 import {
+  getNotification,
   getNotifications,
   publishNotifications,
 } from "@/services/notifications";
@@ -84,8 +85,9 @@ export default function UserNotificationsPanel() {
                 <Button
                   size="sm"
                   variant="outline"
-                  onClick={() => {
-                    setEditingNotification(n);
+                  onClick={async () => {
+                    // The list only carries a content preview
+                    setEditingNotification(await getNotification(n.id));
                     setSheetOpen(true);
                   }}
                 >
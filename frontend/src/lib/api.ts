@@ -34,3 +34,42 @@ export async function apiFetch(endpoint: string, options: RequestInit = {}) {
 
   return response.json();
 }
+
+// Server-Sent Events; EventSource can't send headers, so the token goes in the URL
+export async function apiEventSource(endpoint: string): Promise<EventSource> {
+  const {
+    data: { session },
+  } = await supabase.auth.getSession();
+
+  if (!session?.access_token) {
+    throw new Error("No active session. User is not authenticated.");
+  }
+
+  const sep = endpoint.includes("?") ? "&" : "?";
+  return new EventSource(
+    `${API_BASE_URL}${endpoint}${sep}access_token=${encodeURIComponent(session.access_token)}`
+  );
+}
+
+// Binary downloads (ZIP, CSV, XLSX); the caller saves the Blob
+export async function apiDownload(endpoint: string): Promise<Blob> {
+  const {
+    data: { session },
+  } = await supabase.auth.getSession();
+
+  if (!session?.access_token) {
+    throw new Error("No active session. User is not authenticated.");
+  }
+
+  const response = await fetch(`${API_BASE_URL}${endpoint}`, {
+    headers: { Authorization: `Bearer ${session.access_token}` },
+  });
+
+  if (!response.ok) {
+    const errorData = await response.json();
+    console.error("API ERROR RESPONSE:", errorData);
+    throw errorData;
+  }
+
+  return response.blob();
+}
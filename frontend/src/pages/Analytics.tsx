@@ -35,22 +35,13 @@ import {
   Target,
 } from "lucide-react";
 import { cn } from "@/lib/utils";
-
-const attendanceByDay = [
-  { day: "Day 1", attendance: 892, target: 1000 },
-  { day: "Day 2", attendance: 1024, target: 1000 },
-  { day: "Day 3", attendance: 1156, target: 1000 },
-  { day: "Day 4", attendance: 980, target: 1000 },
-  { day: "Day 5", attendance: 756, target: 800 },
-];
-
-const sessionPopularity = [
-  { session: "Keynote", attendees: 485 },
-  { session: "AI Workshop", attendees: 48 },
-  { session: "Panel", attendees: 156 },
-  { session: "Networking", attendees: 320 },
-  { session: "Closing", attendees: 412 },
-];
+import { useEffect, useState } from "react";
+import {
+  AttendanceDay,
+  SessionPopularity,
+  getAttendanceByDay,
+  getSessionPopularity,
+} from "@/services/analytics";
 
 const feedbackScores = [
   { name: "Content Quality", value: 4.5 },
@@ -81,6 +72,14 @@ const departmentDistribution = [
 ];
 
 export default function Analytics() {
+  const [attendanceByDay, setAttendanceByDay] = useState<AttendanceDay[]>([]);
+  const [sessionPopularity, setSessionPopularity] = useState<SessionPopularity[]>([]);
+
+  useEffect(() => {
+    getAttendanceByDay().then(setAttendanceByDay).catch(console.error);
+    getSessionPopularity({ limit: 5 }).then(setSessionPopularity).catch(console.error);
+  }, []);
+
   return (
     <AdminLayout
       title="Analytics & Reports"
@@ -202,7 +201,6 @@ export default function Analytics() {
                     }}
                   />
                   <Bar dataKey="attendance" fill="hsl(252, 84%, 27%)" radius={[4, 4, 0, 0]} />
-                  <Bar dataKey="target" fill="hsl(45, 100%, 51%)" radius={[4, 4, 0, 0]} />
                 </BarChart>
               </ResponsiveContainer>
             </div>
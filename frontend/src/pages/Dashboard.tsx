@@ -5,6 +5,8 @@ import { AttendanceChart } from "@/components/dashboard/AttendanceChart";
 import { SessionsDonut } from "@/components/dashboard/SessionsDonut";
 import { UpcomingSessions } from "@/components/dashboard/UpcomingSessions";
 import { QuickActions } from "@/components/dashboard/QuickActions";
+import { useEffect, useState } from "react";
+import { getDashboardSummary, DashboardSummary } from "@/services/dashboard";
 import {
   Users,
   Calendar,
@@ -15,6 +17,14 @@ import {
 } from "lucide-react";
 
 export default function Dashboard() {
+  const [summary, setSummary] = useState<DashboardSummary | null>(null);
+
+  useEffect(() => {
+    getDashboardSummary().then(setSummary).catch(console.error);
+  }, []);
+
+  const kpi = (value?: number) => (value === undefined ? "—" : value.toLocaleString());
+
   return (
     <AdminLayout
       title="Dashboard"
@@ -24,24 +34,21 @@ export default function Dashboard() {
       <div className="grid grid-cols-1 sm:grid-cols-2 lg:grid-cols-3 xl:grid-cols-6 gap-4 mb-6">
         <KPICard
           title="Total Attendees"
-          value="1,284"
-          change={{ value: 12, label: "vs last event" }}
+          value={kpi(summary?.kpis.attendees)}
           icon={Users}
           trend="up"
           accentColor="primary"
         />
         <KPICard
           title="Sessions Today"
-          value="12"
-          change={{ value: 3, label: "more than yesterday" }}
+          value={kpi(summary?.kpis.sessions_today)}
           icon={Calendar}
           trend="up"
           accentColor="secondary"
         />
         <KPICard
           title="Check-ins Today"
-          value="892"
-          change={{ value: 8, label: "attendance rate" }}
+          value={kpi(summary?.kpis.checkins_today)}
           icon={ClipboardCheck}
           trend="up"
           accentColor="success"
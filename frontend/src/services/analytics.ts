@@ -0,0 +1,58 @@
+// frontend/src/services/analytics.ts
+import { apiFetch } from "@/lib/api";
+
+export interface AttendanceDay {
+  day: string;
+  attendance: number;
+}
+
+export interface SessionPopularity {
+  session_id: number;
+  event_id: number;
+  session: string | null;
+  date: string | null;
+  attendees: number;
+}
+
+export interface EventCapacity {
+  event_id: number;
+  checkins: number;
+  attendees: number;
+  capacity: number | null;
+  utilization: number | null;
+}
+
+export interface SpeakerReach {
+  speaker: { id: number; name: string | null; email: string | null };
+  sessions: number;
+  checkins: number;
+}
+
+const query = (params: Record<string, string | number | undefined>) => {
+  const search = new URLSearchParams();
+  Object.entries(params).forEach(([key, value]) => {
+    if (value !== undefined) search.set(key, String(value));
+  });
+  const qs = search.toString();
+  return qs ? `?${qs}` : "";
+};
+
+export const getAttendanceByDay = (
+  params: { event_id?: number; date_from?: string; date_to?: string } = {}
+): Promise<AttendanceDay[]> => {
+  return apiFetch(`/api/v1/analytics/attendance-by-day${query(params)}`);
+};
+
+export const getSessionPopularity = (
+  params: { event_id?: number; limit?: number } = {}
+): Promise<SessionPopularity[]> => {
+  return apiFetch(`/api/v1/analytics/session-popularity${query(params)}`);
+};
+
+export const getEventCapacity = (limit = 10): Promise<EventCapacity[]> => {
+  return apiFetch(`/api/v1/analytics/event-capacity${query({ limit })}`);
+};
+
+export const getSpeakerReach = (limit = 10): Promise<SpeakerReach[]> => {
+  return apiFetch(`/api/v1/analytics/speaker-reach${query({ limit })}`);
+};
@@ -0,0 +1,21 @@
+// frontend/src/services/certificates.ts
+import { apiDownload, apiFetch } from "@/lib/api";
+
+export interface CertificateBenchmark {
+  certificates: number;
+  workers: number;
+  seconds: number;
+  per_second: number | null;
+  pdf_bytes: number;
+  zip_bytes: number;
+}
+
+// One PDF per attendee of the session, as a ZIP
+export async function downloadSessionCertificates(sessionId: number): Promise<Blob> {
+  return apiDownload(`/api/v1/certificates/sessions/${sessionId}`);
+}
+
+// Renders everything server-side without sending it; reports throughput
+export async function benchmarkSessionCertificates(sessionId: number): Promise<CertificateBenchmark> {
+  return apiFetch(`/api/v1/certificates/sessions/${sessionId}?dry_run=true`);
+}
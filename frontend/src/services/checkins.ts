@@ -0,0 +1,25 @@
+// frontend/src/services/checkins.ts
+import { apiFetch } from "@/lib/api";
+
+export type CheckinMethod = "qr" | "manual" | "auto";
+
+export interface CheckinResult {
+  session_id: number;
+  user_id: number;
+  status: "accepted" | "duplicate";
+}
+
+export const checkIn = (
+  sessionId: number,
+  userId: number,
+  method: CheckinMethod = "qr"
+): Promise<CheckinResult> => {
+  return apiFetch("/api/v1/checkins", {
+    method: "POST",
+    body: JSON.stringify({ session_id: sessionId, user_id: userId, method }),
+  });
+};
+
+export const getCheckinStats = () => {
+  return apiFetch("/api/v1/checkins/stats");
+};
@@ -0,0 +1,40 @@
+// frontend/src/services/dashboard.ts
+import { apiFetch } from "@/lib/api";
+
+export interface DashboardSummary {
+  kpis: {
+    attendees: number;
+    checkins: number;
+    checkins_today: number;
+    sessions_today: number;
+    active_events: number;
+  };
+  events_by_status: Record<string, number>;
+  attendance: { day: string; attendance: number }[];
+  upcoming_sessions: {
+    id: number;
+    topic: string;
+    event: string | null;
+    date: string;
+    start_time: string | null;
+    end_time: string | null;
+    speaker: { id: number; name: string | null; email: string | null } | null;
+    room: string | null;
+    capacity: number | null;
+    checkins: number;
+  }[];
+  recent_activity: {
+    type: "checkin" | "notification";
+    at: string;
+    user: string | null;
+    target: string | null;
+    detail: string | null;
+  }[];
+  generated_at: string;
+  compute_ms: number;
+}
+
+// Every dashboard widget in one request
+export const getDashboardSummary = (): Promise<DashboardSummary> => {
+  return apiFetch("/api/v1/dashboard/summary");
+};
@@ -7,6 +7,8 @@ import { apiFetch } from "@/lib/api";
  * MUST MATCH backend/app/api/schemas/events.py -> SessionCreate
  */
 export interface SessionCreatePayload {
+  // Existing session id when editing; omit for new sessions
+  id?: number;
   session_topic?: string | null;
   session_speaker_id?: number | null;
 
@@ -59,32 +61,116 @@ export interface EventDetails {
   sessions: EventSessionDetails[];
 }
 
+export interface EventListParams {
+  limit?: number;
+  cursor?: string;
+  status?: string;
+  date_from?: string; // YYYY-MM-DD
+  date_to?: string; // YYYY-MM-DD
+  building_id?: number;
+}
+
+export interface EventPage<T = any> {
+  items: T[];
+  next_cursor: string | null;
+}
+
 /* ========= API CALLS ========= */
 
-export const getEvents = async () => {
-  return await apiFetch("/api/v1/events");
+export const getEventsPage = (params: EventListParams = {}): Promise<EventPage> => {
+  const query = new URLSearchParams();
+  Object.entries(params).forEach(([key, value]) => {
+    if (value !== undefined && value !== null && value !== "") {
+      query.set(key, String(value));
+    }
+  });
+  const qs = query.toString();
+  return apiFetch(`/api/v1/events${qs ? `?${qs}` : ""}`);
+};
+
+// Every event, following next_cursor page by page (the API caps limit at 100)
+export const getEvents = async (params: Omit<EventListParams, "limit" | "cursor"> = {}) => {
+  const items: any[] = [];
+  let cursor: string | undefined;
+
+  do {
+    const page = await getEventsPage({ ...params, limit: 100, cursor });
+    items.push(...page.items);
+    cursor = page.next_cursor ?? undefined;
+  } while (cursor);
+
+  return items;
 };
 
 export const getEventDetails = (eventId: number) => {
   return apiFetch(`/api/v1/events/${eventId}`);
 };
 
-export const createEvent = (payload: EventCreatePayload) => {
-  return apiFetch("/api/v1/events", {
+// A room or speaker booked twice; payload_index points into payload.sessions
+export interface SessionConflict {
+  payload_index: number;
+  type: "room" | "speaker";
+  room_id?: number;
+  speaker_id?: number;
+  date: string;
+  start_time: string;
+  end_time: string;
+  conflicts_with: {
+    start_time: string;
+    end_time: string;
+    session_id?: number;
+    event_id?: number;
+    payload_index?: number;
+  };
+}
+
+// Saves with overlaps fail with 409 ({ detail: { conflicts } }) unless allowConflicts
+export const createEvent = (payload: EventCreatePayload, allowConflicts = false) => {
+  return apiFetch(`/api/v1/events${allowConflicts ? "?allow_conflicts=true" : ""}`, {
     method: "POST",
     body: JSON.stringify(payload),
   });
 };
 
-export const updateEvent = (eventId: number, payload: EventCreatePayload) => {
-  return apiFetch(`/api/v1/events/${eventId}`, {
+export const updateEvent = (eventId: number, payload: EventCreatePayload, allowConflicts = false) => {
+  return apiFetch(`/api/v1/events/${eventId}${allowConflicts ? "?allow_conflicts=true" : ""}`, {
     method: "PUT",
     body: JSON.stringify(payload),
   });
 };
 
+export const checkEventConflicts = (
+  payload: EventCreatePayload,
+  eventId?: number
+): Promise<{ conflicts: SessionConflict[] }> => {
+  return apiFetch(`/api/v1/events/conflicts${eventId ? `?event_id=${eventId}` : ""}`, {
+    method: "POST",
+    body: JSON.stringify(payload),
+  });
+};
+
 export const publishEvent = (eventId: number) => {
   return apiFetch(`/api/v1/events/${eventId}/publish`, {
     method: "PATCH",
   });
 };
+
+export type BulkStatusResult = {
+  status: "published" | "archived";
+  updated: number[];
+  skipped: number[];
+};
+
+export const publishEvents = (eventIds: number[]): Promise<BulkStatusResult> => {
+  return apiFetch("/api/v1/events/publish", {
+    method: "PATCH",
+    body: JSON.stringify({ event_ids: eventIds }),
+  });
+};
+
+export const archiveEvents = (eventIds: number[]): Promise<BulkStatusResult> => {
+  return apiFetch("/api/v1/events/archive", {
+    method: "PATCH",
+    body: JSON.stringify({ event_ids: eventIds }),
+  });
+};
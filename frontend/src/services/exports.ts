@@ -0,0 +1,27 @@
+// frontend/src/services/exports.ts
+import { apiDownload } from "@/lib/api";
+
+export type ExportFormat = "csv" | "xlsx";
+
+export const exportAttendance = (
+  target: { eventId: number } | { sessionId: number },
+  format: ExportFormat = "csv"
+): Promise<Blob> => {
+  const params = new URLSearchParams({ format });
+  if ("eventId" in target) params.set("event_id", String(target.eventId));
+  else params.set("session_id", String(target.sessionId));
+  return apiDownload(`/api/v1/exports/attendance?${params}`);
+};
+
+export const exportEvents = (format: ExportFormat = "csv", status?: string): Promise<Blob> => {
+  const params = new URLSearchParams({ format });
+  if (status) params.set("status", status);
+  return apiDownload(`/api/v1/exports/events?${params}`);
+};
+
+export const exportNotificationDelivery = (
+  notifId: number,
+  format: ExportFormat = "csv"
+): Promise<Blob> => {
+  return apiDownload(`/api/v1/exports/notifications/${notifId}/delivery?format=${format}`);
+};
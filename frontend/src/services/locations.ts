@@ -11,3 +11,34 @@ export const getRooms = (floorId: number) =>
 
 export const getPlaces = (roomId: number) =>
   apiFetch(`/api/v1/locations/rooms/${roomId}/places`);
+
+export const getLocationTree = () =>
+  apiFetch("/api/v1/locations/tree");
+
+export interface AvailableRoom {
+  id: number;
+  room_no: string;
+  capacity: number | null;
+  floor_id: number;
+  floor_name: string;
+  building_id: number;
+  building_name: string;
+}
+
+// Rooms free for the whole window (date: YYYY-MM-DD, start/end: HH:MM)
+export const getRoomAvailability = (params: {
+  date: string;
+  start: string;
+  end: string;
+  buildingId?: number;
+  minCapacity?: number;
+}): Promise<{ slot_minutes: number; checked: number; rooms: AvailableRoom[] }> => {
+  const qs = new URLSearchParams({ date: params.date, start: params.start, end: params.end });
+  if (params.buildingId) qs.set("building_id", String(params.buildingId));
+  if (params.minCapacity) qs.set("min_capacity", String(params.minCapacity));
+  return apiFetch(`/api/v1/locations/availability?${qs}`);
+};
+
+// One "0"/"1" character per slot from 00:00 in `occupancy`
+export const getBuildingDayGrid = (buildingId: number, date: string) =>
+  apiFetch(`/api/v1/locations/buildings/${buildingId}/day-grid?date=${date}`);
@@ -1,17 +1,38 @@
 // frontend/src/services/notifications.ts
-import { apiFetch } from "@/lib/api";
+import { apiEventSource, apiFetch } from "@/lib/api";
 
 export interface Notification {
   id: number;
   title: string;
-  content: string;
+  // Only the first 200 characters in list responses unless content=full
+  content: string | null;
   target_type: string;
   message_type: string;
   is_active: boolean;
+  from_admin_user_id: number | null;
   published_at: string | null;
   created_at: string;
 }
 
+export interface NotificationPage {
+  items: Notification[];
+  next_cursor: string | null;
+  total: number | null;
+}
+
+export interface NotificationListParams {
+  limit?: number;
+  cursor?: string;
+  is_active?: boolean;
+  message_type?: string;
+  target_type?: string;
+  created_from?: string;
+  created_to?: string;
+  author_id?: number;
+  content?: "none" | "preview" | "full";
+  total?: "estimated" | "exact";
+}
+
 export interface CreateNotificationPayload {
   title: string;
   content: string;
@@ -22,8 +43,29 @@ export interface CreateNotificationPayload {
   target_user_ids?: number[];
 }
 
-export const getNotifications = () => {
-  return apiFetch("/api/v1/notifications");
+export const getNotificationsPage = (
+  params: NotificationListParams = {}
+): Promise<NotificationPage> => {
+  const search = new URLSearchParams();
+  Object.entries(params).forEach(([key, value]) => {
+    if (value !== undefined && value !== null && value !== "") {
+      search.set(key, String(value));
+    }
+  });
+
+  const qs = search.toString();
+  return apiFetch(`/api/v1/notifications${qs ? `?${qs}` : ""}`);
+};
+
+// First page only; list views with more rows should page with getNotificationsPage
+export const getNotifications = async (): Promise<Notification[]> => {
+  const page = await getNotificationsPage({ limit: 200 });
+  return page.items;
+};
+
+// Full content, e.g. before editing a draft
+export const getNotification = (notificationId: number): Promise<Notification> => {
+  return apiFetch(`/api/v1/notifications/${notificationId}`);
 };
 
 export const createNotificationDraft = (payload: CreateNotificationPayload) => {
@@ -49,3 +91,70 @@ export const updateNotificationDraft = (
     body: JSON.stringify(payload),
   });
 };
+
+// ======================================================
+// INBOX (current user)
+// ======================================================
+export interface InboxItem {
+  id: number;
+  title: string;
+  content: string | null;
+  message_type: string;
+  published_at: string | null;
+  is_read: boolean;
+  read_at: string | null;
+}
+
+export interface InboxPage {
+  items: InboxItem[];
+  next_cursor: string | null;
+}
+
+export const getMyNotifications = (
+  params: { limit?: number; cursor?: string; unread_only?: boolean } = {}
+): Promise<InboxPage> => {
+  const search = new URLSearchParams();
+  if (params.limit) search.set("limit", String(params.limit));
+  if (params.cursor) search.set("cursor", params.cursor);
+  if (params.unread_only) search.set("unread_only", "true");
+
+  const qs = search.toString();
+  return apiFetch(`/api/v1/me/notifications${qs ? `?${qs}` : ""}`);
+};
+
+export const getUnreadCount = (): Promise<{ unread: number }> => {
+  return apiFetch("/api/v1/me/notifications/unread-count");
+};
+
+export const markNotificationsRead = (notification_ids?: number[]) => {
+  return apiFetch("/api/v1/me/notifications/read", {
+    method: "POST",
+    body: JSON.stringify(
+      notification_ids ? { notification_ids } : { all: true }
+    ),
+  });
+};
+
+export type InboxStreamHandlers = {
+  onNotification: (item: InboxItem) => void;
+  onUnread?: (unread: number) => void;
+  // The connection fell behind: reload the inbox
+  onResync?: () => void;
+};
+
+// Returns a function that closes the stream
+export const subscribeToMyNotifications = async (
+  handlers: InboxStreamHandlers
+): Promise<() => void> => {
+  const source = await apiEventSource("/api/v1/me/notifications/stream");
+
+  source.addEventListener("notification", (e) =>
+    handlers.onNotification(JSON.parse((e as MessageEvent).data))
+  );
+  source.addEventListener("unread", (e) =>
+    handlers.onUnread?.(JSON.parse((e as MessageEvent).data).unread)
+  );
+  source.addEventListener("resync", () => handlers.onResync?.());
+
+  return () => source.close();
+};